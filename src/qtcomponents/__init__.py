@@ -1,3 +1,23 @@
-from . import log, serial
-from .file import FileDialog
-from .plot import MatplotlibWidget
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from ._lazy import attach
+
+# Submodules are imported on first use, see `_lazy.attach`.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    submodules=["log", "serial", "view", "plot", "profiling"],
+    attributes={
+        "FileDialog": ".file",
+        "PreviewFileDialog": ".file",
+        "FileLoader": ".loader",
+        "MatplotlibWidget": ".plot",
+        "StallWatchdog": ".watchdog",
+    },
+)
+
+if TYPE_CHECKING:
+    from . import log, plot, profiling, serial, view
+    from .file import FileDialog, PreviewFileDialog
+    from .loader import FileLoader
+    from .plot import MatplotlibWidget
+    from .watchdog import StallWatchdog
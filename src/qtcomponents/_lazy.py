@@ -0,0 +1,49 @@
+import importlib
+import sys
+from typing import Callable, Dict, Iterable, List, Tuple
+
+
+def attach(
+    package: str,
+    submodules: Iterable[str] = (),
+    attributes: Dict[str, str] | None = None,
+) -> Tuple[Callable[[str], object], Callable[[], List[str]], List[str]]:
+    """
+    Module level lazy loading for a package `__init__`, returning its `__getattr__`, `__dir__` and `__all__`.
+    Submodules and their public names are only imported when first accessed, so importing the package is cheap
+    and, eg: matplotlib is only imported by code that plots. Names keep their import paths.
+
+    Parameters
+    ----------
+    package : str
+        The package's `__name__`.
+    submodules : Iterable[str]
+        Submodules available as attributes, eg: `qtcomponents.serial`.
+    attributes : Dict[str, str]
+        Public name -> relative module defining it, eg: `{"FileDialog": ".file"}`.
+
+    Example
+    ----------
+    __getattr__, __dir__, __all__ = attach(__name__, ["serial"], {"FileDialog": ".file"})
+    """
+    submodules = set(submodules)
+    attributes = dict(attributes or {})
+
+    def __getattr__(name: str) -> object:
+        if name in submodules:
+            return importlib.import_module(f"{package}.{name}")
+        module_name = attributes.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Set on the package, so later lookups don't come through here. The value is bound once,
+        # so defining modules must not rebind their public names at runtime, eg: to wrap them.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    names = sorted(submodules | attributes.keys())
+
+    def __dir__() -> List[str]:
+        return names
+
+    return __getattr__, __dir__, list(names)
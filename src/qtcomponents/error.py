@@ -1,22 +1,301 @@
+import threading
+import time
 import traceback
-from typing import Optional
-from PySide6.QtWidgets import QMessageBox, QWidget
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+
+from PySide6.QtCore import QObject, Qt, QThread, QTimer, Signal
+from PySide6.QtWidgets import (
+    QApplication,
+    QHBoxLayout,
+    QPushButton,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QVBoxLayout,
+    QWidget,
+)
+
+DEFAULT_UPDATE_INTERVAL_MS = 250  # Shortest time between updates of the error centre, however often errors are posted.
+DEFAULT_MAX_ERRORS = 200  # Distinct errors kept, the least recently seen are dropped first.
+
+ErrorKey = Tuple[str, str, Tuple[Tuple[str, int], ...]]
+
+
+def error_key(message: str, exception: Optional[BaseException] = None) -> ErrorKey:
+    """
+    Identity of an error, its message, exception type and traceback locations,
+    so repeats of the same failure are counted together. The traceback is walked, not formatted.
+    """
+    if exception is None:
+        return message, "", ()
+    locations = []
+    tb = exception.__traceback__
+    while tb is not None:
+        locations.append((tb.tb_frame.f_code.co_filename, tb.tb_lineno))
+        tb = tb.tb_next
+    return message, type(exception).__qualname__, tuple(locations)
+
+
+class ErrorEntry:
+    """
+    A distinct error and how often it has been posted. The first exception is kept for its details.
+    """
+
+    def __init__(self, key: ErrorKey, message: str, exception: Optional[BaseException] = None) -> None:
+        self.key = key
+        self.message = message
+        self.exception = exception
+        self.count = 1
+        self.first_seen = time.time()
+        self.last_seen = self.first_seen
+        self._details: Optional[str] = None
+
+    def details(self) -> str:
+        """
+        The formatted traceback, formatted on first use.
+        """
+        if self._details is None:
+            if self.exception is None:
+                self._details = ""
+            else:
+                self._details = "".join(traceback.format_exception(self.exception)).rstrip()
+        return self._details
+
+
+class ErrorCentre(QObject):
+    """
+    Collects errors from any thread and shows them in a non-modal window.
+
+    `post` never blocks, identical errors (same message, exception type and traceback) are counted on one entry,
+    and the window is updated at most every `interval` milliseconds, so an error repeating in a polling loop
+    shows as one line with a rising count rather than a stack of dialogs.
+    The window is shown when a new distinct error arrives, repeats only update its count.
+
+    The window has no parent, so it outlives any one widget. `parent` is only a hint, the window is shown
+    centred over it, see `anchor`.
+    """
+
+    signal_error = Signal(object)  # ErrorEntry, on its first post.
+    signal_updated = Signal(list)  # ErrorEntry's changed since the last update.
+
+    # Posts from any thread, queued to the centre's thread.
+    _signal_posted = Signal()
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        interval: int = DEFAULT_UPDATE_INTERVAL_MS,
+        max_errors: int = DEFAULT_MAX_ERRORS,
+        show_on_error: bool = True,
+    ) -> None:
+        super().__init__()
+        self.max_errors = max_errors
+        self.show_on_error = show_on_error
+        self.posted = 0
+        self.anchor = parent  # Widget the window is centred over when shown, None for the default placement.
+        self._widget: Optional[ErrorCentreWidget] = None
+
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[ErrorKey, ErrorEntry] = OrderedDict()
+        self._changed: Set[ErrorKey] = set()
+        self._new: Set[ErrorKey] = set()
+        self._scheduled = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._publish)
+        self._signal_posted.connect(self._schedule)
+
+    @property
+    def widget(self) -> "ErrorCentreWidget":
+        """
+        The error window, created on first use.
+        """
+        if self._widget is None:
+            self._widget = ErrorCentreWidget(self)
+        return self._widget
+
+    def post(self, message: str, exception: Optional[BaseException] = None) -> None:
+        """
+        Report an error, safe to call from any thread.
+        """
+        key = error_key(message, exception)
+        with self._lock:
+            self.posted += 1
+            entry = self._entries.get(key)
+            if entry is None:
+                self._entries[key] = ErrorEntry(key, message, exception)
+                self._new.add(key)
+                if len(self._entries) > self.max_errors:
+                    dropped, _ = self._entries.popitem(last=False)
+                    self._changed.discard(dropped)
+                    self._new.discard(dropped)
+            else:
+                entry.count += 1
+                entry.last_seen = time.time()
+                self._entries.move_to_end(key)
+            self._changed.add(key)
+            if self._scheduled:
+                return
+            self._scheduled = True
+        try:
+            self._signal_posted.emit()
+        except RuntimeError:
+            # The centre has been deleted.
+            pass
+
+    def entries(self) -> List[ErrorEntry]:
+        """
+        Distinct errors, least recently seen first.
+        """
+        with self._lock:
+            return list(self._entries.values())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._changed.clear()
+            self._new.clear()
+        if self._widget is not None:
+            self._widget.clear()
+
+    def _schedule(self) -> None:
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _publish(self) -> None:
+        with self._lock:
+            changed = [self._entries[key] for key in self._changed if key in self._entries]
+            new = [self._entries[key] for key in self._new if key in self._entries]
+            self._changed.clear()
+            self._new.clear()
+            self._scheduled = False
+        if not changed:
+            return
+
+        for entry in new:
+            self.signal_error.emit(entry)
+        self.signal_updated.emit(changed)
+        if self._widget is not None or (new and self.show_on_error):
+            self.widget.update_entries(changed)
+        if new and self.show_on_error and not self.widget.isVisible():
+            self.show()
+
+    def show(self) -> None:
+        """
+        Show the window, centred over `anchor` if it is set.
+        """
+        widget = self.widget
+        if self.anchor is not None:
+            try:
+                window = self.anchor.window()
+                widget.move(window.frameGeometry().center() - widget.rect().center())
+            except RuntimeError:
+                # The anchor has been deleted.
+                self.anchor = None
+        widget.show()
+        widget.raise_()
+
+
+class ErrorCentreWidget(QWidget):
+    """
+    Non-modal window listing an ErrorCentre's errors with their counts.
+    Tracebacks are formatted when an error is expanded.
+    """
+
+    COLUMNS = ["Count", "Last seen", "Error"]
+
+    def __init__(self, centre: ErrorCentre, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent, Qt.WindowType.Window)
+        self.centre = centre
+        # Left open, it doesn't keep the application running once the main window closes.
+        self.setAttribute(Qt.WidgetAttribute.WA_QuitOnClose, False)
+        self.setWindowTitle("Errors")
+        self.resize(700, 300)
+        self._items: Dict[ErrorKey, QTreeWidgetItem] = {}
+
+        self.tree = QTreeWidget(self)
+        self.tree.setHeaderLabels(self.COLUMNS)
+        self.tree.itemExpanded.connect(self._expand)
+
+        clear = QPushButton("Clear", self)
+        clear.clicked.connect(centre.clear)
+        close = QPushButton("Close", self)
+        close.clicked.connect(self.close)
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        buttons.addWidget(clear)
+        buttons.addWidget(close)
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(self.tree)
+        layout.addLayout(buttons)
+        self.update_entries(centre.entries())
+
+    def update_entries(self, entries: List[ErrorEntry]) -> None:
+        """
+        Add new errors and update the counts of existing ones.
+        """
+        for entry in entries:
+            item = self._items.get(entry.key)
+            if item is None:
+                item = QTreeWidgetItem()
+                item.setData(0, Qt.ItemDataRole.UserRole, entry)
+                item.setText(2, entry.message)
+                if entry.exception is not None:
+                    item.setText(2, f"{entry.message} ({type(entry.exception).__name__}: {entry.exception})")
+                    item.setChildIndicatorPolicy(QTreeWidgetItem.ChildIndicatorPolicy.ShowIndicator)
+                self.tree.insertTopLevelItem(0, item)
+                self._items[entry.key] = item
+            item.setText(0, str(entry.count))
+            item.setText(1, time.strftime("%H:%M:%S", time.localtime(entry.last_seen)))
+        # Errors dropped by the centre.
+        if len(self._items) > self.centre.max_errors:
+            keys = {entry.key for entry in self.centre.entries()}
+            for key in [key for key in self._items if key not in keys]:
+                item = self._items.pop(key)
+                self.tree.takeTopLevelItem(self.tree.indexOfTopLevelItem(item))
+
+    def clear(self) -> None:
+        self.tree.clear()
+        self._items.clear()
+
+    def _expand(self, item: QTreeWidgetItem) -> None:
+        if item.childCount():
+            return
+        entry: ErrorEntry = item.data(0, Qt.ItemDataRole.UserRole)
+        details = QTreeWidgetItem([entry.details()])
+        item.addChild(details)
+        details.setFirstColumnSpanned(True)
+
+
+_shared_centre: Optional[ErrorCentre] = None
+_shared_lock = threading.Lock()
+
+
+def error_centre(parent: Optional[QWidget] = None) -> ErrorCentre:
+    """
+    An ErrorCentre shared by the application, created on first use.
+    `parent` is only a hint, it replaces the centre's `anchor`, the widget its window is shown over.
+    """
+    global _shared_centre
+    with _shared_lock:
+        if _shared_centre is None:
+            _shared_centre = ErrorCentre()
+            app = QApplication.instance()
+            if app is not None and QThread.currentThread() != app.thread():
+                # Created from a worker, it must live on the GUI thread to receive posts.
+                _shared_centre.moveToThread(app.thread())
+        if parent is not None:
+            _shared_centre.anchor = parent
+        return _shared_centre
 
 
 def show_error_dialog(message: str, exception: Optional[Exception] = None, parent: Optional[QWidget] = None) -> None:
     """
-    Helper function to generate an error dialog. Dialog will execute at the end of the function.
-    """
-    dialog = QMessageBox(parent)
-    dialog.setIcon(QMessageBox.Icon.Critical)
-    dialog.setWindowTitle("Error")
-    dialog.setText("An error has occurred.")
-    dialog.setInformativeText(message)
-    
-    if exception is not None:
-        details = traceback.format_exc()
-        dialog.setDetailedText(details)
-    
-    dialog.setStandardButtons(QMessageBox.StandardButton.Ok)
-    dialog.adjustSize()
-    dialog.exec()
\ No newline at end of file
+    Report an error to the shared ErrorCentre, which shows it in a non-modal window.
+    Returns immediately, safe to call from any thread, repeated errors are counted rather than shown again.
+    `parent` is only a hint for where the window is shown, it doesn't own the window.
+    """
+    error_centre(parent).post(message, exception)
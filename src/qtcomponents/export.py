@@ -0,0 +1,235 @@
+import os
+import threading
+from enum import Enum
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import numpy as np
+from numpy.lib import format as npy_format
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+from .table import format_column_block
+
+DEFAULT_EXPORT_BLOCK_ROWS = 65536  # Rows formatted / written per block, and between progress updates.
+
+
+class ExportFormat(Enum):
+    CSV = "csv"
+    NPY = "npy"
+    RAW = "raw"  # Records back to back, as `open_structured_file` reads them.
+
+    @classmethod
+    def from_path(cls, path: Path) -> "ExportFormat":
+        """
+        Format from a file suffix, `.csv`, `.npy`, anything else is raw.
+        """
+        suffix = path.suffix.lower()
+        if suffix == ".csv":
+            return cls.CSV
+        if suffix == ".npy":
+            return cls.NPY
+        return cls.RAW
+
+
+class ExportCancelled(Exception):
+    pass
+
+
+def csv_quote(strings: List[str], delimiter: str = ",") -> List[str]:
+    """
+    Quote values holding the delimiter, a quote or a line break, as the csv module would.
+    Most columns hold none, which is checked with a single scan of the joined column.
+    """
+    specials = (delimiter, '"', "\n", "\r")
+    joined = "".join(strings)
+    if not any(special in joined for special in specials):
+        return strings
+    return [
+        '"' + string.replace('"', '""') + '"' if any(special in string for special in specials) else string
+        for string in strings
+    ]
+
+
+def _csv_block(block: np.ndarray, delimiter: str) -> str:
+    # Each column is formatted in one vectorized call, then rows are joined in C, which is several times
+    # faster than the csv module's writer.
+    columns = []
+    for name in block.dtype.names or ():
+        strings = format_column_block(block[name])
+        if strings is None:
+            strings = [str(value) for value in block[name]]
+        columns.append(csv_quote(strings, delimiter))
+    return "\n".join(map(delimiter.join, zip(*columns))) + "\n"
+
+
+def _write_npy_header(file, dtype: np.dtype, rows: int) -> None:
+    header = {"descr": npy_format.dtype_to_descr(dtype), "fortran_order": False, "shape": (rows,)}
+    try:
+        npy_format.write_array_header_1_0(file, header)
+    except ValueError:
+        # Header too long for version 1.0, eg: thousands of fields.
+        npy_format.write_array_header_2_0(file, header)
+
+
+def export_array(
+    path: Path | str,
+    array: np.ndarray,
+    rows: Optional[np.ndarray] = None,
+    export_format: Optional[ExportFormat] = None,
+    block_rows: int = DEFAULT_EXPORT_BLOCK_ROWS,
+    delimiter: str = ",",
+    progress: Optional[Callable[[int, int], None]] = None,
+    cancelled: Optional[Callable[[], bool]] = None,
+) -> Path:
+    """
+    Write a structured array to a file a block of rows at a time, so memory use is bounded by the block size.
+
+    Parameters
+    ----------
+    path : Path | str
+        File to write. Rows are written to a temporary file beside it, moved into place once complete,
+        so an existing file is left untouched if the export fails or is cancelled.
+    array : np.ndarray
+        Structured array, may be memory mapped.
+    rows : np.ndarray, optional
+        Array rows to write in order, eg: a sorted / filtered view. None writes the whole array.
+    export_format : ExportFormat, optional
+        Defaults to the format of the path suffix.
+    block_rows : int
+        Rows per block.
+    delimiter : str
+        CSV field delimiter, the first line is the field names.
+    progress : Callable[[int, int], None], optional
+        Called with (rows written, total rows) after each block.
+    cancelled : Callable[[], bool], optional
+        Checked before each block, the export raises `ExportCancelled` when it returns True.
+    """
+    path = Path(path)
+    export_format = export_format if export_format is not None else ExportFormat.from_path(path)
+    total = len(array) if rows is None else len(rows)
+    # Same directory, so the rename doesn't cross file systems.
+    temporary = path.with_name(f".{path.name}.{os.getpid()}-{threading.get_ident()}.part")
+
+    if export_format == ExportFormat.CSV:
+        file = open(temporary, "w", encoding="utf-8", newline="")
+    else:
+        file = open(temporary, "wb")
+    try:
+        with file:
+            if export_format == ExportFormat.CSV:
+                file.write(delimiter.join(csv_quote(list(array.dtype.names or ()), delimiter)) + "\n")
+            elif export_format == ExportFormat.NPY:
+                _write_npy_header(file, array.dtype, total)
+
+            for start in range(0, total, block_rows):
+                if cancelled is not None and cancelled():
+                    raise ExportCancelled()
+                if rows is None:
+                    block = array[start : start + block_rows]
+                else:
+                    block = array[rows[start : start + block_rows]]
+
+                if export_format == ExportFormat.CSV:
+                    file.write(_csv_block(block, delimiter))
+                else:
+                    # Slices of a contiguous array are written straight from its buffer, without a copy.
+                    file.write(np.ascontiguousarray(block).data)
+                if progress is not None:
+                    progress(min(start + block_rows, total), total)
+        os.replace(temporary, path)
+    except BaseException:
+        if temporary.exists():
+            os.remove(temporary)
+        raise
+    return path
+
+
+class ArrayExport(QObject):
+    """
+    Runs `export_array` on the thread pool, so exporting millions of rows never blocks the GUI.
+
+    Progress is reported after each block, `cancel` stops the export before the next block
+    and removes the partial file. One export runs at a time per instance.
+    """
+
+    signal_progress = Signal(int, int)
+    signal_finished = Signal(object)
+    signal_failed = Signal(object)
+    signal_cancelled = Signal()
+
+    # Carry state from the worker thread.
+    _signal_progress = Signal(int, int)
+    _signal_done = Signal(object, object)
+
+    def __init__(self, block_rows: int = DEFAULT_EXPORT_BLOCK_ROWS, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.block_rows = block_rows
+        self._running = False
+        self._cancel = threading.Event()
+        self._signal_progress.connect(self.signal_progress)
+        self._signal_done.connect(self._receive_done)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(
+        self,
+        path: Path | str,
+        array: np.ndarray,
+        rows: Optional[np.ndarray] = None,
+        export_format: Optional[ExportFormat] = None,
+        delimiter: str = ",",
+    ) -> None:
+        """
+        Start exporting, see `export_array`. The array must not be modified in place until finished.
+        """
+        if self._running:
+            raise RuntimeError("An export is already running.")
+        self._running = True
+        self._cancel = threading.Event()
+        cancel = self._cancel
+        QThreadPool.globalInstance().start(
+            lambda: self._export(cancel, Path(path), array, rows, export_format, delimiter)
+        )
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def _export(
+        self,
+        cancel: threading.Event,
+        path: Path,
+        array: np.ndarray,
+        rows: Optional[np.ndarray],
+        export_format: Optional[ExportFormat],
+        delimiter: str,
+    ) -> None:
+        # Runs on a pool thread.
+        error = None
+        try:
+            export_array(
+                path,
+                array,
+                rows,
+                export_format,
+                self.block_rows,
+                delimiter,
+                progress=self._signal_progress.emit,
+                cancelled=cancel.is_set,
+            )
+        except Exception as exception:
+            error = exception
+        try:
+            self._signal_done.emit(path, error)
+        except RuntimeError:
+            # The export object was deleted while exporting.
+            pass
+
+    def _receive_done(self, path: Path, error: Optional[Exception]) -> None:
+        self._running = False
+        if isinstance(error, ExportCancelled):
+            self.signal_cancelled.emit()
+        elif error is not None:
+            self.signal_failed.emit(error)
+        else:
+            self.signal_finished.emit(path)
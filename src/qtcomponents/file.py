@@ -1,10 +1,36 @@
+from concurrent.futures import Future
 from enum import Enum
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
-from PySide6.QtWidgets import QFileDialog, QWidget
+from PySide6.QtCore import (
+    QIdentityProxyModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    QSize,
+    Qt,
+)
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import (
+    QFileDialog,
+    QFileSystemModel,
+    QGridLayout,
+    QLabel,
+    QListView,
+    QWidget,
+)
 
-def convert_filter_to_qt(filter: Optional[Dict[str, str]] = None,) -> Tuple[List[str], str]:
+# The loader and thumbnail modules import numpy, so they are imported on use, keeping FileDialog quick to import.
+if TYPE_CHECKING:
+    from .loader import FileLoader
+    from .thumbnail import ThumbnailLoader
+
+THUMBNAIL_ICON_SIZE = 64  # Pixels, thumbnails shown as icons in the preview dialog's file list.
+
+
+def convert_filter_to_qt(
+    filter: Optional[Dict[str, str]] = None,
+) -> Tuple[List[str], str]:
     """
     Converts a filter dict into something Qt can use.
     """
@@ -16,6 +42,129 @@ def convert_filter_to_qt(filter: Optional[Dict[str, str]] = None,) -> Tuple[List
     filter_string = ";; ".join(filter_list)
     return filter_list, filter_string
 
+
+class ThumbnailProxyModel(QIdentityProxyModel):
+    """
+    Proxy for a QFileDialog's file system model, replacing the icons of images and `.npy` files with thumbnails.
+    Thumbnails are only requested as the view asks for icons, so only for rows scrolled into view,
+    and the default icon is shown until the thumbnail is ready.
+    """
+
+    def __init__(self, loader: "ThumbnailLoader", parent=None) -> None:
+        from .thumbnail import thumbnail_suffixes
+
+        super().__init__(parent)
+        self.loader = loader
+        self.suffixes = thumbnail_suffixes()
+        loader.signal_thumbnail.connect(self._thumbnail_ready)
+
+    def file_path(self, index: QModelIndex | QPersistentModelIndex) -> Optional[str]:
+        source = self.sourceModel()
+        if not isinstance(source, QFileSystemModel):
+            return None
+        return source.filePath(self.mapToSource(index))
+
+    def data(self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DecorationRole and index.column() == 0:
+            path = self.file_path(index)
+            if path and Path(path).suffix.lower() in self.suffixes:
+                icon = self.loader.icon(path)
+                if icon is not None:
+                    return icon
+                if not self.loader.has_icon(path):
+                    self.loader.request(path)
+        return super().data(index, role)
+
+    def _thumbnail_ready(self, path: str) -> None:
+        source = self.sourceModel()
+        if not isinstance(source, QFileSystemModel):
+            return
+        source_index = source.index(path)
+        if source_index.isValid():
+            index = self.mapFromSource(source_index)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+
+class PreviewFileDialog(QFileDialog):
+    """
+    A non-native QFileDialog showing thumbnails of images and `.npy` files, as icons in the file list
+    and larger in a preview pane for the current file.
+
+    Thumbnails are made on a thread pool by a `ThumbnailLoader` and kept in its on-disk cache,
+    so browsing a large directory never blocks the dialog, and revisiting it is quick.
+    """
+
+    def __init__(
+        self,
+        parent: Optional[QWidget] = None,
+        caption: str = "",
+        directory: str = "",
+        filter: str = "",
+        loader: Optional["ThumbnailLoader"] = None,
+    ) -> None:
+        from .thumbnail import DEFAULT_THUMBNAIL_SIZE, ThumbnailLoader
+
+        super().__init__(parent, caption, directory, filter)
+        self.setOption(QFileDialog.Option.DontUseNativeDialog, True)
+        self.loader = loader if loader is not None else ThumbnailLoader(parent=self)
+        proxy = ThumbnailProxyModel(self.loader, self)
+        self.suffixes = proxy.suffixes
+        self.setProxyModel(proxy)
+        self.setViewMode(QFileDialog.ViewMode.List)
+
+        list_view = self.findChild(QListView, "listView")
+        if list_view is not None:
+            list_view.setIconSize(QSize(THUMBNAIL_ICON_SIZE, THUMBNAIL_ICON_SIZE))
+            # Otherwise every row is measured, asking for every thumbnail up front.
+            list_view.setUniformItemSizes(True)
+
+        self.preview = QLabel(self)
+        self.preview.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.preview.setFixedWidth(DEFAULT_THUMBNAIL_SIZE + 16)
+        layout = self.layout()
+        if isinstance(layout, QGridLayout):
+            layout.addWidget(self.preview, 0, layout.columnCount(), layout.rowCount(), 1)
+
+        self._current: Optional[str] = None
+        self.currentChanged.connect(self.show_preview)
+        self.directoryEntered.connect(self.loader.cancel_pending)
+        self.loader.signal_thumbnail.connect(self._thumbnail_ready)
+
+    def show_preview(self, path: str) -> None:
+        self._current = path
+        image = self.loader.image(path)
+        if image is not None:
+            self.preview.setPixmap(QPixmap.fromImage(image))
+            return
+        self.preview.clear()
+        if path and Path(path).suffix.lower() in self.suffixes:
+            self.loader.request(path)
+
+    def _thumbnail_ready(self, path: str) -> None:
+        if path == self._current:
+            self.show_preview(path)
+
+    def selected_paths(self) -> List[Path]:
+        return [Path(path) for path in self.selectedFiles()]
+
+
+def _exec_preview_dialog(
+    parent: Optional[QWidget],
+    directory: Optional[Path],
+    caption: str,
+    filter: Optional[Dict[str, str]],
+    file_mode: QFileDialog.FileMode,
+) -> List[Path]:
+    filter_list, filter_string = convert_filter_to_qt(filter)
+    dialog = PreviewFileDialog(parent, caption, str(directory) if directory is not None else "", filter_string)
+    dialog.setFileMode(file_mode)
+    if filter_list:
+        dialog.selectNameFilter(filter_list[0])
+    if not dialog.exec():
+        return []
+    return dialog.selected_paths()
+
+
 class FileDialog:
     """
     A class with a bunch on static methods for opening file dialogs.
@@ -36,6 +185,10 @@ class FileDialog:
         Caption to give the file dialog
     filter: Optional[Dict[str, str]]
         Set a filter to force a filetype. Always assumes the first entry is the choosen filter.
+    preview: bool
+        open / opens only, use a `PreviewFileDialog` showing thumbnails of images and `.npy` files.
+
+    load / loads open files and read them on worker threads, see `FileLoader`.
 
     Filter
     ----------
@@ -54,6 +207,7 @@ class FileDialog:
         directory: Optional[Path] = None,
         caption: str = "Open File",
         filter: Optional[Dict[str, str]] = None,
+        preview: bool = False,
     ) -> Optional[Path]:
         """
         Opens a file dialog window, and returns a selected Path.
@@ -64,6 +218,10 @@ class FileDialog:
         path: Optional[Path]
             If path selected, else None.
         """
+        if preview:
+            paths = _exec_preview_dialog(parent, directory, caption, filter, QFileDialog.FileMode.ExistingFile)
+            return paths[0] if paths else None
+
         filter_list, filter_string = convert_filter_to_qt(filter)
 
         qfilepath, _ = QFileDialog.getOpenFileName(
@@ -86,6 +244,7 @@ class FileDialog:
         directory: Optional[Path] = None,
         caption: str = "Open Files",
         filter: Optional[Dict[str, str]] = None,
+        preview: bool = False,
     ) -> Optional[List[Path]]:
         """
         Same as open, but for multiple filepaths. Returning all filepaths as a list, even if only one is selected.
@@ -96,6 +255,10 @@ class FileDialog:
         paths: Optional[List[Path]]
             If path selected, else None. Will return, Path or List of Paths.
         """
+        if preview:
+            paths = _exec_preview_dialog(parent, directory, caption, filter, QFileDialog.FileMode.ExistingFiles)
+            return paths if paths else None
+
         filter_list, filter_string = convert_filter_to_qt(filter)
 
         qfilepaths, _ = QFileDialog.getOpenFileNames(
@@ -115,6 +278,58 @@ class FileDialog:
             return [Path(qfilepaths)]
         return [Path(path) for path in qfilepaths]
 
+    @staticmethod
+    def load(
+        parent: Optional[QWidget] = None,
+        directory: Optional[Path] = None,
+        caption: str = "Open File",
+        filter: Optional[Dict[str, str]] = None,
+        preview: bool = False,
+        on_loaded: Optional[Callable[[object], None]] = None,
+        loader: Optional["FileLoader"] = None,
+    ) -> Optional[Future]:
+        """
+        Same as open, then loads the file on a worker thread without blocking.
+        `on_loaded` is called with the data on the GUI thread, eg: `image_view.set_image` or `table.set_data`.
+
+        Returns
+        ----------
+        future: Optional[Future]
+            Future of the loaded data if a path was selected, else None.
+        """
+        from .loader import shared_loader
+
+        path = FileDialog.open(parent, directory, caption, filter, preview)
+        if path is None:
+            return None
+        return (loader if loader is not None else shared_loader()).load(path, on_loaded)
+
+    @staticmethod
+    def loads(
+        parent: Optional[QWidget] = None,
+        directory: Optional[Path] = None,
+        caption: str = "Open Files",
+        filter: Optional[Dict[str, str]] = None,
+        preview: bool = False,
+        on_loaded: Optional[Callable[[object], None]] = None,
+        loader: Optional["FileLoader"] = None,
+    ) -> Optional[List[Future]]:
+        """
+        Same as opens, then loads the files in parallel on worker threads.
+        `on_loaded` is called with the data of each file on the GUI thread, as each finishes.
+
+        Returns
+        ----------
+        futures: Optional[List[Future]]
+            Futures of the loaded data, in the order selected, if paths were selected, else None.
+        """
+        from .loader import shared_loader
+
+        paths = FileDialog.opens(parent, directory, caption, filter, preview)
+        if paths is None:
+            return None
+        return (loader if loader is not None else shared_loader()).load_all(paths, on_loaded)
+
     @staticmethod
     def save(
         parent: Optional[QWidget] = None,
@@ -0,0 +1,245 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from numpy.lib import format as npy_format
+from PySide6.QtCore import QObject, Signal
+from PySide6.QtGui import QImageReader
+
+from .view.lib import image_to_numpy
+
+DEFAULT_READ_CHUNK_BYTES = 16 * 2**20  # Bytes read between progress updates.
+NPY_MMAP_BYTES = 256 * 2**20  # `.npy` files larger than this are memory mapped rather than read.
+
+ProgressCallback = Callable[[int, int], None]
+Reader = Callable[..., object]
+
+
+def _read_into(file, buffer: memoryview, progress: Optional[ProgressCallback], chunk: int) -> None:
+    # Read straight into the array's memory, a chunk at a time so progress can be reported.
+    total = len(buffer)
+    done = 0
+    while done < total:
+        count = file.readinto(buffer[done : done + chunk])
+        if not count:
+            raise EOFError(f"File ended after {done} of {total} bytes.")
+        done += count
+        if progress is not None:
+            progress(done, total)
+
+
+def _array_bytes(array: np.ndarray) -> memoryview:
+    # The array's memory as bytes, in memory order for C or Fortran arrays.
+    return memoryview(array.reshape(-1, order="A").view(np.uint8))
+
+
+def read_npy(
+    path: Path | str,
+    progress: Optional[ProgressCallback] = None,
+    mmap: Optional[bool] = None,
+    chunk: int = DEFAULT_READ_CHUNK_BYTES,
+) -> np.ndarray:
+    """
+    Read a `.npy` file, memory mapped when `mmap` is set or, by default, the file is larger than `NPY_MMAP_BYTES`.
+    Otherwise the file is read in chunks straight into the array, reporting progress.
+    """
+    path = Path(path)
+    if mmap is None:
+        mmap = path.stat().st_size > NPY_MMAP_BYTES
+    if mmap:
+        array = np.load(path, mmap_mode="r")
+        if progress is not None:
+            progress(1, 1)
+        return array
+
+    with open(path, "rb") as file:
+        version = npy_format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_1_0(file)
+        elif version == (2, 0):
+            shape, fortran_order, dtype = npy_format.read_array_header_2_0(file)
+        else:
+            file.seek(0)
+            return np.load(file)
+        if dtype.hasobject:
+            raise ValueError(f"{path} holds Python objects, which are not loaded.")
+        array = np.empty(shape, dtype=dtype, order="F" if fortran_order else "C")
+        _read_into(file, _array_bytes(array), progress, chunk)
+    return array
+
+
+class RawReader:
+    """
+    Reader of raw files of fixed size records, eg: `loader.register_reader(".bin", RawReader(dtype, offset=16))`.
+    A trailing partial record is ignored.
+    """
+
+    def __init__(self, dtype, offset: int = 0, chunk: int = DEFAULT_READ_CHUNK_BYTES) -> None:
+        self.dtype = np.dtype(dtype)
+        self.offset = offset
+        self.chunk = chunk
+
+    def __call__(self, path: Path | str, progress: Optional[ProgressCallback] = None) -> np.ndarray:
+        with open(path, "rb") as file:
+            size = file.seek(0, 2)
+            array = np.empty(max(0, size - self.offset) // self.dtype.itemsize, dtype=self.dtype)
+            file.seek(self.offset)
+            _read_into(file, _array_bytes(array), progress, self.chunk)
+        return array
+
+
+def read_image(path: Path | str, progress: Optional[ProgressCallback] = None) -> np.ndarray:
+    """
+    Read an image Qt can decode as a numpy array, for `ImageViewComponent.set_image`.
+    Grayscale images are (height, width), others (height, width, 4) RGBA.
+    """
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    image = reader.read()
+    if image.isNull():
+        raise OSError(f"Can't read image {path}: {reader.errorString()}")
+    if progress is not None:
+        progress(1, 1)
+    return image_to_numpy(image)
+
+
+def default_readers() -> Dict[str, Reader]:
+    """
+    `.npy` files, and the image formats Qt can read.
+    """
+    readers: Dict[str, Reader] = {
+        f".{bytes(name).decode()}".lower(): read_image for name in QImageReader.supportedImageFormats()
+    }
+    readers[".npy"] = read_npy
+    return readers
+
+
+class FileLoader(QObject):
+    """
+    Loads files on a pool of worker threads (or processes), returning a `Future` per file,
+    so large files never block the GUI and several files load in parallel.
+
+    Files are read by the reader registered for their suffix, called as `reader(path, progress)`.
+    Progress is reported per chunk through `signal_progress`, when a file is loaded `on_loaded` is called
+    with the data on the GUI thread, eg: `table.set_data` or `image_view.set_image`, and `signal_loaded` emitted.
+
+    With `processes` set files are read in worker processes, for readers that hold the GIL, such as pure Python
+    decoders. Readers must then be picklable, progress is not reported, and the data is copied back.
+    """
+
+    signal_loaded = Signal(object, object)
+    signal_failed = Signal(object, object)
+    signal_progress = Signal(object, int, int)
+    signal_idle = Signal()
+
+    # Carry results from the workers.
+    _signal_progress = Signal(object, int, int)
+    _signal_done = Signal(object, object, object)
+
+    def __init__(self, max_workers: Optional[int] = None, processes: bool = False, parent=None) -> None:
+        super().__init__(parent)
+        self.processes = processes
+        self._executor: Executor = (
+            ProcessPoolExecutor(max_workers) if processes else ThreadPoolExecutor(max_workers, "FileLoader")
+        )
+        self.readers = default_readers()
+        self._pending: Set[Future] = set()
+        self._signal_progress.connect(self.signal_progress)
+        self._signal_done.connect(self._receive_done)
+
+    def register_reader(self, suffixes: str | Iterable[str], reader: Reader) -> None:
+        """
+        Read files with the given suffixes, eg: ".bin" or [".tif", ".tiff"], with `reader(path, progress)`.
+        """
+        for suffix in [suffixes] if isinstance(suffixes, str) else suffixes:
+            self.readers[suffix.lower()] = reader
+
+    def reader_for(self, path: Path) -> Reader:
+        reader = self.readers.get(path.suffix.lower())
+        if reader is None:
+            raise ValueError(f"No reader registered for {path.suffix or 'files without a suffix'}.")
+        return reader
+
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def load(
+        self,
+        path: Path | str,
+        on_loaded: Optional[Callable[[object], None]] = None,
+        reader: Optional[Reader] = None,
+    ) -> Future:
+        """
+        Start loading a file, returning its Future. `on_loaded` is called with the data on the GUI thread.
+        """
+        path = Path(path)
+        reader = reader if reader is not None else self.reader_for(path)
+        if self.processes:
+            future = self._executor.submit(reader, path)
+        else:
+            future = self._executor.submit(reader, path, lambda done, total: self._emit_progress(path, done, total))
+        self._pending.add(future)
+        future.add_done_callback(lambda done: self._emit_done(done, path, on_loaded))
+        return future
+
+    def load_all(
+        self, paths: Iterable[Path | str], on_loaded: Optional[Callable[[object], None]] = None
+    ) -> List[Future]:
+        """
+        Start loading several files in parallel, eg: a multi-select from `FileDialog.opens`.
+        """
+        return [self.load(path, on_loaded) for path in paths]
+
+    def cancel_all(self) -> None:
+        """
+        Cancel files not yet started, files being read are finished.
+        """
+        for future in list(self._pending):
+            future.cancel()
+
+    def shutdown(self, wait: bool = True) -> None:
+        self.cancel_all()
+        self._executor.shutdown(wait=wait)
+
+    def _emit_progress(self, path: Path, done: int, total: int) -> None:
+        # Runs on a worker thread.
+        try:
+            self._signal_progress.emit(path, done, total)
+        except RuntimeError:
+            # The loader was deleted while loading.
+            pass
+
+    def _emit_done(self, future: Future, path: Path, on_loaded: Optional[Callable[[object], None]]) -> None:
+        # Runs on the worker thread, or the calling thread when cancelled.
+        try:
+            self._signal_done.emit(future, path, on_loaded)
+        except RuntimeError:
+            pass
+
+    def _receive_done(self, future: Future, path: Path, on_loaded: Optional[Callable[[object], None]]) -> None:
+        self._pending.discard(future)
+        if not future.cancelled():
+            error = future.exception()
+            if error is not None:
+                self.signal_failed.emit(path, error)
+            else:
+                data = future.result()
+                if on_loaded is not None:
+                    on_loaded(data)
+                self.signal_loaded.emit(path, data)
+        if not self._pending:
+            self.signal_idle.emit()
+
+
+_shared_loader: Optional[FileLoader] = None
+
+
+def shared_loader() -> FileLoader:
+    """
+    A FileLoader shared by the application, created on first use.
+    """
+    global _shared_loader
+    if _shared_loader is None:
+        _shared_loader = FileLoader()
+    return _shared_loader
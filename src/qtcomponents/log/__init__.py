@@ -0,0 +1,5 @@
+from .handler import LoggingComponent, LoggingHandler, LoggingWidget, OverflowPolicy
+from .index import SequenceIndex
+from .search import LogSearch, text_matcher
+from .store import LogRecordStore
+from .view import LogListModel, LogViewWidget
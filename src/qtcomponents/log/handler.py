@@ -0,0 +1,202 @@
+import copy
+import logging
+from collections import deque
+from enum import Enum
+from typing import Deque, List, Optional
+
+from PySide6.QtCore import QTimer
+from PySide6.QtGui import QTextCursor
+from PySide6.QtWidgets import QTextEdit, QVBoxLayout, QWidget
+
+from ..profiling import profiler
+from .store import DEFAULT_MAX_RECORDS
+from .view import LogViewWidget
+
+DEFAULT_QUEUE_CAPACITY = 100000  # Records held before the overflow policy applies.
+DEFAULT_DRAIN_INTERVAL_MS = 100
+DEFAULT_DRAIN_BATCH = 5000  # Records inserted per drain, the rest wait for the next.
+
+
+class OverflowPolicy(Enum):
+    DropOldest = 0
+    DropNewest = 1
+
+
+class LoggingWidget(QWidget):
+    """
+    Inherits QWidget.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.text_box = QTextEdit(self)
+        self.text_box.setReadOnly(True)
+        self.text_box.setUndoRedoEnabled(False)
+        self.vertical_layout = QVBoxLayout(self)
+        self.setLayout(self.vertical_layout)
+        self.vertical_layout.addWidget(self.text_box)
+
+    def append(self, msg: str) -> None:
+        self.text_box.append(msg)
+
+    def append_lines(self, lines: List[str]) -> None:
+        """
+        Append multiple lines in a single edit.
+        """
+        if not lines:
+            return
+        cursor = QTextCursor(self.text_box.document())
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        text = "\n".join(lines)
+        cursor.insertText(text if self.text_box.document().isEmpty() else "\n" + text)
+        scrollbar = self.text_box.verticalScrollBar()
+        scrollbar.setValue(scrollbar.maximum())
+
+    def append_records(self, records: List[logging.LogRecord], formatter: Optional[logging.Formatter] = None) -> None:
+        """
+        Format records and append them in a single edit.
+        """
+        formatter = formatter if formatter is not None else logging.Formatter()
+        lines = []
+        for record in records:
+            try:
+                lines.append(formatter.format(record))
+            except Exception:
+                lines.append(f"Unformattable log record: {record.msg!r}")
+        self.append_lines(lines)
+
+
+class LoggingHandler(logging.Handler):
+    """
+    Inherits logging.Handler.
+    Logging handler that sends the log results to a given window
+
+    `emit` only queues the record, so it is safe and cheap to call from any thread.
+    The queue is drained on the GUI thread by a timer, formatting and inserting all pending records in one batch.
+    When the queue holds `capacity` records the overflow policy discards either the oldest or newest record,
+    the number discarded is kept in `dropped`.
+    """
+
+    def __init__(
+        self,
+        edit: LoggingWidget | LogViewWidget,
+        level: int | str = logging.WARNING,
+        capacity: int = DEFAULT_QUEUE_CAPACITY,
+        overflow: OverflowPolicy = OverflowPolicy.DropOldest,
+        drain_interval: int = DEFAULT_DRAIN_INTERVAL_MS,
+    ) -> None:
+        """
+        A log handler that outputs messages to a provided QTextEdit.
+        Must be created on the GUI thread.
+        """
+        super().__init__(level=level)
+        self.edit: LoggingWidget | LogViewWidget = edit
+        self.setLevel(level)
+        self.setFormatter(logging.Formatter("%(asctime)s:%(levelname)s - %(message)s", datefmt="%H:%M:%S"))
+
+        self.capacity = capacity
+        self.overflow = overflow
+        self.drain_batch = DEFAULT_DRAIN_BATCH
+        self._queue: Deque[logging.LogRecord] = deque()
+        self.enqueued = 0
+        self.dropped = 0
+        self._reported_dropped = 0
+
+        self._drain_timer = QTimer(edit)
+        self._drain_timer.setInterval(drain_interval)
+        self._drain_timer.timeout.connect(self.drain)
+        self._drain_timer.start()
+
+    @profiler.timed("LoggingHandler.emit")
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Queue the log, it is written to the object on the next drain.
+        Called with the handler lock held.
+        A copy of the record is queued with its message and exception resolved, as `QueueHandler.prepare` does,
+        so it holds no references to arguments or frames that may change before the drain.
+
+        Parameters
+        ----------
+        record : LogRecord
+            Record to write
+
+        """
+        if len(self._queue) >= self.capacity:
+            self.dropped += 1
+            if self.overflow == OverflowPolicy.DropNewest:
+                return
+            self._queue.popleft()
+        self._queue.append(self.prepare(record))
+        self.enqueued += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy of a record with the message merged with its arguments and the exception and stack formatted
+        into `exc_text`. The rest of the formatting is left to the drain.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info or record.stack_info:
+            formatter = self.formatter if self.formatter is not None else logging.Formatter()
+            details = [record.exc_text or formatter.formatException(record.exc_info)] if record.exc_info else []
+            if record.stack_info:
+                details.append(formatter.formatStack(record.stack_info))
+            record.exc_text = "\n".join(details)
+            record.exc_info = None
+            record.stack_info = None
+        return record
+
+    def pending_count(self) -> int:
+        return len(self._queue)
+
+    @profiler.timed("LoggingHandler.drain")
+    def drain(self) -> None:
+        """
+        Format and write pending records to the object, up to `drain_batch` at a time.
+        """
+        with self.lock:  # type: ignore
+            count = min(len(self._queue), self.drain_batch)
+            records = [self._queue.popleft() for _ in range(count)]
+            dropped = self.dropped - self._reported_dropped
+            self._reported_dropped = self.dropped
+
+        if dropped:
+            notice = {
+                "msg": f"... {dropped} log records dropped ...",
+                "levelno": logging.WARNING,
+                "levelname": "WARNING",
+            }
+            records.insert(0, logging.makeLogRecord(notice))
+        if records:
+            self.edit.append_records(records, self.formatter)
+
+    def close(self) -> None:
+        try:
+            self._drain_timer.stop()
+        except RuntimeError:
+            # The widget, and the timer with it, has already been deleted.
+            pass
+        super().close()
+
+
+class LoggingComponent:
+    def __init__(
+        self,
+        parent: QWidget,
+        level: int | str = logging.WARNING,
+        virtual: bool = False,
+        max_records: int = DEFAULT_MAX_RECORDS,
+        **kwargs,
+    ) -> None:
+        """
+        A log handler that outputs messages to a provided QTextEdit.
+        Set `virtual` to use a `LogViewWidget` instead, holding at most `max_records` records.
+        kwargs are passed to `LoggingHandler`, eg: capacity / overflow / drain_interval.
+        """
+        self.widget: LoggingWidget | LogViewWidget
+        if virtual:
+            self.widget = LogViewWidget(parent, max_records=max_records)
+        else:
+            self.widget = LoggingWidget(parent)
+        self.handler = LoggingHandler(self.widget, level, **kwargs)
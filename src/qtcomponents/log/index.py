@@ -0,0 +1,69 @@
+import numpy as np
+
+DEFAULT_INDEX_CAPACITY = 1024
+
+
+class SequenceIndex:
+    """
+    A growable, sorted array of record sequence numbers.
+
+    Appends are amortized constant time (the backing array doubles when full), and old sequence numbers are trimmed
+    from the front as the record store overwrites them, so the index stays bounded by the store capacity.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_INDEX_CAPACITY) -> None:
+        self._data = np.empty(capacity, dtype=np.int64)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    def __getitem__(self, row: int) -> int:
+        return int(self._data[self._start + row])
+
+    @property
+    def values(self) -> np.ndarray:
+        """
+        A view of the held sequence numbers, only valid until the next append.
+        """
+        return self._data[self._start : self._end]
+
+    def append(self, sequences: np.ndarray) -> None:
+        """
+        Append sequence numbers, which must all be greater than those already held.
+        """
+        count = len(sequences)
+        if self._end + count > len(self._data):
+            size = len(self)
+            capacity = len(self._data)
+            while size + count > capacity:
+                capacity *= 2
+            if capacity == len(self._data):
+                # Enough room once the trimmed front is reclaimed.
+                self._data[:size] = self._data[self._start : self._end]
+            else:
+                data = np.empty(capacity, dtype=np.int64)
+                data[:size] = self._data[self._start : self._end]
+                self._data = data
+            self._start, self._end = 0, size
+
+        self._data[self._end : self._end + count] = sequences
+        self._end += count
+
+    def count_below(self, sequence: int) -> int:
+        """
+        Number of held sequence numbers less than `sequence`.
+        """
+        return int(np.searchsorted(self.values, sequence))
+
+    def trim(self, first: int) -> int:
+        """
+        Remove sequence numbers less than `first`, returning the number removed.
+        """
+        count = self.count_below(first)
+        self._start += count
+        return count
+
+    def clear(self) -> None:
+        self._start = self._end = 0
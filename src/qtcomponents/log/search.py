@@ -0,0 +1,109 @@
+import re
+from typing import Callable, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, QThreadPool, Signal
+
+DEFAULT_SEARCH_CHUNK = 20000  # Records matched between each batch of streamed results.
+
+
+def text_matcher(text: str, regex: bool = False, case_sensitive: bool = False) -> Callable[[str], bool]:
+    """
+    Build a function testing whether a message contains `text`, as a substring or a regex.
+    Raises re.error for an invalid regex.
+    """
+    if regex:
+        pattern = re.compile(text, 0 if case_sensitive else re.IGNORECASE)
+        return lambda message: pattern.search(message) is not None
+    if case_sensitive:
+        return lambda message: text in message
+    folded = text.casefold()
+    return lambda message: folded in message.casefold()
+
+
+class LogSearch(QObject):
+    """
+    Searches log messages on the thread pool, streaming matching sequence numbers back in chunks.
+
+    The messages are snapshotted on the calling thread before the search starts, so the store can keep
+    receiving records while the search runs. Starting a new search or calling `cancel` abandons the current one,
+    results from an abandoned search are never emitted.
+    """
+
+    signal_results = Signal(object)
+    signal_progress = Signal(int, int)
+    signal_finished = Signal(int)
+
+    # Carry results from the worker thread, tagged with the search they belong to.
+    _signal_chunk = Signal(int, object, int, int)
+    _signal_done = Signal(int, int)
+
+    def __init__(self, chunk: int = DEFAULT_SEARCH_CHUNK, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.chunk = chunk
+        self._generation = 0
+        self._running = False
+        self._signal_chunk.connect(self._receive_chunk)
+        self._signal_done.connect(self._receive_done)
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(
+        self,
+        sequences: np.ndarray,
+        messages: List[Optional[str]],
+        capacity: int,
+        matcher: Callable[[str], bool],
+    ) -> None:
+        """
+        Search the messages of `sequences`, `messages` is the store's message column and is copied here.
+        """
+        self._generation += 1
+        self._running = True
+        generation = self._generation
+        snapshot = list(messages)
+        sequences = sequences.copy()
+        QThreadPool.globalInstance().start(lambda: self._search(generation, sequences, snapshot, capacity, matcher))
+
+    def cancel(self) -> None:
+        self._generation += 1
+        self._running = False
+
+    def _search(
+        self,
+        generation: int,
+        sequences: np.ndarray,
+        messages: List[Optional[str]],
+        capacity: int,
+        matcher: Callable[[str], bool],
+    ) -> None:
+        # Runs on a pool thread.
+        total = len(sequences)
+        found = 0
+        try:
+            for start in range(0, total, self.chunk):
+                if generation != self._generation:
+                    return
+                block = sequences[start : start + self.chunk]
+                positions = (block % capacity).tolist()
+                hits = [row for row, position in enumerate(positions) if matcher(messages[position] or "")]
+                found += len(hits)
+                self._signal_chunk.emit(generation, block[hits], min(start + self.chunk, total), total)
+            self._signal_done.emit(generation, found)
+        except RuntimeError:
+            # The search object was deleted while searching.
+            pass
+
+    def _receive_chunk(self, generation: int, sequences: np.ndarray, done: int, total: int) -> None:
+        if generation != self._generation:
+            return
+        if len(sequences):
+            self.signal_results.emit(sequences)
+        self.signal_progress.emit(done, total)
+
+    def _receive_done(self, generation: int, found: int) -> None:
+        if generation != self._generation:
+            return
+        self._running = False
+        self.signal_finished.emit(found)
@@ -0,0 +1,202 @@
+import logging
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from .index import SequenceIndex
+
+DEFAULT_MAX_RECORDS = 1_000_000
+
+
+class LogRecordStore:
+    """
+    A fixed capacity ring of log records, stored column wise.
+
+    Timestamps, levels and logger ids are numpy arrays, messages a list of the same length, and logger names
+    are interned so each record only holds an id. Nothing is formatted on append, so the cost of an append is
+    constant however many records are held. When full the oldest records are overwritten.
+
+    Rows are logical, 0 is the oldest record held. `sequence` numbers count every record ever appended,
+    so they stay valid as the ring wraps, a record's position in the column arrays is `sequence % capacity`.
+
+    Each level and logger keeps a `SequenceIndex` of its records, updated on append,
+    so filtering by level or logger never scans the whole store.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_MAX_RECORDS) -> None:
+        self.capacity = capacity
+        self.created = np.zeros(capacity, dtype=np.float64)
+        self.levels = np.zeros(capacity, dtype=np.int16)
+        self.loggers = np.zeros(capacity, dtype=np.int32)
+        self.messages: List[Optional[str]] = [None] * capacity
+
+        self.logger_names: List[str] = []
+        self._logger_ids: Dict[str, int] = {}
+        self.level_index: Dict[int, SequenceIndex] = {}
+        self.logger_index: Dict[int, SequenceIndex] = {}
+
+        self._size = 0
+        self.total = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def first_sequence(self) -> int:
+        """
+        Sequence number of the oldest record held.
+        """
+        return self.total - self._size
+
+    def logger_id(self, name: str) -> int:
+        """
+        Id of a logger name, interning it if it has not been seen.
+        """
+        logger_id = self._logger_ids.get(name)
+        if logger_id is None:
+            logger_id = len(self.logger_names)
+            self._logger_ids[name] = logger_id
+            self.logger_names.append(name)
+        return logger_id
+
+    def extend(self, records: List[logging.LogRecord], formatter: Optional[logging.Formatter] = None) -> int:
+        """
+        Append records, the message is resolved with `getMessage` and any exception text appended.
+        Returns the number of old records overwritten.
+        """
+        count = len(records)
+        if count == 0:
+            return 0
+
+        formatter = formatter if formatter is not None else logging.Formatter()
+        messages = []
+        for record in records:
+            message = record.getMessage()
+            if record.exc_info:
+                message = f"{message}\n{formatter.formatException(record.exc_info)}"
+            elif record.exc_text:
+                message = f"{message}\n{record.exc_text}"
+            messages.append(message)
+
+        # Only the newest `capacity` records can be kept.
+        if count > self.capacity:
+            records = records[-self.capacity :]
+            messages = messages[-self.capacity :]
+
+        kept = len(records)
+        sequences = np.arange(self.total + count - kept, self.total + count, dtype=np.int64)
+        positions = sequences % self.capacity
+        levels = np.fromiter((record.levelno for record in records), dtype=np.int16, count=kept)
+        loggers = np.fromiter((self.logger_id(record.name) for record in records), dtype=np.int32, count=kept)
+        self.created[positions] = [record.created for record in records]
+        self.levels[positions] = levels
+        self.loggers[positions] = loggers
+        for position, message in zip(positions.tolist(), messages):
+            self.messages[position] = message
+
+        evicted = max(0, self._size + count - self.capacity)
+        self._size = min(self._size + count, self.capacity)
+        self.total += count
+
+        self._index(self.level_index, levels, sequences)
+        self._index(self.logger_index, loggers, sequences)
+        if evicted:
+            self._trim_indexes()
+        return evicted
+
+    def _index(self, index: Dict[int, SequenceIndex], keys: np.ndarray, sequences: np.ndarray) -> None:
+        # Most batches hold a single level / logger, so skip the masking when possible.
+        unique = np.unique(keys)
+        if len(unique) == 1:
+            index.setdefault(int(unique[0]), SequenceIndex()).append(sequences)
+            return
+        for key in unique:
+            index.setdefault(int(key), SequenceIndex()).append(sequences[keys == key])
+
+    def _trim_indexes(self) -> None:
+        first = self.first_sequence
+        for sequence_index in (*self.level_index.values(), *self.logger_index.values()):
+            sequence_index.trim(first)
+
+    def discard_oldest(self, count: int) -> None:
+        """
+        Drop the oldest `count` records.
+        """
+        self._size -= min(count, self._size)
+        self._trim_indexes()
+
+    def physical(self, row: int) -> int:
+        """
+        Index into the column arrays of a logical row.
+        """
+        return (self.first_sequence + row) % self.capacity
+
+    def record(self, row: int) -> Tuple[float, int, str, str]:
+        """
+        (created, levelno, logger name, message) of a logical row.
+        """
+        return self.record_at(self.first_sequence + row)
+
+    def record_at(self, sequence: int) -> Tuple[float, int, str, str]:
+        """
+        (created, levelno, logger name, message) of a sequence number.
+        """
+        index = sequence % self.capacity
+        return (
+            float(self.created[index]),
+            int(self.levels[index]),
+            self.logger_names[self.loggers[index]],
+            self.messages[index] or "",
+        )
+
+    def select(
+        self,
+        min_level: int = logging.NOTSET,
+        loggers: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """
+        Sorted sequence numbers of held records at or above `min_level`, from the given loggers (None is all).
+        Built from the level / logger indexes with a mask over the held range, so the cost is linear in the
+        number of matching records rather than a scan of every message.
+        """
+        first = self.first_sequence
+        size = self._size
+        if min_level <= logging.NOTSET and loggers is None:
+            return np.arange(first, first + size, dtype=np.int64)
+
+        mask = np.zeros(size, dtype=bool)
+        for level, sequence_index in self.level_index.items():
+            if level >= min_level:
+                mask[sequence_index.values - first] = True
+
+        if loggers is not None:
+            logger_mask = np.zeros(size, dtype=bool)
+            for name in loggers:
+                logger_id = self._logger_ids.get(name)
+                if logger_id is not None and logger_id in self.logger_index:
+                    logger_mask[self.logger_index[logger_id].values - first] = True
+            mask &= logger_mask
+
+        return np.flatnonzero(mask) + first
+
+    def matches(
+        self,
+        sequences: np.ndarray,
+        min_level: int = logging.NOTSET,
+        loggers: Optional[Iterable[str]] = None,
+    ) -> np.ndarray:
+        """
+        Boolean mask of which `sequences` are at or above `min_level` and from the given loggers.
+        """
+        positions = sequences % self.capacity
+        mask = self.levels[positions] >= min_level
+        if loggers is not None:
+            ids = [self._logger_ids[name] for name in loggers if name in self._logger_ids]
+            mask &= np.isin(self.loggers[positions], ids)
+        return mask
+
+    def clear(self) -> None:
+        self.messages = [None] * self.capacity
+        self._size = 0
+        for sequence_index in (*self.level_index.values(), *self.logger_index.values()):
+            sequence_index.clear()
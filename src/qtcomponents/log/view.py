@@ -0,0 +1,352 @@
+import logging
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QPersistentModelIndex,
+    Qt,
+    QTimer,
+)
+from PySide6.QtGui import QBrush, QColor
+from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
+    QHBoxLayout,
+    QHeaderView,
+    QLabel,
+    QLineEdit,
+    QTableView,
+    QVBoxLayout,
+    QWidget,
+)
+
+from .index import SequenceIndex
+from .search import LogSearch, text_matcher
+from .store import DEFAULT_MAX_RECORDS, LogRecordStore
+
+FILTER_DELAY_MS = 250  # Wait for typing to pause before searching.
+FILTER_LEVELS = [logging.NOTSET, logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL]
+
+LEVEL_COLOURS: Dict[int, str] = {
+    logging.WARNING: "darkorange",
+    logging.ERROR: "red",
+    logging.CRITICAL: "darkred",
+}
+
+
+class LogListModel(QAbstractListModel):
+    """
+    A list model over a `LogRecordStore`. Rows are only formatted when the view asks for them,
+    so the cost of painting depends on the number of visible rows rather than the number of records.
+
+    `set_filter` restricts the rows by minimum level, logger names and message text. Level and logger filters
+    are resolved from the store's indexes, text is searched on a worker thread and matching rows stream in as
+    they are found. Records appended while filtered are matched as they arrive.
+    """
+
+    def __init__(self, store: LogRecordStore, time_format: str = "%H:%M:%S") -> None:
+        super().__init__()
+        self.store = store
+        self.time_format = time_format
+        self._brushes: Dict[int, QBrush] = {level: QBrush(QColor(colour)) for level, colour in LEVEL_COLOURS.items()}
+
+        self.min_level = logging.NOTSET
+        self.loggers: Optional[Set[str]] = None
+        self._matcher: Optional[Callable[[str], bool]] = None
+        # Sequence numbers of the visible rows, None when unfiltered.
+        self._rows: Optional[SequenceIndex] = None
+        # Live matches held back until a streaming search has finished, to keep rows in order.
+        self._deferred: List[np.ndarray] = []
+
+        self.search = LogSearch(parent=self)
+        self.search.signal_results.connect(self._insert_rows)
+        self.search.signal_finished.connect(self._search_finished)
+
+    def rowCount(self, parent: QModelIndex | QPersistentModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        if self._rows is not None:
+            return len(self._rows)
+        return len(self.store)
+
+    def is_filtered(self) -> bool:
+        return self._rows is not None
+
+    def sequence(self, row: int) -> int:
+        """
+        Sequence number of the record displayed at a row.
+        """
+        if self._rows is not None:
+            return self._rows[row]
+        return self.store.first_sequence + row
+
+    def data(
+        self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Optional[object]:
+        """
+        Formats the record at a given row as `time:LEVEL - message`.
+        """
+        if role == Qt.ItemDataRole.DisplayRole:
+            created, level, _, message = self.store.record_at(self.sequence(index.row()))
+            timestamp = time.strftime(self.time_format, time.localtime(created))
+            return f"{timestamp}:{logging.getLevelName(level)} - {message}"
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            level = int(self.store.levels[self.sequence(index.row()) % self.store.capacity])
+            return self._brushes.get(level)
+        return
+
+    def set_filter(
+        self,
+        min_level: int = logging.NOTSET,
+        loggers: Optional[Iterable[str]] = None,
+        text: str = "",
+        regex: bool = False,
+        case_sensitive: bool = False,
+    ) -> None:
+        """
+        Filter the displayed records. An empty `text` and None `loggers` match everything.
+        Raises re.error for an invalid regex, leaving the current filter in place.
+        """
+        matcher = text_matcher(text, regex, case_sensitive) if text else None
+        self.min_level = min_level
+        self.loggers = set(loggers) if loggers is not None else None
+        self._matcher = matcher
+        self._apply_filter()
+
+    def clear_filter(self) -> None:
+        self.set_filter()
+
+    def _apply_filter(self) -> None:
+        self.search.cancel()
+        self._deferred = []
+        store = self.store
+
+        self.beginResetModel()
+        candidates = None
+        if self.min_level <= logging.NOTSET and self.loggers is None and self._matcher is None:
+            self._rows = None
+        else:
+            candidates = store.select(self.min_level, self.loggers)
+            self._rows = SequenceIndex(max(len(candidates), 1) if self._matcher is None else 1024)
+            if self._matcher is None:
+                self._rows.append(candidates)
+        self.endResetModel()
+
+        if self._matcher is not None and candidates is not None and len(candidates):
+            self.search.start(candidates, store.messages, store.capacity, self._matcher)
+
+    def append_records(self, records: List[logging.LogRecord], formatter: Optional[logging.Formatter] = None) -> None:
+        """
+        Append records to the store, notifying views of the rows removed from the front and added to the back.
+        """
+        count = len(records)
+        if count == 0:
+            return
+
+        store = self.store
+        size = len(store)
+        if count >= store.capacity:
+            self.beginResetModel()
+            store.extend(records, formatter)
+            self.endResetModel()
+            if self._rows is not None:
+                self._apply_filter()
+            return
+
+        evicted = max(0, size + count - store.capacity)
+        if evicted:
+            # Notify removal first, so the view sees the rows before the ring overwrites them.
+            removed = evicted
+            if self._rows is not None:
+                removed = self._rows.count_below(store.first_sequence + evicted)
+            if removed:
+                self.beginRemoveRows(QModelIndex(), 0, removed - 1)
+            store.discard_oldest(evicted)
+            if self._rows is not None:
+                self._rows.trim(store.first_sequence)
+            if removed:
+                self.endRemoveRows()
+            size -= evicted
+
+        if self._rows is None:
+            self.beginInsertRows(QModelIndex(), size, size + count - 1)
+            store.extend(records, formatter)
+            self.endInsertRows()
+            return
+
+        first = store.total
+        store.extend(records, formatter)
+        sequences = np.arange(first, store.total, dtype=np.int64)
+        sequences = sequences[store.matches(sequences, self.min_level, self.loggers)]
+        if self._matcher is not None and len(sequences):
+            matcher = self._matcher
+            messages = store.messages
+            hits = [
+                row
+                for row, position in enumerate((sequences % store.capacity).tolist())
+                if matcher(messages[position] or "")
+            ]
+            sequences = sequences[hits]
+
+        if not len(sequences):
+            return
+        if self.search.is_running():
+            self._deferred.append(sequences)
+            return
+        self._insert_rows(sequences)
+
+    def _insert_rows(self, sequences: np.ndarray) -> None:
+        if self._rows is None:
+            return
+        # Results from a search may refer to records overwritten since it started.
+        sequences = sequences[sequences >= self.store.first_sequence]
+        if not len(sequences):
+            return
+        size = len(self._rows)
+        self.beginInsertRows(QModelIndex(), size, size + len(sequences) - 1)
+        self._rows.append(sequences)
+        self.endInsertRows()
+
+    def _search_finished(self, found: int) -> None:
+        deferred, self._deferred = self._deferred, []
+        for sequences in deferred:
+            self._insert_rows(sequences)
+
+    def clear(self) -> None:
+        self.search.cancel()
+        self._deferred = []
+        self.beginResetModel()
+        self.store.clear()
+        if self._rows is not None:
+            self._rows.clear()
+        self.endResetModel()
+
+
+class LogViewWidget(QWidget):
+    """
+    Inherits QWidget.
+    A drop in alternative to `LoggingWidget` for long running applications, records are held in a bounded
+    `LogRecordStore` and displayed through a virtualized list view.
+
+    A filter bar above the view filters by minimum level, logger and message text (substring or regex).
+    """
+
+    def __init__(
+        self, parent: Optional[QWidget] = None, max_records: int = DEFAULT_MAX_RECORDS, *args, **kwargs
+    ) -> None:
+        super().__init__(parent, *args, **kwargs)
+        self.store = LogRecordStore(max_records)
+        self.model = LogListModel(self.store)
+
+        # A single column QTableView rather than a QListView, as QListView lays out every row on each change.
+        # With fixed row heights the table only touches the visible rows.
+        self.record_view = QTableView(self)
+        self.record_view.setModel(self.model)
+        self.record_view.setShowGrid(False)
+        self.record_view.setWordWrap(False)
+        self.record_view.horizontalHeader().setVisible(False)
+        self.record_view.horizontalHeader().setStretchLastSection(True)
+        self.record_view.verticalHeader().setVisible(False)
+        self.record_view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.record_view.verticalHeader().setDefaultSectionSize(self.fontMetrics().height() + 2)
+        self.record_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.record_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.record_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+
+        self.level_cbox = QComboBox(self)
+        for level in FILTER_LEVELS:
+            self.level_cbox.addItem("All levels" if level == logging.NOTSET else logging.getLevelName(level), level)
+
+        self.logger_cbox = QComboBox(self)
+        self.logger_cbox.addItem("All loggers")
+
+        self.search_entry = QLineEdit(self)
+        self.search_entry.setPlaceholderText("Search...")
+        self.search_entry.setClearButtonEnabled(True)
+
+        self.regex_check = QCheckBox("Regex", self)
+        self.status_label = QLabel(self)
+
+        self.filter_layout = QHBoxLayout()
+        self.filter_layout.setContentsMargins(0, 0, 0, 0)
+        self.filter_layout.addWidget(self.level_cbox)
+        self.filter_layout.addWidget(self.logger_cbox)
+        self.filter_layout.addWidget(self.search_entry)
+        self.filter_layout.addWidget(self.regex_check)
+        self.filter_layout.addWidget(self.status_label)
+
+        self.vertical_layout = QVBoxLayout(self)
+        self.setLayout(self.vertical_layout)
+        self.vertical_layout.addLayout(self.filter_layout)
+        self.vertical_layout.addWidget(self.record_view)
+
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self.apply_filter)
+
+        self.level_cbox.currentIndexChanged.connect(self.apply_filter)
+        self.logger_cbox.currentIndexChanged.connect(self.apply_filter)
+        self.regex_check.toggled.connect(self.apply_filter)
+        self.search_entry.textChanged.connect(self._filter_timer.start)
+        self.model.search.signal_progress.connect(self._search_progress)
+        self.model.search.signal_finished.connect(self._search_finished)
+
+    def append(self, msg: str) -> None:
+        """
+        Append a plain message, logged at INFO.
+        """
+        self.append_records([logging.makeLogRecord({"msg": msg, "levelno": logging.INFO, "levelname": "INFO"})])
+
+    def append_records(self, records: List[logging.LogRecord], formatter: Optional[logging.Formatter] = None) -> None:
+        """
+        Append records, following the newest record if the view was already scrolled to the bottom.
+        """
+        scrollbar = self.record_view.verticalScrollBar()
+        follow = scrollbar.value() == scrollbar.maximum()
+        self.model.append_records(records, formatter)
+        if follow:
+            self.record_view.scrollToBottom()
+
+        # Offer any loggers seen for the first time.
+        names = self.store.logger_names
+        for name in names[self.logger_cbox.count() - 1 :]:
+            self.logger_cbox.addItem(name)
+
+    def apply_filter(self) -> None:
+        """
+        Apply the filter currently set in the filter bar.
+        """
+        self._filter_timer.stop()
+        logger = None if self.logger_cbox.currentIndex() <= 0 else [self.logger_cbox.currentText()]
+        try:
+            self.model.set_filter(
+                min_level=self.level_cbox.currentData(),
+                loggers=logger,
+                text=self.search_entry.text(),
+                regex=self.regex_check.isChecked(),
+            )
+        except re.error as error:
+            self.status_label.setText(f"Invalid regex: {error}")
+            return
+        self.status_label.setText("Searching..." if self.model.search.is_running() else "")
+
+    def set_filter(self, *args, **kwargs) -> None:
+        """
+        Filter programmatically, see `LogListModel.set_filter`.
+        """
+        self.model.set_filter(*args, **kwargs)
+
+    def _search_progress(self, done: int, total: int) -> None:
+        self.status_label.setText(f"Searching... {done * 100 // max(total, 1)}%")
+
+    def _search_finished(self, found: int) -> None:
+        self.status_label.setText(f"{found} matches")
+
+    def clear(self) -> None:
+        self.model.clear()
@@ -1,2 +1,18 @@
-from .matplotlib import MatplotlibWidget
-from .lib import save_figure_fixed_size, convert_timestamp_to_string, find_plot_limits
\ No newline at end of file
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+# matplotlib is slow to import, so only import it once plotting is used.
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "MatplotlibWidget": ".matplotlib",
+        "save_figure_fixed_size": ".lib",
+        "convert_timestamp_to_string": ".lib",
+        "find_plot_limits": ".lib",
+    },
+)
+
+if TYPE_CHECKING:
+    from .lib import convert_timestamp_to_string, find_plot_limits, save_figure_fixed_size
+    from .matplotlib import MatplotlibWidget
@@ -0,0 +1,182 @@
+import functools
+import os
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Dict, Iterator, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+HISTOGRAM_BUCKETS = 64  # Bucket `i` counts durations of less than 2**i nanoseconds.
+DEFAULT_REPORT_INTERVAL_MS = 1000  # Time between `signal_stats` emits.
+PROFILE_ENV = "QTCOMPONENTS_PROFILE"  # Set to 1 to enable profiling at import.
+
+
+class Histogram:
+    """
+    Durations in nanoseconds, counted in power of two buckets, so recording is a `bit_length` and an increment.
+    Percentiles are accurate to within a factor of two, enough to spot a slow path.
+    Not locked, counts recorded from several threads at once are approximate.
+    """
+
+    def __init__(self) -> None:
+        self.counts = [0] * HISTOGRAM_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, nanoseconds: int) -> None:
+        self.counts[min(nanoseconds.bit_length(), HISTOGRAM_BUCKETS - 1)] += 1
+        self.count += 1
+        self.total_ns += nanoseconds
+        if nanoseconds > self.max_ns:
+            self.max_ns = nanoseconds
+
+    def percentile(self, percent: float) -> int:
+        """
+        Upper bound in nanoseconds of the bucket holding the `percent` percentile, 0 if empty.
+        """
+        if self.count == 0:
+            return 0
+        target = self.count * percent / 100.0
+        seen = 0
+        for bucket, count in enumerate(self.counts):
+            seen += count
+            if seen >= target:
+                return min(2**bucket, self.max_ns)
+        return self.max_ns
+
+    def summary(self) -> Dict[str, float]:
+        """
+        count, total / mean / p50 / p90 / p99 / max in milliseconds.
+        """
+        return {
+            "count": self.count,
+            "total_ms": self.total_ns / 1e6,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "p50_ms": self.percentile(50) / 1e6,
+            "p90_ms": self.percentile(90) / 1e6,
+            "p99_ms": self.percentile(99) / 1e6,
+            "max_ms": self.max_ns / 1e6,
+        }
+
+    def reset(self) -> None:
+        self.__init__()
+
+
+class Profiler(QObject):
+    """
+    Opt-in timing of hot paths.
+
+    Components mark their hot paths with the `timed` decorator where they are defined, eg: `StructuredArrayModel.data`.
+    While disabled a timed function only checks a flag before calling through, `enable` and `disable` toggle it
+    and can be called at any time. Set the environment variable `QTCOMPONENTS_PROFILE=1` to enable at import.
+
+    Timings are kept in a `Histogram` per path, read with `stats`, or emitted periodically
+    by `signal_stats` once `start_reporting` is called.
+    """
+
+    signal_stats = Signal(object)
+    signal_enabled = Signal(bool)
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._enabled = False
+        self.histograms: Dict[str, Histogram] = {}
+        self._timer: Optional[QTimer] = None
+
+    def is_enabled(self) -> bool:
+        return self._enabled
+
+    def timed(self, name: str) -> Callable[[Callable], Callable]:
+        """
+        Decorator timing a function or method as the hot path `name` while the profiler is enabled,
+        eg: `@profiler.timed("MyWidget.paintEvent")`.
+        """
+        histogram = self.histograms.setdefault(name, Histogram())
+        clock = time.perf_counter_ns
+
+        def decorator(function: Callable) -> Callable:
+            @functools.wraps(function)
+            def timed(*args, **kwargs):
+                if not self._enabled:
+                    return function(*args, **kwargs)
+                start = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    histogram.record(clock() - start)
+
+            return timed
+
+        return decorator
+
+    def paths(self) -> List[str]:
+        return list(self.histograms)
+
+    def enable(self) -> None:
+        if self._enabled:
+            return
+        self._enabled = True
+        self.signal_enabled.emit(True)
+
+    def disable(self) -> None:
+        if not self._enabled:
+            return
+        self._enabled = False
+        self.signal_enabled.emit(False)
+
+    def record(self, name: str, nanoseconds: int) -> None:
+        """
+        Record a duration measured elsewhere.
+        """
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.record(nanoseconds)
+
+    def measure(self, name: str):
+        """
+        Context manager timing a block, eg: `with profiler.measure("decode"):`. Does nothing while disabled.
+        """
+        if not self._enabled:
+            return nullcontext()
+        return self._measure(name)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter_ns() - start)
+
+    def histogram(self, name: str) -> Optional[Histogram]:
+        return self.histograms.get(name)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Summary of each path that has been timed.
+        """
+        return {name: histogram.summary() for name, histogram in self.histograms.items() if histogram.count}
+
+    def reset(self) -> None:
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def start_reporting(self, interval: int = DEFAULT_REPORT_INTERVAL_MS) -> None:
+        """
+        Emit `signal_stats` every `interval` milliseconds, requires a running event loop.
+        """
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.timeout.connect(lambda: self.signal_stats.emit(self.stats()))
+        self._timer.start(interval)
+
+    def stop_reporting(self) -> None:
+        if self._timer is not None:
+            self._timer.stop()
+
+
+profiler = Profiler()
+if os.environ.get(PROFILE_ENV, "") not in ("", "0"):
+    profiler.enable()
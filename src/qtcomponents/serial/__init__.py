@@ -1,2 +1,35 @@
-from .command import CommandEntryWidget
-from .connect import SerialConnectionWidget
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "CommandEntryWidget": ".command",
+        "SerialConnectionWidget": ".connect",
+        "ConsoleWidget": ".console",
+        "ByteRingBuffer": ".decoder",
+        "FrameDecoder": ".decoder",
+        "FrameFormat": ".decoder",
+        "PortWatcher": ".ports",
+        "available_ports": ".ports",
+        "Command": ".scheduler",
+        "CommandScheduler": ".scheduler",
+        "CommandStatus": ".scheduler",
+        "LoopbackDevice": ".scheduler",
+        "AS_FAST_AS_POSSIBLE": ".session",
+        "Direction": ".session",
+        "SessionPlayer": ".session",
+        "SessionReader": ".session",
+        "SessionRecorder": ".session",
+    },
+)
+
+if TYPE_CHECKING:
+    from .command import CommandEntryWidget
+    from .connect import SerialConnectionWidget
+    from .console import ConsoleWidget
+    from .decoder import ByteRingBuffer, FrameDecoder, FrameFormat
+    from .ports import PortWatcher, available_ports
+    from .scheduler import Command, CommandScheduler, CommandStatus, LoopbackDevice
+    from .session import AS_FAST_AS_POSSIBLE, Direction, SessionPlayer, SessionReader, SessionRecorder
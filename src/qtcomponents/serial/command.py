@@ -1,3 +1,5 @@
+from typing import Iterable, List, Optional
+
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
     QHBoxLayout,
@@ -8,18 +10,31 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .console import DEFAULT_MAX_BLOCKS, ConsoleWidget
+from .scheduler import Command, CommandScheduler
+
 
 class CommandEntryWidget(QWidget):
     """
     A WidgetComponent for managing sending commands to a serial device.
 
     When send is clicked a `command_entered` signal is emitted.
+
+    Set `console` for high throughput devices, messages are then buffered and inserted in batches,
+    with the scrollback capped to `max_blocks` lines and a toggle for following the newest line.
+
+    Attach a `CommandScheduler` to pipeline entered commands and scripts, commands are then emitted through
+    `command_entered` as the scheduler sends them, and replies / timeouts are shown with their latency.
     """
 
     signal_command_entered = Signal(str)
 
-    def __init__(self, parent: QWidget, *args, **kwargs) -> None:
+    def __init__(
+        self, parent: QWidget, *args, console: bool = False, max_blocks: int = DEFAULT_MAX_BLOCKS, **kwargs
+    ) -> None:
         super().__init__(parent=parent, *args, **kwargs)
+        self._console = console
+        self.scheduler: Optional[CommandScheduler] = None
 
         self.verticalLayout = QVBoxLayout(self)
         self.verticalLayout.setContentsMargins(5, 5, 5, 5)
@@ -27,8 +42,12 @@ class CommandEntryWidget(QWidget):
         self.horizontalLayout = QHBoxLayout()
         self.horizontalLayout.setContentsMargins(5, 5, 5, 5)
 
-        self.message_widget = QTextEdit(self)
-        self.message_widget.setReadOnly(True)
+        self.message_widget: QTextEdit | ConsoleWidget
+        if console:
+            self.message_widget = ConsoleWidget(self, max_blocks=max_blocks)
+        else:
+            self.message_widget = QTextEdit(self)
+            self.message_widget.setReadOnly(True)
 
         self.command_entry = QLineEdit(self)
         self.command_entry.setPlaceholderText("Enter Command...")
@@ -39,6 +58,16 @@ class CommandEntryWidget(QWidget):
         self.verticalLayout.addWidget(self.message_widget)
         self.horizontalLayout.addWidget(self.command_entry)
         self.horizontalLayout.addWidget(self.send_button)
+
+        if console:
+            self.follow_button = QPushButton(self)
+            self.follow_button.setText("Follow")
+            self.follow_button.setCheckable(True)
+            self.follow_button.setChecked(True)
+            self.follow_button.toggled.connect(self.message_widget.set_follow)
+            self.message_widget.signal_follow_changed.connect(self.follow_button.setChecked)
+            self.horizontalLayout.addWidget(self.follow_button)
+
         self.verticalLayout.addLayout(self.horizontalLayout)
 
         self.send_button.clicked.connect(self.send_command_entry)
@@ -48,17 +77,83 @@ class CommandEntryWidget(QWidget):
         Emit `command_entered` signal, and reset lineEdit box.
         """
         command = self.command_entry.text()
-        self.signal_command_entered.emit(command)
         # Reset on send
         self.command_entry.setText("")
+        if self.scheduler is not None:
+            self.scheduler.submit(command)
+            return
+        self.signal_command_entered.emit(command)
         self.insert_message(f"Sent: {command}")
 
+    def attach_scheduler(self, scheduler: CommandScheduler) -> None:
+        """
+        Route entered commands through a scheduler. Sent commands are emitted through `command_entered`.
+        """
+        self.detach_scheduler()
+        self.scheduler = scheduler
+        scheduler.signal_send.connect(self._scheduler_sent)
+        scheduler.signal_command_completed.connect(self._scheduler_completed)
+        scheduler.signal_command_failed.connect(self._scheduler_failed)
+
+    def detach_scheduler(self) -> None:
+        if self.scheduler is None:
+            return
+        self.scheduler.signal_send.disconnect(self._scheduler_sent)
+        self.scheduler.signal_command_completed.disconnect(self._scheduler_completed)
+        self.scheduler.signal_command_failed.disconnect(self._scheduler_failed)
+        self.scheduler = None
+
+    def run_script(self, lines: Iterable[str], **kwargs) -> List[Command]:
+        """
+        Submit each line of a script to the attached scheduler, kwargs are passed to `CommandScheduler.submit_script`.
+        """
+        if self.scheduler is None:
+            raise Exception("A scheduler must be attached to run a script.")
+        return self.scheduler.submit_script(lines, **kwargs)
+
+    def _scheduler_sent(self, command: str) -> None:
+        self.signal_command_entered.emit(command)
+        self.insert_message(f"Sent: {command}")
+
+    def _scheduler_completed(self, command: Command) -> None:
+        self.insert_message(f"Reply: {command.reply} ({command.latency * 1000:.1f} ms)")
+
+    def _scheduler_failed(self, command: Command) -> None:
+        self.insert_message(f"Timed out: {command.text} after {command.attempts} attempt(s)")
+
     def insert_message(self, message: str) -> None:
         """
         Inserts a message into the TextEdit widget.
         """
         self.message_widget.append(message)
 
+    def insert_messages(self, messages: Iterable[str]) -> None:
+        """
+        Inserts multiple messages into the TextEdit widget, in console mode this is a single batch.
+        """
+        if isinstance(self.message_widget, ConsoleWidget):
+            self.message_widget.append_lines(messages)
+            return
+        for message in messages:
+            self.message_widget.append(message)
+
+    def insert_text(self, text: str) -> None:
+        """
+        Inserts a raw chunk of text, split into lines on `\\n`.
+        In console mode an incomplete trailing line is held until the rest arrives.
+        """
+        if isinstance(self.message_widget, ConsoleWidget):
+            self.message_widget.write(text)
+            return
+        self.insert_messages(text.splitlines())
+
+    def set_follow(self, follow: bool = True) -> None:
+        """
+        Set whether the console scrolls to the newest message. Only applies in console mode.
+        """
+        if isinstance(self.message_widget, ConsoleWidget):
+            self.message_widget.set_follow(follow)
+
     def clear(self) -> None:
         """
         Clear the TextEdit widget.
@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Optional
 
 from PySide6.QtCore import Signal
 from PySide6.QtWidgets import (
@@ -12,6 +12,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from .ports import DEFAULT_POLL_INTERVAL_MS, PortWatcher
+
 
 class SerialConnectionWidget(QWidget):
     """
@@ -22,6 +24,9 @@ class SerialConnectionWidget(QWidget):
     When the `Connect` button is pressed a `connection_requested` signal is emitted.
     The signal emits the port and `connection_flag` status.
     When connected the `connection_flag` will be set to `True`.
+
+    Call `watch_ports` to keep the ComboBox up to date in the background, ports are enumerated off the GUI thread
+    and plugged / removed ports are emitted through `port_watcher`.
     """
 
     signal_connection_requested = Signal(bool, str)
@@ -29,6 +34,7 @@ class SerialConnectionWidget(QWidget):
     def __init__(self, parent: QWidget, *args, **kwargs) -> None:
         super().__init__(parent=parent, *args, **kwargs)
         self._connected_flag = False
+        self.port_watcher: Optional[PortWatcher] = None
 
         self.connection_layout = QHBoxLayout(self)
         self.connection_layout.setContentsMargins(0, 0, 0, 0)
@@ -49,8 +55,34 @@ class SerialConnectionWidget(QWidget):
     def populate_ports(self, ports: List[str]) -> None:
         """
         Populate combobox with port addresses.
+        Only missing ports are inserted and stale ports removed, so repeated calls keep the current selection.
+        """
+        wanted = set(ports)
+        for index in reversed(range(self.port_cbox.count())):
+            if self.port_cbox.itemText(index) not in wanted:
+                self.port_cbox.removeItem(index)
+
+        existing = {self.port_cbox.itemText(index) for index in range(self.port_cbox.count())}
+        for index, port in enumerate(ports):
+            if port not in existing:
+                self.port_cbox.insertItem(index, port)
+
+    def watch_ports(self, interval: int = DEFAULT_POLL_INTERVAL_MS) -> PortWatcher:
+        """
+        Start polling for ports in the background, the ComboBox is updated whenever the list changes.
+        Returns the watcher, for connecting to its hot-plug signals.
         """
-        self.port_cbox.addItems(ports)
+        if self.port_watcher is None:
+            self.port_watcher = PortWatcher(interval=interval, parent=self)
+            self.port_watcher.signal_ports_changed.connect(self.populate_ports)
+        else:
+            self.port_watcher.set_interval(interval)
+        self.port_watcher.start()
+        return self.port_watcher
+
+    def stop_watching_ports(self) -> None:
+        if self.port_watcher is not None:
+            self.port_watcher.stop()
 
     def update_status(self, string: str) -> None:
         """
@@ -0,0 +1,135 @@
+from typing import Iterable, List
+
+from PySide6.QtCore import QTimer, Signal
+from PySide6.QtWidgets import QPlainTextEdit, QWidget
+
+DEFAULT_FLUSH_INTERVAL_MS = 50  # Time between batched inserts, ~20 updates a second.
+DEFAULT_MAX_BLOCKS = 10000  # Lines of scrollback kept, 0 is unbounded.
+
+
+class ConsoleWidget(QPlainTextEdit):
+    """
+    A read only QPlainTextEdit for high throughput text streams.
+
+    Incoming lines are buffered and inserted in one batch on a timer, rather than relaying out
+    the document for each line. The scrollback is capped to `max_blocks` lines, older lines are discarded.
+
+    When `follow` is set the view scrolls to the newest line on each flush, otherwise the view is left in place.
+    """
+
+    signal_follow_changed = Signal(bool)
+
+    def __init__(
+        self,
+        parent: QWidget = None,
+        max_blocks: int = DEFAULT_MAX_BLOCKS,
+        flush_interval: int = DEFAULT_FLUSH_INTERVAL_MS,
+        *args,
+        **kwargs,
+    ) -> None:
+        super().__init__(parent=parent, *args, **kwargs)
+        self._pending: List[str] = []
+        self._partial_line = ""
+        self._follow = True
+
+        self.setReadOnly(True)
+        self.setUndoRedoEnabled(False)
+        self.setMaximumBlockCount(max_blocks)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setInterval(flush_interval)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def append(self, message: str) -> None:
+        """
+        Queue a line to be inserted on the next flush.
+        """
+        self._pending.append(message)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def append_lines(self, messages: Iterable[str]) -> None:
+        """
+        Queue multiple lines to be inserted on the next flush.
+        """
+        self._pending.extend(messages)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def write(self, text: str) -> None:
+        """
+        Queue a raw chunk of text, such as a read from a serial port.
+        Lines are split on `\\n`, an incomplete trailing line is held until the rest of it arrives.
+        """
+        lines = (self._partial_line + text).split("\n")
+        self._partial_line = lines.pop()
+        if lines:
+            self.append_lines(lines)
+
+    def flush(self) -> None:
+        """
+        Insert all pending lines in a single edit. Stops the flush timer when nothing is pending.
+        """
+        if not self._pending:
+            self._flush_timer.stop()
+            return
+
+        lines = self._pending
+        self._pending = []
+
+        # Lines beyond the scrollback limit would be discarded immediately, so never insert them.
+        max_blocks = self.maximumBlockCount()
+        if max_blocks > 0 and len(lines) > max_blocks:
+            lines = lines[-max_blocks:]
+
+        scrollbar = self.verticalScrollBar()
+        position = scrollbar.value()
+
+        self.appendPlainText("\n".join(lines))
+
+        if self._follow:
+            scrollbar.setValue(scrollbar.maximum())
+        else:
+            scrollbar.setValue(position)
+
+    def set_follow(self, follow: bool = True) -> None:
+        """
+        Set whether the view scrolls to the newest line when lines are inserted.
+        """
+        if follow == self._follow:
+            return
+        self._follow = follow
+        if follow:
+            scrollbar = self.verticalScrollBar()
+            scrollbar.setValue(scrollbar.maximum())
+        self.signal_follow_changed.emit(follow)
+
+    def is_following(self) -> bool:
+        return self._follow
+
+    def set_max_blocks(self, max_blocks: int) -> None:
+        """
+        Set the number of lines of scrollback kept, 0 is unbounded.
+        """
+        self.setMaximumBlockCount(max_blocks)
+
+    def set_flush_interval(self, interval: int) -> None:
+        """
+        Set the time between flushes in milliseconds.
+        """
+        self._flush_timer.setInterval(interval)
+
+    def pending_count(self) -> int:
+        """
+        Number of lines waiting to be inserted.
+        """
+        return len(self._pending)
+
+    def clear(self) -> None:
+        """
+        Clear the displayed text and discard anything pending.
+        """
+        self._pending = []
+        self._partial_line = ""
+        self._flush_timer.stop()
+        super().clear()
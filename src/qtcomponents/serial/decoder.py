@@ -0,0 +1,316 @@
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+from PySide6.QtCore import QObject, Signal
+
+DEFAULT_BUFFER_CAPACITY = 1 << 20  # 1 MiB of unparsed stream.
+DEFAULT_MAX_BATCH = 4096  # Frames validated per vectorized pass.
+
+CrcFunction = Callable[[np.ndarray], np.ndarray]
+
+
+class ByteRingBuffer:
+    """
+    A fixed capacity byte buffer for accumulating a serial stream.
+
+    The unread region is always contiguous, so it can be viewed as a memoryview or numpy array without copying.
+    When the write position reaches the end, the unread tail (usually less than a frame) is moved to the front.
+    If a write would exceed the capacity the oldest bytes are discarded, and counted in `dropped`.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_BUFFER_CAPACITY) -> None:
+        self._buffer = bytearray(capacity)
+        self._start = 0
+        self._end = 0
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def capacity(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def buffer(self) -> bytearray:
+        """
+        The underlying storage, valid data lies between `offset` and `offset + len(self)`.
+        """
+        return self._buffer
+
+    @property
+    def offset(self) -> int:
+        return self._start
+
+    def write(self, data: bytes | bytearray | memoryview) -> None:
+        """
+        Append data to the buffer.
+        """
+        size = len(data)
+        capacity = self.capacity
+        if size >= capacity:
+            # Only the newest bytes can be kept.
+            self.dropped += len(self) + size - capacity
+            self._buffer[:] = data[size - capacity :]
+            self._start, self._end = 0, capacity
+            return
+
+        if self._end + size > capacity:
+            overflow = len(self) + size - capacity
+            if overflow > 0:
+                self.dropped += overflow
+                self._start += overflow
+            # Move the unread region to the front.
+            length = len(self)
+            self._buffer[:length] = self._buffer[self._start : self._end]
+            self._start, self._end = 0, length
+
+        self._buffer[self._end : self._end + size] = data
+        self._end += size
+
+    def view(self) -> memoryview:
+        """
+        A memoryview of the unread bytes, release it before the next `write`.
+        """
+        return memoryview(self._buffer)[self._start : self._end]
+
+    def find(self, sub: bytes, start: int = 0) -> int:
+        """
+        Find `sub` in the unread bytes, from `start` relative to the read position. Returns -1 if not found.
+        """
+        index = self._buffer.find(sub, self._start + start, self._end)
+        return index - self._start if index >= 0 else -1
+
+    def consume(self, size: int) -> None:
+        """
+        Mark `size` bytes as read.
+        """
+        self._start = min(self._start + size, self._end)
+        if self._start == self._end:
+            self._start = self._end = 0
+
+    def clear(self) -> None:
+        self._start = self._end = 0
+
+
+def _crc16_table(poly: int, reflected: bool) -> np.ndarray:
+    table = np.zeros(256, dtype=np.uint16)
+    for byte in range(256):
+        if reflected:
+            crc = byte
+            for _ in range(8):
+                crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+        else:
+            crc = byte << 8
+            for _ in range(8):
+                crc = ((crc << 1) ^ poly if crc & 0x8000 else crc << 1) & 0xFFFF
+        table[byte] = crc
+    return table
+
+
+_CRC16_CCITT_TABLE = _crc16_table(0x1021, reflected=False)
+_CRC16_MODBUS_TABLE = _crc16_table(0xA001, reflected=True)
+
+
+def crc16_ccitt(frames: np.ndarray) -> np.ndarray:
+    """
+    CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) of each row of a 2D uint8 array.
+    Vectorized across rows, so the Python loop is over frame length rather than frame count.
+    """
+    crc = np.full(frames.shape[0], 0xFFFF, dtype=np.uint16)
+    for column in frames.T:
+        crc = (crc << 8) ^ _CRC16_CCITT_TABLE[(crc >> 8) ^ column]
+    return crc
+
+
+def crc16_modbus(frames: np.ndarray) -> np.ndarray:
+    """
+    CRC-16/MODBUS (reflected poly 0xA001, init 0xFFFF) of each row of a 2D uint8 array.
+    """
+    crc = np.full(frames.shape[0], 0xFFFF, dtype=np.uint16)
+    for column in frames.T:
+        crc = (crc >> 8) ^ _CRC16_MODBUS_TABLE[(crc ^ column) & 0xFF]
+    return crc
+
+
+CRC_FUNCTIONS: Dict[str, CrcFunction] = {
+    "crc16-ccitt": crc16_ccitt,
+    "crc16-modbus": crc16_modbus,
+}
+
+
+class FrameFormat:
+    """
+    Layout of a fixed size binary frame: `sync | length | payload | crc`.
+
+    Parameters
+    ----------
+    sync: bytes
+        Sync word marking the start of a frame.
+    payload: np.dtype
+        Structured dtype of the payload, the field names become the decoded column names.
+    length_dtype: Optional[str]
+        Dtype of the length field, None if the frame has no length field.
+    length_value: Optional[int]
+        Expected value of the length field, defaults to the payload size in bytes.
+    crc: Optional[str | CrcFunction]
+        Name from `CRC_FUNCTIONS` or a function mapping a 2D uint8 array to one value per row. None disables the check.
+    crc_dtype: str
+        Dtype of the crc field.
+    crc_covers_sync: bool
+        Whether the sync word is included in the crc, otherwise the crc covers length and payload.
+    """
+
+    def __init__(
+        self,
+        sync: bytes,
+        payload: np.dtype | List,
+        length_dtype: Optional[str] = "<u2",
+        length_value: Optional[int] = None,
+        crc: Optional[str | CrcFunction] = "crc16-ccitt",
+        crc_dtype: str = "<u2",
+        crc_covers_sync: bool = False,
+    ) -> None:
+        self.sync = bytes(sync)
+        self.payload = np.dtype(payload)
+        if self.payload.names is None:
+            raise TypeError("Payload dtype must be a structured dtype with field names.")
+
+        self.crc: Optional[CrcFunction] = CRC_FUNCTIONS[crc] if isinstance(crc, str) else crc
+        self.length_value = self.payload.itemsize if length_value is None else length_value
+
+        fields = [("_sync", f"V{len(self.sync)}")]
+        if length_dtype is not None:
+            fields.append(("_length", length_dtype))
+        fields.append(("_payload", self.payload))
+        if self.crc is not None:
+            fields.append(("_crc", crc_dtype))
+        self.dtype = np.dtype(fields)
+        self.has_length = length_dtype is not None
+
+        # Byte range the crc is computed over.
+        self.crc_start = 0 if crc_covers_sync else len(self.sync)
+        self.crc_end = self.dtype.fields["_crc"][1] if self.crc is not None else 0  # type: ignore
+
+    @property
+    def size(self) -> int:
+        return self.dtype.itemsize
+
+
+class FrameDecoder(QObject):
+    """
+    Decodes a byte stream into batches of frames, as a numpy structured array of the payload dtype.
+
+    Bytes are accumulated in a `ByteRingBuffer`. Runs of consecutive frames are mapped onto the buffer with
+    `np.frombuffer` and validated together (sync, length and crc) with vectorized numpy, bytes are never sliced
+    one at a time. Only valid payloads are copied out, once per batch, so the buffer can be reused.
+
+    The decoded array can be passed to `DataTable.set_data`, or its fields used directly as plot data.
+    Each non empty batch is also emitted through `signal_frames_decoded`.
+    """
+
+    signal_frames_decoded = Signal(np.ndarray)
+
+    def __init__(
+        self,
+        frame_format: FrameFormat,
+        capacity: int = DEFAULT_BUFFER_CAPACITY,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.format = frame_format
+        self.ring = ByteRingBuffer(capacity)
+        self.max_batch = max_batch
+        self.frames_decoded = 0
+        self.frames_rejected = 0
+        self.bytes_skipped = 0
+
+    def feed(self, data: bytes | bytearray | memoryview) -> np.ndarray:
+        """
+        Add data to the stream and decode every complete frame available.
+        Returns the decoded payloads, which may be empty.
+        """
+        self.ring.write(data)
+        frames = self.decode()
+        if len(frames):
+            self.signal_frames_decoded.emit(frames)
+        return frames
+
+    def decode(self) -> np.ndarray:
+        """
+        Decode every complete frame held in the buffer, leaving any incomplete frame for the next call.
+        """
+        frame_format = self.format
+        sync = frame_format.sync
+        frame_size = frame_format.size
+        ring = self.ring
+        batches: List[np.ndarray] = []
+
+        position = 0
+        while True:
+            index = ring.find(sync, position)
+            if index < 0:
+                # Keep a possible partial sync word at the end.
+                keep = min(len(sync) - 1, len(ring) - position)
+                self._skip(len(ring) - keep - position)
+                position = len(ring) - keep
+                break
+            self._skip(index - position)
+
+            count = min((len(ring) - index) // frame_size, self.max_batch)
+            if count == 0:
+                position = index
+                break
+
+            frames = np.frombuffer(ring.buffer, dtype=frame_format.dtype, count=count, offset=ring.offset + index)
+            valid = self._validate(frames, index, count)
+            run = count if valid.all() else int(np.argmin(valid))
+
+            if run == 0:
+                # False sync, search again from the next byte.
+                self.frames_rejected += 1
+                self._skip(1)
+                position = index + 1
+                continue
+
+            batches.append(frames["_payload"][:run].copy())
+            self.frames_decoded += run
+            position = index + run * frame_size
+
+        ring.consume(position)
+
+        if not batches:
+            return np.empty(0, dtype=frame_format.payload)
+        if len(batches) == 1:
+            return batches[0]
+        return np.concatenate(batches)
+
+    def _validate(self, frames: np.ndarray, index: int, count: int) -> np.ndarray:
+        frame_format = self.format
+        sync = np.frombuffer(frame_format.sync, dtype=frame_format.dtype["_sync"])[0]
+        valid = frames["_sync"] == sync
+        if frame_format.has_length:
+            valid &= frames["_length"] == frame_format.length_value
+        if frame_format.crc is not None:
+            raw = np.frombuffer(
+                self.ring.buffer,
+                dtype=np.uint8,
+                count=count * frame_format.size,
+                offset=self.ring.offset + index,
+            ).reshape(count, frame_format.size)
+            valid &= frame_format.crc(raw[:, frame_format.crc_start : frame_format.crc_end]) == frames["_crc"]
+        return valid
+
+    def _skip(self, size: int) -> None:
+        if size > 0:
+            self.bytes_skipped += size
+
+    def reset(self) -> None:
+        """
+        Discard buffered bytes and reset the counters.
+        """
+        self.ring.clear()
+        self.frames_decoded = 0
+        self.frames_rejected = 0
+        self.bytes_skipped = 0
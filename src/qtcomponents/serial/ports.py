@@ -0,0 +1,139 @@
+import logging
+from typing import Callable, List, Optional
+
+from PySide6.QtCore import QObject, QThreadPool, QTimer, Signal
+from PySide6.QtSerialPort import QSerialPortInfo
+
+DEFAULT_POLL_INTERVAL_MS = 1000
+
+logger = logging.getLogger(__name__)
+
+
+def available_ports() -> List[str]:
+    """
+    Names of the serial ports currently available on the system.
+    """
+    return [info.portName() for info in QSerialPortInfo.availablePorts()]
+
+
+def diff_ports(previous: List[str], current: List[str]) -> tuple[List[str], List[str]]:
+    """
+    Compare two port lists, order is kept from the list each port came from.
+
+    Returns
+    ----------
+    added, removed
+    """
+    previous_set = set(previous)
+    current_set = set(current)
+    added = [port for port in current if port not in previous_set]
+    removed = [port for port in previous if port not in current_set]
+    return added, removed
+
+
+class PortWatcher(QObject):
+    """
+    Polls for available serial ports on a worker thread, so slow enumeration never blocks the GUI thread.
+
+    After each enumeration the result is compared with the last known list,
+    and signals are only emitted when a port has been plugged in or removed.
+
+    A custom `enumerate_ports` function can be given, by default `QSerialPortInfo` is used.
+
+    A failed enumeration is logged to the `qtcomponents.serial.ports` logger and emitted with `signal_error`,
+    the last known ports are kept. A failure repeating every poll is only reported again once enumeration
+    has succeeded in between.
+    """
+
+    signal_ports_changed = Signal(list)
+    signal_port_added = Signal(str)
+    signal_port_removed = Signal(str)
+    signal_error = Signal(object)  # Exception raised by the enumeration.
+
+    # Carries enumeration results from the worker thread back to the thread owning the watcher.
+    _signal_enumerated = Signal(object)
+
+    def __init__(
+        self,
+        interval: int = DEFAULT_POLL_INTERVAL_MS,
+        enumerate_ports: Optional[Callable[[], List[str]]] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self._enumerate_ports = enumerate_ports if enumerate_ports is not None else available_ports
+        self._ports: List[str] = []
+        self._pending = False
+        self._error: Optional[str] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.refresh)
+        self._signal_enumerated.connect(self._apply)
+
+    @property
+    def ports(self) -> List[str]:
+        """
+        The last enumerated list of ports.
+        """
+        return list(self._ports)
+
+    def start(self) -> None:
+        """
+        Enumerate now, then keep polling every interval.
+        """
+        self.refresh()
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def set_interval(self, interval: int) -> None:
+        self._timer.setInterval(interval)
+
+    def refresh(self) -> None:
+        """
+        Request an enumeration on the thread pool. Ignored if one is already running.
+        """
+        if self._pending:
+            return
+        self._pending = True
+        QThreadPool.globalInstance().start(self._enumerate)
+
+    def _enumerate(self) -> None:
+        # Runs on a pool thread, only the signal emit crosses back.
+        result: List[str] | Exception
+        try:
+            result = list(self._enumerate_ports())
+        except Exception as error:
+            result = error
+        try:
+            self._signal_enumerated.emit(result)
+        except RuntimeError:
+            # The watcher was deleted while enumerating.
+            pass
+
+    def _apply(self, ports: List[str] | Exception) -> None:
+        self._pending = False
+        if isinstance(ports, Exception):
+            self._report(ports)
+            return
+        self._error = None
+
+        added, removed = diff_ports(self._ports, ports)
+        if not added and not removed:
+            return
+
+        self._ports = ports
+        for port in removed:
+            self.signal_port_removed.emit(port)
+        for port in added:
+            self.signal_port_added.emit(port)
+        self.signal_ports_changed.emit(list(ports))
+
+    def _report(self, error: Exception) -> None:
+        description = f"{type(error).__name__}: {error}"
+        if description == self._error:
+            return
+        self._error = description
+        logger.error("Serial port enumeration failed, keeping the last known ports.", exc_info=error)
+        self.signal_error.emit(error)
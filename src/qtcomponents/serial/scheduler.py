@@ -0,0 +1,282 @@
+import re
+import time
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, Iterable, List, Optional, Pattern
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+DEFAULT_MAX_OUTSTANDING = 4
+DEFAULT_TIMEOUT = 1.0  # Seconds
+DEFAULT_ID_PATTERN = r"^(?P<id>\d+)"
+
+
+class CommandStatus(Enum):
+    Queued = 0
+    Sent = 1
+    Completed = 2
+    TimedOut = 3
+    Cancelled = 4
+
+
+class Command:
+    """
+    A command submitted to a `CommandScheduler`, updated in place as it progresses.
+
+    Parameters
+    ----------
+    text: str
+        Command to send.
+    response: Optional[str | Pattern]
+        Regex a received line must match to complete the command. None matches any line.
+        Ignored when the scheduler matches responses by ID.
+    timeout: float
+        Seconds to wait for a response before retrying or failing.
+    retries: int
+        Number of times to resend after a timeout.
+    """
+
+    def __init__(
+        self,
+        text: str,
+        response: Optional[str | Pattern] = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int = 0,
+    ) -> None:
+        self.text = text
+        self.response: Optional[Pattern] = re.compile(response) if isinstance(response, str) else response
+        self.timeout = timeout
+        self.retries = retries
+
+        self.id: int = -1
+        self.status = CommandStatus.Queued
+        self.attempts = 0
+        self.sent_at: Optional[float] = None
+        self.deadline: Optional[float] = None
+        self.reply: Optional[str] = None
+        self.match: Optional[re.Match] = None
+        self.latency: Optional[float] = None
+
+    def __repr__(self) -> str:
+        return f"Command({self.text!r}, id={self.id}, status={self.status.name})"
+
+    def matches(self, line: str) -> bool:
+        if self.response is None:
+            self.match = None
+            return True
+        self.match = self.response.search(line)
+        return self.match is not None
+
+
+class CommandScheduler(QObject):
+    """
+    Pipelines commands to a device, keeping up to `max_outstanding` commands awaiting a reply.
+
+    Connect `signal_send` to whatever writes to the device, and pass every received line to `feed_response`.
+    Replies are matched to outstanding commands either by each command's `response` pattern, oldest first,
+    or by ID when `id_format` is given, eg: `id_format="{id} {text}"` with replies like `"12 OK"`.
+
+    Commands that time out are resent up to their `retries`, then fail through `signal_command_failed`.
+    The round trip latency of each completed command is stored on `Command.latency`.
+    """
+
+    signal_send = Signal(str)
+    signal_command_completed = Signal(object)
+    signal_command_failed = Signal(object)
+    signal_unmatched = Signal(str)
+    signal_idle = Signal()
+
+    def __init__(
+        self,
+        max_outstanding: int = DEFAULT_MAX_OUTSTANDING,
+        default_timeout: float = DEFAULT_TIMEOUT,
+        id_format: Optional[str] = None,
+        id_pattern: str | Pattern = DEFAULT_ID_PATTERN,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.max_outstanding = max_outstanding
+        self.default_timeout = default_timeout
+        self.id_format = id_format
+        self.id_pattern: Pattern = re.compile(id_pattern) if isinstance(id_pattern, str) else id_pattern
+
+        self._next_id = 0
+        self._queue: Deque[Command] = deque()
+        self._outstanding: List[Command] = []
+
+        self._timeout_timer = QTimer(self)
+        self._timeout_timer.setSingleShot(True)
+        self._timeout_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timeout_timer.timeout.connect(self._check_timeouts)
+
+    @property
+    def outstanding(self) -> List[Command]:
+        return list(self._outstanding)
+
+    def pending_count(self) -> int:
+        """
+        Number of commands queued or awaiting a reply.
+        """
+        return len(self._queue) + len(self._outstanding)
+
+    def submit(
+        self,
+        text: str,
+        response: Optional[str | Pattern] = None,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+    ) -> Command:
+        """
+        Queue a command, it is sent as soon as there is a free slot.
+        """
+        command = Command(text, response, self.default_timeout if timeout is None else timeout, retries)
+        return self.submit_command(command)
+
+    def submit_command(self, command: Command) -> Command:
+        command.id = self._next_id
+        self._next_id += 1
+        command.status = CommandStatus.Queued
+        self._queue.append(command)
+        self._send_queued()
+        return command
+
+    def submit_script(
+        self,
+        lines: Iterable[str],
+        response: Optional[str | Pattern] = None,
+        timeout: Optional[float] = None,
+        retries: int = 0,
+    ) -> List[Command]:
+        """
+        Queue each non-empty line of a script as a command, they share the given response / timeout / retries.
+        """
+        return [self.submit(line, response, timeout, retries) for line in (line.strip() for line in lines) if line]
+
+    def feed_response(self, line: str) -> Optional[Command]:
+        """
+        Match a received line against the outstanding commands.
+        Returns the completed command, or None if no command matched.
+        """
+        command = self._match(line)
+        if command is None:
+            self.signal_unmatched.emit(line)
+            return None
+
+        now = time.perf_counter()
+        self._outstanding.remove(command)
+        command.status = CommandStatus.Completed
+        command.reply = line
+        command.latency = now - command.sent_at  # type: ignore
+        self.signal_command_completed.emit(command)
+
+        self._send_queued()
+        self._schedule_timeout()
+        return command
+
+    def cancel_all(self) -> None:
+        """
+        Drop queued and outstanding commands, replies that arrive later are reported unmatched.
+        """
+        for command in [*self._outstanding, *self._queue]:
+            command.status = CommandStatus.Cancelled
+        self._outstanding.clear()
+        self._queue.clear()
+        self._timeout_timer.stop()
+
+    def _match(self, line: str) -> Optional[Command]:
+        if self.id_format is not None:
+            match = self.id_pattern.search(line)
+            if match is None:
+                return None
+            command_id = int(match.group("id"))
+            for command in self._outstanding:
+                if command.id == command_id:
+                    command.match = match
+                    return command
+            return None
+
+        for command in self._outstanding:
+            if command.matches(line):
+                return command
+        return None
+
+    def _send_queued(self) -> None:
+        sent = False
+        while self._queue and len(self._outstanding) < self.max_outstanding:
+            command = self._queue.popleft()
+            self._outstanding.append(command)
+            self._send(command)
+            sent = True
+
+        if sent:
+            self._schedule_timeout()
+        elif not self._outstanding and not self._queue:
+            self.signal_idle.emit()
+
+    def _send(self, command: Command) -> None:
+        command.attempts += 1
+        command.status = CommandStatus.Sent
+        command.sent_at = time.perf_counter()
+        command.deadline = command.sent_at + command.timeout
+        text = command.text if self.id_format is None else self.id_format.format(id=command.id, text=command.text)
+        self.signal_send.emit(text)
+
+    def _schedule_timeout(self) -> None:
+        if not self._outstanding:
+            self._timeout_timer.stop()
+            return
+        deadline = min(command.deadline for command in self._outstanding)  # type: ignore
+        remaining = max(0, deadline - time.perf_counter())
+        self._timeout_timer.start(int(remaining * 1000) + 1)
+
+    def _check_timeouts(self) -> None:
+        now = time.perf_counter()
+        for command in [command for command in self._outstanding if command.deadline <= now]:  # type: ignore
+            if command.attempts <= command.retries:
+                self._send(command)
+                continue
+            self._outstanding.remove(command)
+            command.status = CommandStatus.TimedOut
+            self.signal_command_failed.emit(command)
+
+        self._send_queued()
+        self._schedule_timeout()
+
+
+class LoopbackDevice(QObject):
+    """
+    A local stand-in for a serial device, for exercising a `CommandScheduler` without hardware.
+
+    Each written command is passed to `respond`, the returned line (or lines) is emitted
+    through `signal_received` after `delay` milliseconds. Returning None sends no reply.
+    By default the command is echoed back.
+    """
+
+    signal_received = Signal(str)
+
+    def __init__(
+        self,
+        respond: Optional[Callable[[str], Optional[str | List[str]]]] = None,
+        delay: int = 0,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.respond = respond if respond is not None else (lambda command: command)
+        self.delay = delay
+        self.received: List[str] = []
+
+    def write(self, command: str) -> None:
+        self.received.append(command)
+        reply = self.respond(command)
+        if reply is None:
+            return
+        lines = [reply] if isinstance(reply, str) else list(reply)
+        QTimer.singleShot(self.delay, self, lambda: self._reply(lines))
+
+    def _reply(self, lines: List[str]) -> None:
+        for line in lines:
+            self.signal_received.emit(line)
+
+    def connect_scheduler(self, scheduler: CommandScheduler) -> None:
+        scheduler.signal_send.connect(self.write)
+        self.signal_received.connect(scheduler.feed_response)
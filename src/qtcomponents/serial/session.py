@@ -0,0 +1,300 @@
+import bisect
+import mmap
+import struct
+import time
+from enum import Enum
+from pathlib import Path
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+MAGIC = b"QTCSESS1"
+FILE_HEADER = struct.Struct("<8sd")  # magic, wall clock start time
+RECORD_HEADER = struct.Struct("<dIB")  # seconds since start, payload length, direction
+INDEX_ENTRY = struct.Struct("<QdI")  # file offset, timestamp of first record, records in chunk
+INDEX_SUFFIX = ".idx"
+
+DEFAULT_CHUNK_SIZE = 64 * 1024  # Bytes of log between index entries.
+AS_FAST_AS_POSSIBLE = 0.0
+DEFAULT_REPLAY_BATCH = 1024  # Records emitted per event loop pass when replaying as fast as possible.
+
+
+class Direction(Enum):
+    Received = 0
+    Sent = 1
+
+
+def index_path(path: Path) -> Path:
+    """
+    Path of the chunk index written alongside a session log.
+    """
+    return path.with_suffix(path.suffix + INDEX_SUFFIX)
+
+
+class SessionRecorder:
+    """
+    Records a serial session to a compact, append-only binary log.
+
+    Each record is a 13 byte header (timestamp, length, direction) followed by the raw bytes.
+    Every `chunk_size` bytes an entry is appended to a sidecar index (`<path>.idx`), so a reader can seek by time
+    without scanning the log.
+
+    Can be used as a context manager.
+    """
+
+    def __init__(self, path: Path, chunk_size: int = DEFAULT_CHUNK_SIZE) -> None:
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self._start = time.perf_counter()
+
+        self._file: BinaryIO = open(self.path, "wb")
+        self._index: BinaryIO = open(index_path(self.path), "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, time.time()))
+        self._offset = FILE_HEADER.size
+
+        self._chunk_offset = self._offset
+        self._chunk_timestamp = 0.0
+        self._chunk_count = 0
+
+    def __enter__(self) -> "SessionRecorder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def record(self, data: bytes, direction: Direction = Direction.Received, timestamp: Optional[float] = None) -> None:
+        """
+        Append data to the log. The timestamp defaults to seconds since the recorder was created.
+        """
+        if timestamp is None:
+            timestamp = time.perf_counter() - self._start
+
+        if self._chunk_count == 0:
+            self._chunk_offset = self._offset
+            self._chunk_timestamp = timestamp
+
+        self._file.write(RECORD_HEADER.pack(timestamp, len(data), direction.value))
+        self._file.write(data)
+        self._offset += RECORD_HEADER.size + len(data)
+        self._chunk_count += 1
+
+        if self._offset - self._chunk_offset >= self.chunk_size:
+            self._write_index_entry()
+
+    def record_received(self, data: bytes) -> None:
+        self.record(data, Direction.Received)
+
+    def record_sent(self, data: bytes | str) -> None:
+        self.record(data.encode() if isinstance(data, str) else data, Direction.Sent)
+
+    def flush(self) -> None:
+        self._file.flush()
+        self._index.flush()
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if self._chunk_count:
+            self._write_index_entry()
+        self._file.close()
+        self._index.close()
+
+    def _write_index_entry(self) -> None:
+        self._index.write(INDEX_ENTRY.pack(self._chunk_offset, self._chunk_timestamp, self._chunk_count))
+        self._chunk_count = 0
+
+
+class SessionReader:
+    """
+    Reads a session log through a memory map, records are returned as memoryviews into the map without copying.
+
+    If the chunk index is missing (eg: the recorder was not closed) the log is still readable from the start,
+    `seek` then falls back to a scan.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, self.start_time = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise Exception(f"Not a session log: {self.path}")
+
+        self._index: List[Tuple[int, float, int]] = []
+        if index_path(self.path).exists():
+            raw = index_path(self.path).read_bytes()
+            usable = len(raw) - len(raw) % INDEX_ENTRY.size
+            self._index = list(INDEX_ENTRY.iter_unpack(raw[:usable]))
+        self._index_timestamps = [entry[1] for entry in self._index]
+
+    def __enter__(self) -> "SessionReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._map.closed:
+            return
+        self._map.close()
+        self._file.close()
+
+    def records(self, offset: int = FILE_HEADER.size) -> Iterator[Tuple[float, Direction, memoryview]]:
+        """
+        Iterate (timestamp, direction, data) from a file offset. A truncated final record is ignored.
+        Release the memoryviews before closing the reader.
+        """
+        view = memoryview(self._map)
+        size = len(self._map)
+        header_size = RECORD_HEADER.size
+        directions = list(Direction)
+        try:
+            while offset + header_size <= size:
+                timestamp, length, direction = RECORD_HEADER.unpack_from(self._map, offset)
+                start = offset + header_size
+                end = start + length
+                if end > size:
+                    return
+                yield timestamp, directions[direction], view[start:end]
+                offset = end
+        finally:
+            view.release()
+
+    def offset_of(self, timestamp: float) -> int:
+        """
+        File offset to start reading from so that no record at or after `timestamp` is missed.
+        """
+        if not self._index:
+            return FILE_HEADER.size
+        position = bisect.bisect_right(self._index_timestamps, timestamp) - 1
+        return self._index[max(position, 0)][0]
+
+    def duration(self) -> float:
+        """
+        Timestamp of the last record.
+        """
+        offset = self._index[-1][0] if self._index else FILE_HEADER.size
+        last = 0.0
+        for timestamp, _, data in self.records(offset):
+            last = timestamp
+            data.release()
+        return last
+
+
+class SessionPlayer(QObject):
+    """
+    Replays a session log through signals, so it can be connected to the same widgets and decoders as a live port.
+
+    `speed` scales the recorded timing, eg: 1.0 or 10.0, `AS_FAST_AS_POSSIBLE` emits without waiting,
+    yielding to the event loop every `batch` records. Consecutive records in the same direction that are due together
+    are joined into one emit.
+
+    Example
+    ----------
+    player = SessionPlayer(path, speed=10.0)
+    player.signal_received.connect(decoder.feed)
+    player.signal_received.connect(lambda data: command_widget.insert_text(data.decode(errors="replace")))
+    player.play()
+    """
+
+    signal_received = Signal(bytes)
+    signal_sent = Signal(bytes)
+    signal_position = Signal(float)
+    signal_finished = Signal()
+
+    def __init__(
+        self,
+        path: Path,
+        speed: float = 1.0,
+        batch: int = DEFAULT_REPLAY_BATCH,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.reader = SessionReader(path)
+        self.speed = speed
+        self.batch = batch
+
+        self._records: Optional[Iterator[Tuple[float, Direction, memoryview]]] = None
+        self._next: Optional[Tuple[float, Direction, memoryview]] = None
+        self._origin = 0.0
+        self._clock_start = 0.0
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._tick)
+
+    def play(self, start: float = 0.0) -> None:
+        """
+        Replay from `start` seconds into the session.
+        """
+        self.stop()
+        self._records = self.reader.records(self.reader.offset_of(start))
+        self._next = next(self._records, None)
+        while self._next is not None and self._next[0] < start:
+            self._next = next(self._records, None)
+        self._origin = start
+        self._clock_start = time.perf_counter()
+        self._timer.start(0)
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._next = None
+        if self._records is not None:
+            self._records.close()  # type: ignore
+            self._records = None
+
+    def is_playing(self) -> bool:
+        return self._records is not None
+
+    def close(self) -> None:
+        self.stop()
+        self.reader.close()
+
+    def _tick(self) -> None:
+        if self._records is None:
+            return
+
+        if self.speed == AS_FAST_AS_POSSIBLE:
+            due = float("inf")
+        else:
+            due = self._origin + (time.perf_counter() - self._clock_start) * self.speed
+
+        chunks: List[bytes] = []
+        direction: Optional[Direction] = None
+        emitted = 0
+        last_timestamp = self._origin
+        while self._next is not None and self._next[0] <= due and emitted < self.batch:
+            timestamp, record_direction, data = self._next
+            if direction is not None and record_direction != direction:
+                self._emit(direction, chunks)
+                chunks = []
+            direction = record_direction
+            chunks.append(bytes(data))
+            data.release()
+            last_timestamp = timestamp
+            emitted += 1
+            self._next = next(self._records, None)
+
+        if direction is not None:
+            self._emit(direction, chunks)
+            self.signal_position.emit(last_timestamp)
+
+        if self._next is None:
+            self.stop()
+            self.signal_finished.emit()
+            return
+
+        if self.speed == AS_FAST_AS_POSSIBLE:
+            self._timer.start(0)
+        else:
+            wait = (self._next[0] - self._origin) / self.speed - (time.perf_counter() - self._clock_start)
+            self._timer.start(max(0, int(wait * 1000)))
+
+    def _emit(self, direction: Direction, chunks: List[bytes]) -> None:
+        data = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+        if direction == Direction.Received:
+            self.signal_received.emit(data)
+        else:
+            self.signal_sent.emit(data)
@@ -1,4 +1,6 @@
-from typing import List, Optional
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 from PySide6.QtCore import (
@@ -6,44 +8,763 @@ from PySide6.QtCore import (
     QModelIndex,
     QPersistentModelIndex,
     Qt,
+    QTimer,
 )
+from PySide6.QtGui import QBrush, QColor
 from PySide6.QtWidgets import QHeaderView, QTableView
 
+from .profiling import profiler
+
+if TYPE_CHECKING:
+    from .export import ArrayExport
+
+FORMAT_BLOCK_ROWS = 64  # Rows formatted together per column, about a screen.
+FORMAT_CACHE_BLOCKS = 1024  # Formatted blocks kept, least recently used are dropped first.
+
+MIN_BUFFER_CAPACITY = 1024  # Rows allocated when a table first grows.
+DEFAULT_APPEND_INTERVAL_MS = 100  # Time between batched appends to a DataTable.
+
+DEFAULT_FETCH_ROWS = 100_000  # Rows added to the view each time it scrolls to the end of a file backed table.
+RECORD_CACHE_BLOCKS = 256  # Blocks of records read from a file backed table kept in memory.
+MAX_VIEW_ROWS = 2**31 - 1  # Qt row numbers are 32 bit.
+
+WIDTH_SAMPLE_ROWS = 256  # Rows formatted to estimate column widths, from the head, the tail and at random.
+DTYPE_WIDTH_CHARS = 12  # Columns whose dtype bounds their text to this many characters are sized without sampling.
+WIDTH_REFRESH_GROWTH = 2.0  # Column widths are estimated again when appends grow the rows by this factor.
+MAX_COLUMN_WIDTH = 400  # Pixels, so one long sampled value doesn't push the other columns out of view.
+
+# Resolved once, `data` is called for every role of every painted cell.
+DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+TEXT_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole
+BACKGROUND_ROLE = Qt.ItemDataRole.BackgroundRole
+FOREGROUND_ROLE = Qt.ItemDataRole.ForegroundRole
+
+DEFAULT_COLOUR_STEPS = 64  # Distinct colours of a colour map, so the palette of brushes stays small.
+
+
+def format_column_block(column: np.ndarray) -> Optional[List[str]]:
+    """
+    Format a slice of a single column as strings in one vectorized call.
+    Returns None for dtypes numpy can't cast to str, eg: sub-arrays or objects.
+    """
+    if column.ndim != 1 or column.dtype.kind == "O":
+        return None
+    if column.dtype.kind == "S":
+        # As `str(value)` formats them, eg: b'cd', with escapes, which a cast to str would decode away.
+        return list(map(str, column.tolist()))
+    try:
+        return column.astype(str).tolist()
+    except (TypeError, ValueError):
+        return None
+
+
+def dtype_text_chars(dtype: np.dtype) -> Optional[int]:
+    """
+    Most characters a value of `dtype` formats to, None when not bounded by the dtype, eg: floats.
+    """
+    if dtype.kind == "b":
+        return len("False")
+    if dtype.kind in "iu":
+        info = np.iinfo(dtype)
+        return max(len(str(info.min)), len(str(info.max)))
+    if dtype.kind == "U":
+        return dtype.itemsize // 4
+    if dtype.kind == "S":
+        # Formatted as b'...', escaped non-printable bytes are wider but rare in text columns.
+        return dtype.itemsize + 3
+    return None
+
+
+def argsort_column(column: np.ndarray, descending: bool = False) -> np.ndarray:
+    """
+    Stable argsort of a column, equal values keep their original order in both directions.
+    """
+    if not descending:
+        return np.argsort(column, kind="stable")
+    # Sort the reversed column and reverse the result, so ties stay in original order.
+    order = np.argsort(column[::-1], kind="stable")[::-1]
+    return len(column) - 1 - order
+
+
+def lexsort_columns(columns: Sequence[np.ndarray], descending: Sequence[bool]) -> np.ndarray:
+    """
+    Stable argsort by several columns, the first being the primary key.
+    Descending keys are sorted by negated rank, so any sortable dtype can be descending.
+    """
+    keys = []
+    for column, reverse in zip(columns, descending):
+        if reverse:
+            _, rank = np.unique(column, return_inverse=True)
+            keys.append(-rank.ravel())
+        else:
+            keys.append(column)
+    # lexsort treats the last key as primary.
+    return np.lexsort(keys[::-1])
+
+
+def open_structured_file(path: str, dtype=None, offset: int = 0) -> np.ndarray:
+    """
+    Memory map a structured array file read only, nothing is read until rows are accessed.
+
+    Parameters
+    ----------
+    path : str
+        A `.npy` file, or a raw file of fixed size records.
+    dtype : optional
+        Structured dtype of the records of a raw file, `.npy` files hold their own dtype.
+    offset : int
+        Bytes to skip at the start of a raw file, eg: a file header.
+        A trailing partial record, eg: from a capture still being written, is ignored.
+    """
+    if dtype is None:
+        return np.load(path, mmap_mode="r")
+    dtype = np.dtype(dtype)
+    with open(path, "rb") as file:
+        size = file.seek(0, 2)
+    rows = max(0, size - offset) // dtype.itemsize
+    if rows == 0:
+        # mmap can't map an empty range.
+        return np.zeros(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(rows,))
+
+
+class CellFormat(ABC):
+    """
+    Base of the cell colour formats set with `StructuredArrayModel.set_column_format`.
+
+    `indexes` maps a block of column values to indexes into the `background` / `foreground` palettes
+    in one vectorized call, -1 for no colour. The palettes hold brushes built once, and end with None,
+    so index -1 needs no special case.
+    """
+
+    def __init__(self, background: Sequence[Optional[QBrush]], foreground: Sequence[Optional[QBrush]]) -> None:
+        self.background: List[Optional[QBrush]] = [*background, None]
+        self.foreground: List[Optional[QBrush]] = [*foreground, None]
+
+    @abstractmethod
+    def indexes(self, values: np.ndarray) -> np.ndarray:
+        """
+        Palette index of each value, -1 for no colour.
+        """
+
+
+def _brush(colour) -> Optional[QBrush]:
+    return None if colour is None else QBrush(QColor(colour))
+
+
+class ThresholdFormat(CellFormat):
+    """
+    Colour cells by the band between thresholds their value falls in,
+    eg: out of range voltages `ThresholdFormat([0.0, 5.0], ["red", None, "red"])`.
+
+    Parameters
+    ----------
+    thresholds : Sequence[float]
+        Ascending band edges, a value equal to an edge is in the band above it.
+    colours : Sequence
+        Background colour of each band, one more than the thresholds. Anything `QColor` accepts, None for no colour.
+    text_colours : Sequence, optional
+        Text colour of each band.
+    """
+
+    def __init__(self, thresholds: Sequence[float], colours: Sequence, text_colours: Optional[Sequence] = None) -> None:
+        if len(colours) != len(thresholds) + 1:
+            raise ValueError(f"Expected {len(thresholds) + 1} colours for {len(thresholds)} thresholds.")
+        if text_colours is None:
+            text_colours = [None] * len(colours)
+        elif len(text_colours) != len(colours):
+            raise ValueError(f"Expected {len(colours)} text colours.")
+        super().__init__([_brush(colour) for colour in colours], [_brush(colour) for colour in text_colours])
+        self.thresholds = np.asarray(thresholds)
+
+    def indexes(self, values: np.ndarray) -> np.ndarray:
+        indexes = np.searchsorted(self.thresholds, values, side="right")
+        if values.dtype.kind in "fc":
+            indexes[np.isnan(values)] = -1
+        return indexes
+
+
+class ColourMapFormat(CellFormat):
+    """
+    Colour cells as a heatmap, values between `vmin` and `vmax` are mapped onto a colour map of `steps` colours,
+    values outside are clipped and NaNs are not coloured.
+
+    Parameters
+    ----------
+    vmin, vmax : float
+        Values mapped to the first and last colours.
+    colours : str | Sequence
+        A matplotlib colour map name, or colours to interpolate between. Anything `QColor` accepts.
+    steps : int
+        Number of distinct colours.
+    contrast_text : bool
+        Colour the text black or white, whichever contrasts with the background.
+    """
+
+    def __init__(
+        self,
+        vmin: float,
+        vmax: float,
+        colours: str | Sequence = "viridis",
+        steps: int = DEFAULT_COLOUR_STEPS,
+        contrast_text: bool = True,
+    ) -> None:
+        if vmax <= vmin:
+            raise ValueError(f"vmax {vmax} must be greater than vmin {vmin}.")
+        positions = np.linspace(0.0, 1.0, steps)
+        if isinstance(colours, str):
+            # Imported here, matplotlib is slow to import and only needed for named maps.
+            from matplotlib import colormaps
+
+            rgb = colormaps[colours](positions)[:, :3]
+        else:
+            stops = np.array([QColor(colour).getRgbF()[:3] for colour in colours])
+            stop_positions = np.linspace(0.0, 1.0, len(stops))
+            rgb = np.column_stack([np.interp(positions, stop_positions, stops[:, channel]) for channel in range(3)])
+
+        background = [QBrush(QColor.fromRgbF(*channels)) for channels in rgb.tolist()]
+        foreground: List[Optional[QBrush]] = [None] * steps
+        if contrast_text:
+            black, white = QBrush(QColor("black")), QBrush(QColor("white"))
+            luminance = rgb @ np.array([0.299, 0.587, 0.114])
+            foreground = [black if value > 0.5 else white for value in luminance.tolist()]
+        super().__init__(background, foreground)
+        self.vmin = vmin
+        self.vmax = vmax
+        self.steps = steps
+
+    def indexes(self, values: np.ndarray) -> np.ndarray:
+        scaled = (values.astype(np.float64) - self.vmin) * (self.steps / (self.vmax - self.vmin))
+        nan = np.isnan(scaled)
+        indexes = np.clip(np.nan_to_num(scaled), 0, self.steps - 1).astype(np.int32)
+        indexes[nan] = -1
+        return indexes
+
+
+class StructuredBuffer:
+    """
+    A growable structured array, appends are amortized constant time as the capacity doubles when full.
+
+    With `max_rows` set the buffer acts as a ring, keeping only the newest `max_rows` rows. The capacity is then
+    fixed at twice `max_rows`, and the kept rows are moved to the front once every `max_rows` appended rows,
+    so `array` is always a contiguous view.
+    """
+
+    def __init__(self, array: np.ndarray, max_rows: Optional[int] = None) -> None:
+        self.max_rows = max_rows
+        if max_rows is not None:
+            array = array[-max_rows:] if max_rows else array[:0]
+            capacity = max(2 * max_rows, 1)
+        else:
+            capacity = max(MIN_BUFFER_CAPACITY, 2 * len(array))
+        self._buffer = np.empty(capacity, dtype=array.dtype)
+        self._buffer[: len(array)] = array
+        self._start = 0
+        self._end = len(array)
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def array(self) -> np.ndarray:
+        """
+        View of the held rows, invalidated by the next append.
+        """
+        return self._buffer[self._start : self._end]
+
+    def dropped_by(self, count: int) -> int:
+        """
+        Number of held rows an append of `count` rows would drop.
+        """
+        if self.max_rows is None:
+            return 0
+        return min(len(self), max(0, len(self) + count - self.max_rows))
+
+    def append(self, rows: np.ndarray) -> int:
+        """
+        Append rows, returning the number of old rows dropped in ring mode.
+        """
+        dropped = self.dropped_by(len(rows))
+        if self.max_rows is not None and len(rows) > self.max_rows:
+            rows = rows[len(rows) - self.max_rows :]
+        self._start += dropped
+
+        count = len(rows)
+        if self._end + count > len(self._buffer):
+            size = len(self)
+            capacity = len(self._buffer)
+            if self.max_rows is None:
+                while size + count > capacity:
+                    capacity *= 2
+            if capacity == len(self._buffer):
+                self._buffer[:size] = self._buffer[self._start : self._end]
+            else:
+                buffer = np.empty(capacity, dtype=self._buffer.dtype)
+                buffer[:size] = self._buffer[self._start : self._end]
+                self._buffer = buffer
+            self._start, self._end = 0, size
+
+        self._buffer[self._end : self._end + count] = rows
+        self._end += count
+        return dropped
+
 
 class StructuredArrayModel(QAbstractTableModel):
     """
     A Structured Array Model built from a numpy array.
     The arrays dtype must be specified with names, these names are used for the columns.
+
+    Cells are formatted a block of rows at a time per column, and the formatted blocks are kept in an LRU cache,
+    so painting a cell is a lookup rather than building a numpy record and a string.
+    Call `invalidate` if the array is modified in place.
+
+    Sorting and filtering never reorder the array, view rows are mapped to array rows through an index array
+    built with `argsort` / `lexsort` and boolean masks. Sorting a column costs about as much as `np.argsort`.
+    Filters are named boolean masks over the array rows, a row is shown when every mask is True.
+
+    `append_rows` adds rows in place, backed by a `StructuredBuffer`, notifying views with inserted / removed rows
+    rather than a reset. With `max_rows` set only the newest rows are kept.
+    When sorted the model is re-sorted on each append, so sort appended tables sparingly.
+
+    Cells are coloured per column with `set_column_format`, eg: a `ThresholdFormat` or `ColourMapFormat`.
+    A block of rows is mapped to palette indexes at once, and cached like the formatted strings.
+
+    A `np.memmap` array, eg: from `open_structured_file`, is paged: rows are added to the view `fetch_rows` at a time
+    through `canFetchMore` / `fetchMore` as it scrolls, and only the records of visible blocks are read, kept in a
+    bounded LRU cache. Opening costs the same however large the file. Sorting and filtering a paged array read
+    the sorted / filtered columns in full, and paged arrays can't be appended to.
     """
 
-    def __init__(self, array: np.ndarray) -> None:
+    def __init__(self, array: np.ndarray, max_rows: Optional[int] = None, fetch_rows: int = DEFAULT_FETCH_ROWS) -> None:
         super().__init__()
-        self._array = array
         self._field_names: List[str] = array.dtype.names # type: ignore
+        self._buffer: Optional[StructuredBuffer] = None
+        if max_rows is not None:
+            self._buffer = StructuredBuffer(array, max_rows)
+            array = self._buffer.array
+        self._set_array(array)
         self._data_alignment = Qt.AlignmentFlag.AlignCenter
+        self._format_cache: OrderedDict[Tuple[int, int], List[Optional[str]]] = OrderedDict()
+        self.format_block_rows = FORMAT_BLOCK_ROWS
+        self.format_cache_blocks = FORMAT_CACHE_BLOCKS
+        self._record_cache: OrderedDict[int, np.ndarray] = OrderedDict()
+        self.record_cache_blocks = RECORD_CACHE_BLOCKS
+        self._cell_formats: Dict[int, CellFormat] = {}
+        self._colour_cache: OrderedDict[Tuple[int, int], List[int]] = OrderedDict()
+        self.fetch_rows = fetch_rows
+        # View rows exposed so far when paged.
+        self._fetched = fetch_rows
 
-    def rowCount(self, *args, **kwargs) -> int:
+        # Array row order from sorting, None is the array order.
+        self._order: Optional[np.ndarray] = None
+        self._sort_keys: List[Tuple[str, bool]] = []
+        self._filters: Dict[str, np.ndarray] = {}
+        # Filters set from a predicate are evaluated on appended rows, others show appended rows.
+        self._predicates: Dict[str, Callable[[np.ndarray], np.ndarray]] = {}
+        # Array row of each view row, None when neither sorted nor filtered.
+        self._rows: Optional[np.ndarray] = None
+
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+
+    def _set_array(self, array: np.ndarray) -> None:
+        self._array = array
+        self.paged = isinstance(array, np.memmap)
+        # Resolve fields to column views once, rather than per cell.
+        self._columns: List[np.ndarray] = [array[name] for name in self._field_names]
+
+    def append_rows(self, rows: np.ndarray) -> None:
+        """
+        Append rows of the same dtype. Views are notified of the rows added, and in ring mode the rows dropped.
+        """
+        if len(rows) == 0:
+            return
+        if self.paged:
+            raise ValueError("Can't append rows to a file backed table.")
+        if self._buffer is None:
+            self._buffer = StructuredBuffer(self._array)
+        max_rows = self._buffer.max_rows
+        if max_rows is not None and len(rows) > max_rows:
+            # Only the newest `max_rows` rows are kept, the rest are never shown.
+            rows = rows[len(rows) - max_rows :]
+            if len(rows) == 0:
+                return
+
+        if self._rows is not None:
+            self._append_rows_arranged(rows)
+            return
+
+        dropped = self._buffer.dropped_by(len(rows))
+        if dropped:
+            self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+            self._clear_caches()
+        self._buffer.append(rows)
+        if dropped:
+            # Dropped rows are gone from the array, even though the new rows are not yet announced.
+            self._set_array(self._buffer.array[: len(self._buffer) - len(rows)])
+            self.endRemoveRows()
+
+        size = len(self._buffer) - min(len(rows), len(self._buffer))
+        self._invalidate_from(size)
+        self.beginInsertRows(QModelIndex(), size, len(self._buffer) - 1)
+        self._set_array(self._buffer.array)
+        self.endInsertRows()
+
+    def _append_rows_arranged(self, rows: np.ndarray) -> None:
+        # Sorted or filtered, extend the filter masks and rebuild the row mapping in one layout change.
+        dropped = self._buffer.append(rows)  # type: ignore
+        self._set_array(self._buffer.array)  # type: ignore
+        appended = self._array[len(self._array) - min(len(rows), len(self._array)) :]
+
+        for name, mask in self._filters.items():
+            predicate = self._predicates.get(name)
+            extension = np.asarray(predicate(appended), dtype=bool) if predicate else np.ones(len(appended), bool)
+            self._filters[name] = np.concatenate([mask[dropped:], extension])[-len(self._array) :]
+
+        if self._sort_keys:
+            self._order = self._argsort(self._sort_keys)
+        self._update_rows(shift=dropped)
+
+    def _invalidate_from(self, row: int) -> None:
+        # Drop formatted blocks at or after a row, eg: the partial last block before an append.
+        first_block = row // self.format_block_rows
+        for cache in (self._format_cache, self._colour_cache):
+            for key in [key for key in cache if key[1] >= first_block]:
+                del cache[key]
+
+    def _clear_caches(self) -> None:
+        self._format_cache.clear()
+        self._record_cache.clear()
+        self._colour_cache.clear()
+
+    def set_max_rows(self, max_rows: Optional[int]) -> None:
+        """
+        Keep only the newest `max_rows` rows, None is unbounded. Resets the model.
+        A paged array is copied into memory, so `max_rows` must be set.
+        """
+        if self.paged and max_rows is None:
+            raise ValueError("Can't load a whole file backed table into memory, set max_rows.")
+        self.beginResetModel()
+        self._buffer = StructuredBuffer(self._array, max_rows)
+        self._set_array(self._buffer.array)
+        self._filters = {name: mask[-len(self._array) :] for name, mask in self._filters.items()}
+        self._clear_caches()
+        self._order = self._argsort(self._sort_keys) if self._sort_keys else None
+        self._rows = self._arranged_rows()
+        self.endResetModel()
+
+    def _view_rows(self) -> int:
+        if self._rows is not None:
+            return len(self._rows)
         return len(self._array)
 
+    def rowCount(self, *args, **kwargs) -> int:
+        if self.paged:
+            return min(self._view_rows(), self._fetched, MAX_VIEW_ROWS)
+        return self._view_rows()
+
+    def canFetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> bool:
+        """
+        Reimplemented method, whether a paged array has rows not yet shown in the view.
+        """
+        return self.paged and not parent.isValid() and self.rowCount() < min(self._view_rows(), MAX_VIEW_ROWS)
+
+    def fetchMore(self, parent: QModelIndex | QPersistentModelIndex) -> None:
+        """
+        Reimplemented method, called by the view when scrolled to the last row. Shows `fetch_rows` more rows.
+        """
+        self.fetch_to(self.rowCount() + self.fetch_rows - 1)
+
+    def fetch_to(self, row: int) -> None:
+        """
+        Show the rows of a paged array up to and including view `row`, eg: before scrolling to it.
+        """
+        first = self.rowCount()
+        last = min(row + 1, self._view_rows(), MAX_VIEW_ROWS)
+        if not self.paged or last <= first:
+            return
+        self.beginInsertRows(QModelIndex(), first, last - 1)
+        self._fetched = last
+        self.endInsertRows()
+
     def columnCount(self, *args, **kwargs) -> int:
         return len(self._field_names)
 
+    @profiler.timed("StructuredArrayModel.data")
     def data(
         self, index: QModelIndex | QPersistentModelIndex, role: int = Qt.ItemDataRole.DisplayRole
-    ) -> Optional[str | Qt.AlignmentFlag]:
+    ) -> Optional[str | Qt.AlignmentFlag | QBrush]:
         """
-        The data as a string for a given index.
+        The data as a string for a given index, and the brushes of any column format.
         """
-        if role == Qt.ItemDataRole.DisplayRole:
-            row = index.row()
-            col = index.column()
-            field = self._field_names[col]
-            data = str(self._array[row][field])
-            return data
-        elif role == Qt.ItemDataRole.TextAlignmentRole:
+        if role == DISPLAY_ROLE:
+            column = index.column()
+            block, offset = divmod(index.row(), self.format_block_rows)
+            strings = self.formatted_block(column, block)
+            text = strings[offset]
+            if text is None:
+                # Column can't be formatted in bulk, format the cell alone and keep it in the block.
+                text = strings[offset] = str(self._columns[column][self.source_row(index.row())])
+            return text
+        elif role == TEXT_ALIGNMENT_ROLE:
             return self._data_alignment
+        elif role == BACKGROUND_ROLE or role == FOREGROUND_ROLE:
+            cell_format = self._cell_formats.get(index.column())
+            if cell_format is None:
+                return
+            block, offset = divmod(index.row(), self.format_block_rows)
+            palette = cell_format.background if role == BACKGROUND_ROLE else cell_format.foreground
+            return palette[self.colour_block(index.column(), block)[offset]]
         return
 
+    def _block_values(self, column: int, block: int) -> np.ndarray:
+        # Values of a column for a block of view rows.
+        if self.paged:
+            return self.record_block(block)[self._field_names[column]]
+        start = block * self.format_block_rows
+        if self._rows is None:
+            return self._columns[column][start : start + self.format_block_rows]
+        return self._columns[column][self._rows[start : start + self.format_block_rows]]
+
+    def formatted_block(self, column: int, block: int) -> List[Optional[str]]:
+        """
+        Formatted strings of a block of rows for a column, formatting and caching the block if needed.
+        Columns that can't be formatted in bulk return a block of None, filled in as cells are requested.
+        """
+        key = (column, block)
+        cache = self._format_cache
+        strings = cache.get(key)
+        if strings is not None:
+            cache.move_to_end(key)
+            return strings
+
+        values = self._block_values(column, block)
+        strings = format_column_block(values)
+        if strings is None:
+            strings = [None] * len(values)
+        cache[key] = strings
+        if len(cache) > self.format_cache_blocks:
+            cache.popitem(last=False)
+        return strings
+
+    def colour_block(self, column: int, block: int) -> List[int]:
+        """
+        Palette indexes of a block of rows for a formatted column, mapping and caching the block if needed.
+        """
+        key = (column, block)
+        cache = self._colour_cache
+        indexes = cache.get(key)
+        if indexes is not None:
+            cache.move_to_end(key)
+            return indexes
+
+        indexes = self._cell_formats[column].indexes(self._block_values(column, block)).tolist()
+        cache[key] = indexes
+        if len(cache) > self.format_cache_blocks:
+            cache.popitem(last=False)
+        return indexes
+
+    def set_column_format(self, name: str, cell_format: Optional[CellFormat]) -> None:
+        """
+        Colour the cells of a column, None removes the format.
+        """
+        column = self._field_names.index(name)
+        if cell_format is None:
+            self._cell_formats.pop(column, None)
+        else:
+            self._cell_formats[column] = cell_format
+        for key in [key for key in self._colour_cache if key[0] == column]:
+            del self._colour_cache[key]
+        if self.rowCount():
+            self.dataChanged.emit(
+                self.index(0, column), self.index(self.rowCount() - 1, column), [BACKGROUND_ROLE, FOREGROUND_ROLE]
+            )
+
+    def record_block(self, block: int) -> np.ndarray:
+        """
+        Records of a block of view rows of a paged array, read into memory once and kept in an LRU cache.
+        Reading whole records touches each page of the file once, rather than once per column.
+        """
+        cache = self._record_cache
+        records = cache.get(block)
+        if records is not None:
+            cache.move_to_end(block)
+            return records
+
+        start = block * self.format_block_rows
+        if self._rows is None:
+            records = np.array(self._array[start : start + self.format_block_rows])
+        else:
+            records = np.array(self._array[self._rows[start : start + self.format_block_rows]])
+        cache[block] = records
+        if len(cache) > self.record_cache_blocks:
+            cache.popitem(last=False)
+        return records
+
+    def sample_rows(self, count: int = WIDTH_SAMPLE_ROWS) -> np.ndarray:
+        """
+        Sorted view rows to sample for size estimates, the first and last quarter of `count` rows
+        are the head and tail of the view, the rest are random. The same rows are drawn for the same row count.
+        """
+        total = self._view_rows()
+        if total <= count:
+            return np.arange(total)
+        edge = count // 4
+        middle = np.random.default_rng(0).integers(edge, total - edge, count - 2 * edge)
+        return np.unique(np.concatenate([np.arange(edge), middle, np.arange(total - edge, total)]))
+
+    def sample_strings(self, column: int, rows: np.ndarray) -> List[str]:
+        """
+        Formatted strings of a column at the given view rows, eg: from `sample_rows`.
+        """
+        sources = rows if self._rows is None else self._rows[rows]
+        values = self._columns[column][sources]
+        strings = format_column_block(values)
+        if strings is None:
+            strings = [str(value) for value in values]
+        return strings
+
+    def invalidate(self) -> None:
+        """
+        Drop all formatted blocks, and notify views the data has changed.
+        """
+        self._clear_caches()
+        if self.rowCount() and self.columnCount():
+            self.dataChanged.emit(self.index(0, 0), self.index(self.rowCount() - 1, self.columnCount() - 1))
+
+    def source_row(self, row: int) -> int:
+        """
+        Array row displayed at a view row.
+        """
+        if self._rows is not None:
+            return int(self._rows[row])
+        return row
+
+    def source_rows(self) -> np.ndarray:
+        """
+        Array rows in display order.
+        """
+        if self._rows is not None:
+            return self._rows
+        return np.arange(len(self._array))
+
+    def view_rows(self) -> Optional[np.ndarray]:
+        """
+        Array rows in display order, None when the view is the array order. Unlike `source_rows`
+        nothing is allocated for an unsorted, unfiltered array.
+        """
+        return self._rows
+
+    def view_array(self) -> np.ndarray:
+        """
+        The array as displayed, sorted and filtered. A copy when sorted or filtered.
+        """
+        if self._rows is not None:
+            return self._array[self._rows]
+        return self._array
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """
+        Reimplemented method, called by the view when a header is clicked with sorting enabled.
+        A negative column restores the array order.
+        """
+        if column < 0:
+            self.sort_by([])
+            return
+        self.sort_by([(self._field_names[column], order == Qt.SortOrder.DescendingOrder)])
+
+    def sort_by(self, keys: Sequence[Tuple[str, bool]]) -> None:
+        """
+        Sort by one or more fields, each key is (field name, descending). The first key is the primary key.
+        An empty sequence restores the array order.
+        """
+        self._sort_keys = list(keys)
+        self._order = self._argsort(self._sort_keys) if keys else None
+        self._update_rows()
+
+    def _argsort(self, keys: Sequence[Tuple[str, bool]]) -> np.ndarray:
+        if len(keys) == 1:
+            name, descending = keys[0]
+            return argsort_column(self._array[name], descending)
+        return lexsort_columns([self._array[name] for name, _ in keys], [descending for _, descending in keys])
+
+    def set_filter(self, name: str, mask: Optional[np.ndarray]) -> None:
+        """
+        Set a named filter, a boolean mask the length of the array. None removes the filter.
+        Filters are combined with AND, eg: `model.set_filter("in_range", (array["V"] > 0) & (array["V"] < 5))`.
+        """
+        self._predicates.pop(name, None)
+        if mask is None:
+            self._filters.pop(name, None)
+        else:
+            mask = np.asarray(mask, dtype=bool)
+            if mask.shape != (len(self._array),):
+                raise ValueError(f"Filter mask shape {mask.shape} does not match array length {len(self._array)}.")
+            self._filters[name] = mask
+        self._update_rows()
+
+    def filter_rows(self, name: str, predicate: Callable[[np.ndarray], np.ndarray]) -> None:
+        """
+        Set a named filter from a vectorized predicate of the array, eg: `lambda array: array["NUM"] > 10`.
+        The predicate is kept, and evaluated on rows appended later.
+        """
+        self.set_filter(name, predicate(self._array))
+        self._predicates[name] = predicate
+
+    def clear_filters(self) -> None:
+        self._filters.clear()
+        self._predicates.clear()
+        self._update_rows()
+
+    def _arranged_rows(self) -> Optional[np.ndarray]:
+        mask = None
+        for filter_mask in self._filters.values():
+            mask = filter_mask if mask is None else mask & filter_mask
+
+        if mask is None:
+            return self._order
+        elif self._order is None:
+            return np.flatnonzero(mask)
+        return self._order[mask[self._order]]
+
+    def _update_rows(self, shift: int = 0) -> None:
+        rows = self._arranged_rows()
+        self.layoutAboutToBeChanged.emit()
+        old_rows = self._rows
+        self._rows = rows
+        self._clear_caches()
+        self._remap_persistent_indexes(old_rows, rows, shift)
+        self.layoutChanged.emit()
+
+    def _remap_persistent_indexes(
+        self, old_rows: Optional[np.ndarray], rows: Optional[np.ndarray], shift: int = 0
+    ) -> None:
+        # Keep selections / current index on the same array rows, or drop them if the row is filtered out.
+        # `shift` is the number of rows dropped from the front of the array since `old_rows` was built.
+        persistent = self.persistentIndexList()
+        if not persistent:
+            return
+        length = len(self._array)
+        view_of_source = np.full(length, -1, dtype=np.int64)
+        if rows is None:
+            view_of_source[:] = np.arange(length)
+        else:
+            view_of_source[rows] = np.arange(len(rows))
+
+        old_view = np.array([index.row() for index in persistent], dtype=np.int64)
+        sources = (old_view if old_rows is None else old_rows[old_view]) - shift
+        valid = (sources >= 0) & (sources < length)
+        new_view = np.full(len(sources), -1, dtype=np.int64)
+        new_view[valid] = view_of_source[sources[valid]]
+        self.changePersistentIndexList(
+            persistent,
+            [
+                self.index(int(row), index.column()) if row >= 0 else QModelIndex()
+                for row, index in zip(new_view, persistent)
+            ],
+        )
+
     def headerData(
         self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
     ) -> Optional[str]:
@@ -55,7 +776,8 @@ class StructuredArrayModel(QAbstractTableModel):
                 # Use dtype field names as headers
                 return self._field_names[section]
             if orientation == Qt.Orientation.Vertical:
-                return str(section)
+                # Array row, so rows keep their number when sorted or filtered.
+                return str(self.source_row(section))
         return
 
 
@@ -66,13 +788,49 @@ class DataTable(QTableView):
     Where the dtype is specified with labels.
     eg:
         np.array(data, dtype=[("NAME", "U10"), ("NUM", "I")])
+
+    Set `sortable` to sort by clicking a column header. `sort_by` and `set_filter` sort and filter
+    programmatically, see `StructuredArrayModel`.
+
+    For live data use `append_rows`, rows are queued and added in batches on a timer without resetting the model,
+    so the scroll position and selection are kept. If the view is scrolled to the bottom it follows new rows.
+    Set `max_rows` to keep only the newest rows.
+
+    `open_file` memory maps a `.npy` or raw record file, rows are read as they are scrolled into view.
+
+    Columns stretch to fill the view. Set `fit_columns` to size them to their contents instead, estimated from
+    the dtype or a sample of rows rather than measuring every row, see `fit_columns_to_contents`.
     """
 
-    def __init__(self, parent=None, show_row_index: bool = False, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        parent=None,
+        show_row_index: bool = False,
+        *args,
+        sortable: bool = False,
+        max_rows: Optional[int] = None,
+        append_interval: int = DEFAULT_APPEND_INTERVAL_MS,
+        fit_columns: bool = False,
+        **kwargs,
+    ) -> None:
         super().__init__(parent=parent, *args, **kwargs)
         self.show_row_index(show_row_index)
         self.data = None
-        self._model = None
+        self._model: Optional[StructuredArrayModel] = None
+        self.max_rows = max_rows
+        self.setSortingEnabled(sortable)
+
+        self.fit_columns = fit_columns
+        # Column formats by field name, kept when new data is set.
+        self._cell_formats: Dict[str, CellFormat] = {}
+        # Estimated width of each column, and the row count when estimated.
+        self._column_widths: Dict[int, int] = {}
+        self._widths_rows = 0
+
+        self._pending_rows: List[np.ndarray] = []
+        self._append_timer = QTimer(self)
+        self._append_timer.setInterval(append_interval)
+        self._append_timer.timeout.connect(self.flush_rows)
 
     def show_row_index(self, visible: bool) -> None:
         """
@@ -85,9 +843,173 @@ class DataTable(QTableView):
         Set the data to display in the table. Accepts only a structed numpy array.
         Where the dtype is specified with labels -> np.array(data, dtype=[("NAME", "U10"), ("NUM", "I")])
         """
+        self._pending_rows = []
         self.data = data
-        self._model = StructuredArrayModel(data)
+        self._model = StructuredArrayModel(data, self.max_rows)
+        for name, cell_format in self._cell_formats.items():
+            if name in (data.dtype.names or ()):
+                self._model.set_column_format(name, cell_format)
         self.setModel(self._model)
-        self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+        self._column_widths = {}
+        if self.fit_columns:
+            self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Interactive)
+            self.horizontalHeader().setStretchLastSection(True)
+            self.fit_columns_to_contents()
+        else:
+            self.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
         self.adjustSize()
         self.adjustSize()
+
+    def open_file(self, path: str, dtype=None, offset: int = 0) -> None:
+        """
+        Show a structured array file without loading it, see `open_structured_file`.
+        With `max_rows` set only the newest rows are loaded, into memory.
+        """
+        self.set_data(open_structured_file(path, dtype, offset))
+
+    def append_rows(self, rows: np.ndarray) -> None:
+        """
+        Queue rows to be appended on the next flush. Rows must share the dtype of the data set,
+        if no data has been set the first rows set it.
+        """
+        if self._model is None:
+            self.set_data(rows[:0])
+        elif self._model.paged:
+            raise ValueError("Can't append rows to a file backed table.")
+        self._pending_rows.append(rows)
+        if not self._append_timer.isActive():
+            self._append_timer.start()
+
+    def flush_rows(self) -> None:
+        """
+        Append all queued rows in one batch.
+        """
+        if not self._pending_rows or self._model is None:
+            self._append_timer.stop()
+            return
+        pending = self._pending_rows
+        self._pending_rows = []
+        rows = pending[0] if len(pending) == 1 else np.concatenate(pending)
+
+        scrollbar = self.verticalScrollBar()
+        follow = scrollbar.value() == scrollbar.maximum()
+        self._model.append_rows(rows)
+        self.data = self._model.array
+        if self.fit_columns and self._model.rowCount() >= WIDTH_REFRESH_GROWTH * max(self._widths_rows, 1):
+            self.fit_columns_to_contents(force=True)
+        if follow:
+            self.scrollToBottom()
+
+    def fit_columns_to_contents(self, force: bool = False) -> None:
+        """
+        Size the columns to their contents. Unlike `resizeColumnsToContents` rows are not all measured,
+        columns whose dtype bounds their text to a few characters (bools, small ints, short strings) are sized
+        from the dtype, others from a sample of formatted rows (head, tail and random).
+        Widths are cached, and only estimated again when `force` is set, or appends have grown the rows enough.
+        """
+        if self._model is None:
+            return
+        header = self.horizontalHeader()
+        if self._column_widths and not force:
+            for column, width in self._column_widths.items():
+                header.resizeSection(column, width)
+            return
+
+        model = self._model
+        metrics = self.fontMetrics()
+        padding = metrics.horizontalAdvance("00")
+        dtype = model.array.dtype
+        rows = None
+        for column, name in enumerate(dtype.names or ()):
+            chars = dtype_text_chars(dtype[name])
+            if chars is not None and chars <= DTYPE_WIDTH_CHARS:
+                text_width = metrics.horizontalAdvance("0" * chars)
+            else:
+                if rows is None:
+                    rows = model.sample_rows()
+                strings = model.sample_strings(column, rows)
+                text_width = max((metrics.horizontalAdvance(string) for string in strings), default=0)
+            width = min(max(text_width + padding, header.sectionSizeFromContents(column).width()), MAX_COLUMN_WIDTH)
+            self._column_widths[column] = width
+            header.resizeSection(column, width)
+        self._widths_rows = model.rowCount()
+
+    def set_max_rows(self, max_rows: Optional[int]) -> None:
+        """
+        Keep only the newest `max_rows` rows, None is unbounded.
+        """
+        self.max_rows = max_rows
+        if self._model is not None:
+            self._model.set_max_rows(max_rows)
+            self.data = self._model.array
+
+    def sort_by(self, keys: Sequence[Tuple[str, bool]]) -> None:
+        """
+        Sort by one or more (field name, descending) keys, the first is the primary key.
+        """
+        if self._model is None:
+            return
+        self.horizontalHeader().setSortIndicatorShown(len(keys) > 0)
+        self._model.sort_by(keys)
+
+    def set_filter(self, name: str, mask: Optional[np.ndarray]) -> None:
+        """
+        Set a named boolean row filter, None removes it. Rows are shown when every filter is True.
+        """
+        if self._model is not None:
+            self._model.set_filter(name, mask)
+
+    def filter_rows(self, name: str, predicate: Callable[[np.ndarray], np.ndarray]) -> None:
+        """
+        Set a named filter from a vectorized predicate, also applied to rows appended later.
+        """
+        if self._model is not None:
+            self._model.filter_rows(name, predicate)
+
+    def clear_filters(self) -> None:
+        if self._model is not None:
+            self._model.clear_filters()
+
+    def export(self, path: str, view: bool = True, parent=None, **kwargs) -> "ArrayExport":
+        """
+        Export the data on a worker thread, to CSV, `.npy` or raw records by the path suffix.
+        Returns the started `ArrayExport`, connect to its progress / finished signals, or `cancel` it.
+        It deletes itself once it has finished, failed or been cancelled.
+
+        Parameters
+        ----------
+        path : str
+            File to write.
+        view : bool
+            Export the rows as displayed, sorted and filtered, rather than the whole array.
+        parent : QObject, optional
+            Parent of the `ArrayExport`, defaults to the table.
+        kwargs
+            Passed on to `ArrayExport.start`, eg: `delimiter`.
+        """
+        # Imported here, the export module imports this one.
+        from .export import ArrayExport
+
+        if self._model is None:
+            raise ValueError("No data to export.")
+        array = self._model.array
+        if self.max_rows is not None:
+            # The ring overwrites rows in place as rows are appended.
+            array = array.copy()
+        exporter = ArrayExport(parent=parent if parent is not None else self)
+        for signal in (exporter.signal_finished, exporter.signal_failed, exporter.signal_cancelled):
+            signal.connect(exporter.deleteLater)
+        exporter.start(path, array, self._model.view_rows() if view else None, **kwargs)
+        return exporter
+
+    def set_column_format(self, name: str, cell_format: Optional[CellFormat]) -> None:
+        """
+        Colour the cells of a field, eg: `ThresholdFormat` or `ColourMapFormat`. None removes the format.
+        The format is kept for data set later with the same field.
+        """
+        if cell_format is None:
+            self._cell_formats.pop(name, None)
+        else:
+            self._cell_formats[name] = cell_format
+        if self._model is not None and name in self._model.array.dtype.names:
+            self._model.set_column_format(name, cell_format)
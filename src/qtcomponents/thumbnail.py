@@ -0,0 +1,256 @@
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Set
+
+import numpy as np
+from PySide6.QtCore import QObject, QSize, QStandardPaths, Qt, QThreadPool, Signal
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPixmap
+
+from .view.lib import numpy_to_image
+
+DEFAULT_THUMBNAIL_SIZE = 160  # Pixels, the longest side of a thumbnail.
+DEFAULT_THUMBNAIL_CACHE_BYTES = 256 * 2**20  # On-disk thumbnail cache size, least recently used are removed first.
+DEFAULT_THUMBNAIL_MEMORY_ITEMS = 512  # Thumbnails kept in memory as icons.
+
+NPY_SUFFIX = ".npy"
+
+
+def thumbnail_suffixes() -> Set[str]:
+    """
+    File suffixes thumbnails can be made for, the image formats Qt can read and `.npy`.
+    """
+    suffixes = {f".{bytes(name).decode()}".lower() for name in QImageReader.supportedImageFormats()}
+    suffixes.add(NPY_SUFFIX)
+    return suffixes
+
+
+def _array_thumbnail(path: Path, size: int) -> Optional[QImage]:
+    # Memory mapped, only the strided subsample of pixels is read.
+    array = np.load(path, mmap_mode="r")
+    if array.dtype.names is not None or array.ndim not in (2, 3):
+        return None
+    if array.ndim == 3 and array.shape[2] not in (1, 3, 4):
+        return None
+    step = max(1, -(-max(array.shape[:2]) // size))
+    sample = np.asarray(array[::step, ::step])
+    if sample.ndim == 3 and sample.shape[2] == 1:
+        sample = sample[:, :, 0]
+
+    if sample.dtype != np.uint8:
+        # Stretch to the sample's range, so 12 / 16 bit and float captures are visible.
+        sample = sample.astype(np.float64)
+        low, high = np.nanmin(sample), np.nanmax(sample)
+        scale = 255.0 / (high - low) if high > low else 0.0
+        sample = np.nan_to_num((sample - low) * scale).astype(np.uint8)
+    sample = np.ascontiguousarray(sample)
+    # Copy, the QImage shares the sample's memory.
+    return numpy_to_image(sample).copy()
+
+
+def make_thumbnail(path: Path | str, size: int = DEFAULT_THUMBNAIL_SIZE) -> Optional[QImage]:
+    """
+    Thumbnail of an image or `.npy` file, no larger than `size` on its longest side, None if it can't be read.
+    Decodes as little as the format allows, JPEGs are decoded at a reduced scale and `.npy` arrays are subsampled
+    through a memory map. Safe to call off the GUI thread.
+    """
+    path = Path(path)
+    try:
+        if path.suffix.lower() == NPY_SUFFIX:
+            return _array_thumbnail(path, size)
+    except (OSError, ValueError, TypeError):
+        return None
+
+    reader = QImageReader(str(path))
+    reader.setAutoTransform(True)
+    original = reader.size()
+    bounds = QSize(size, size)
+    if original.isValid() and (original.width() > size or original.height() > size):
+        # Readers that support it decode straight to the scaled size.
+        reader.setScaledSize(original.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return None
+    if image.width() > size or image.height() > size:
+        image = image.scaled(bounds, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+    return image
+
+
+class ThumbnailCache:
+    """
+    A size bounded, on-disk cache of thumbnails as PNGs.
+
+    Keyed by the file's path, modification time and size, and the thumbnail size, so a changed file is never
+    served a stale thumbnail. When the cache grows past `max_bytes` the least recently used thumbnails are removed.
+    Safe to use from several threads.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, max_bytes: int = DEFAULT_THUMBNAIL_CACHE_BYTES) -> None:
+        if directory is None:
+            location = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+            directory = Path(location) / "thumbnails"
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # Cached file name -> size, in least recently used order. Scanned on first use.
+        self._entries: Optional[OrderedDict[str, int]] = None
+        self._bytes = 0
+
+    def key(self, path: Path, size: int) -> Optional[str]:
+        """
+        Cache file name of a thumbnail, None if the file can't be stat'd.
+        """
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        identity = f"{path.resolve()}\0{stat.st_mtime_ns}\0{stat.st_size}\0{size}"
+        return hashlib.sha1(identity.encode()).hexdigest() + ".png"
+
+    def _load_entries(self) -> OrderedDict[str, int]:
+        if self._entries is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Modification times are touched on use, so they order the thumbnails across sessions.
+            files = [(entry.stat().st_mtime, entry.name, entry.stat().st_size) for entry in os.scandir(self.directory)]
+            self._entries = OrderedDict((name, size) for _, name, size in sorted(files))
+            self._bytes = sum(self._entries.values())
+        return self._entries
+
+    def get(self, path: Path, size: int = DEFAULT_THUMBNAIL_SIZE) -> Optional[QImage]:
+        key = self.key(path, size)
+        if key is None:
+            return None
+        with self._lock:
+            entries = self._load_entries()
+            if key not in entries:
+                return None
+            entries.move_to_end(key)
+        file = self.directory / key
+        image = QImage(str(file))
+        if image.isNull():
+            return None
+        try:
+            os.utime(file)
+        except OSError:
+            pass
+        return image
+
+    def put(self, path: Path, image: QImage, size: int = DEFAULT_THUMBNAIL_SIZE) -> None:
+        key = self.key(path, size)
+        if key is None:
+            return
+        with self._lock:
+            entries = self._load_entries()
+        file = self.directory / key
+        if not image.save(str(file), "PNG"):
+            return
+        with self._lock:
+            self._bytes += file.stat().st_size - entries.pop(key, 0)
+            entries[key] = file.stat().st_size
+            while self._bytes > self.max_bytes and len(entries) > 1:
+                name, used = entries.popitem(last=False)
+                self._bytes -= used
+                try:
+                    os.remove(self.directory / name)
+                except OSError:
+                    pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for name in self._load_entries():
+                try:
+                    os.remove(self.directory / name)
+                except OSError:
+                    pass
+            self._entries.clear()  # type: ignore
+            self._bytes = 0
+
+
+class ThumbnailLoader(QObject):
+    """
+    Makes thumbnails on a thread pool, checking the on-disk `ThumbnailCache` first,
+    and keeps the most recent as icons in memory.
+
+    `icon` only looks in memory and never blocks, `request` queues a thumbnail, and `signal_thumbnail`
+    is emitted with the path once its icon is ready. `cancel_pending` drops queued requests,
+    eg: when the directory being browsed changes, thumbnails already being made are still kept.
+    """
+
+    signal_thumbnail = Signal(str)
+
+    # Carry thumbnails from the pool threads.
+    _signal_done = Signal(str, object)
+
+    def __init__(
+        self,
+        size: int = DEFAULT_THUMBNAIL_SIZE,
+        cache: Optional[ThumbnailCache] = None,
+        memory_items: int = DEFAULT_THUMBNAIL_MEMORY_ITEMS,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.size = size
+        self.cache = cache if cache is not None else ThumbnailCache()
+        self.memory_items = memory_items
+        # Path -> icon, None when no thumbnail could be made.
+        self._icons: OrderedDict[str, Optional[QIcon]] = OrderedDict()
+        self._images: Dict[str, QImage] = {}
+        self._pending: Set[str] = set()
+        # A pool of its own, so queued requests can be dropped without touching other work.
+        self._pool = QThreadPool(self)
+        self._signal_done.connect(self._receive_done)
+
+    def has_icon(self, path: str) -> bool:
+        """
+        Whether a request for `path` has completed, with or without a thumbnail.
+        """
+        return path in self._icons
+
+    def icon(self, path: str) -> Optional[QIcon]:
+        icon = self._icons.get(path)
+        if icon is not None:
+            self._icons.move_to_end(path)
+        return icon
+
+    def image(self, path: str) -> Optional[QImage]:
+        """
+        The thumbnail image of a path held in memory.
+        """
+        return self._images.get(path)
+
+    def request(self, path: str) -> None:
+        if path in self._pending or path in self._icons:
+            return
+        self._pending.add(path)
+        self._pool.start(lambda: self._make(path))
+
+    def cancel_pending(self) -> None:
+        self._pool.clear()
+        self._pending.clear()
+
+    def _make(self, path: str) -> None:
+        # Runs on a pool thread.
+        file = Path(path)
+        image = self.cache.get(file, self.size)
+        if image is None:
+            image = make_thumbnail(file, self.size)
+            if image is not None:
+                self.cache.put(file, image, self.size)
+        try:
+            self._signal_done.emit(path, image)
+        except RuntimeError:
+            # The loader was deleted while making the thumbnail.
+            pass
+
+    def _receive_done(self, path: str, image: Optional[QImage]) -> None:
+        self._pending.discard(path)
+        # Pixmaps can only be made on the GUI thread.
+        self._icons[path] = QIcon(QPixmap.fromImage(image)) if image is not None else None
+        if image is not None:
+            self._images[path] = image
+        while len(self._icons) > self.memory_items:
+            evicted, _ = self._icons.popitem(last=False)
+            self._images.pop(evicted, None)
+        self.signal_thumbnail.emit(path)
@@ -1,5 +1,30 @@
-from .component import ImageViewComponent
-from .graphicsview import ImageViewer
-from .image import Image, ImageItem
-from .lib import numpy_to_pixmap
-from .scene import ImageViewerScene, SceneLayer
+from typing import TYPE_CHECKING
+
+from .._lazy import attach
+
+__getattr__, __dir__, __all__ = attach(
+    __name__,
+    attributes={
+        "ImageViewComponent": ".component",
+        "FrameConsumer": ".frames",
+        "FrameRing": ".frames",
+        "ImageViewer": ".graphicsview",
+        "Image": ".image",
+        "ImageItem": ".image",
+        "image_to_numpy": ".lib",
+        "numpy_to_image": ".lib",
+        "numpy_to_pixmap": ".lib",
+        "PerformanceOverlay": ".overlay",
+        "ImageViewerScene": ".scene",
+        "SceneLayer": ".scene",
+    },
+)
+
+if TYPE_CHECKING:
+    from .component import ImageViewComponent
+    from .frames import FrameConsumer, FrameRing
+    from .graphicsview import ImageViewer
+    from .image import Image, ImageItem
+    from .lib import image_to_numpy, numpy_to_image, numpy_to_pixmap
+    from .overlay import PerformanceOverlay
+    from .scene import ImageViewerScene, SceneLayer
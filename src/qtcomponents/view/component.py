@@ -4,8 +4,11 @@ from typing import Optional
 from PySide6.QtCore import QPointF
 from PySide6.QtWidgets import QWidget
 
+from ..profiling import profiler
+from .frames import DEFAULT_POLL_INTERVAL_MS, FrameConsumer, FrameRing
 from .graphicsview import ImageViewer
 from .image import Image, ImageItem
+from .overlay import PerformanceOverlay
 from .scene import ImageViewerScene, SceneLayer
 
 
@@ -20,6 +23,7 @@ class ImageViewComponent:
         self.viewer = ImageViewer(parent=parent)
         self.scene = ImageViewerScene(parent=parent)
         self.viewer.setScene(self.scene)
+        self._overlay: Optional[PerformanceOverlay] = None
 
     @property
     def widget(self) -> QWidget:
@@ -35,6 +39,34 @@ class ImageViewComponent:
         w, h = pixmap.boundingRect().bottomRight().toTuple()  # type: ignore
         self.scene.setSceneRect(0, 0, w, h)
 
+    def show_frames(self, ring: FrameRing, interval: int = DEFAULT_POLL_INTERVAL_MS) -> FrameConsumer:
+        """
+        Display frames written to a shared memory FrameRing by another process, eg: a camera.
+        Returns the started FrameConsumer, stop it before closing the ring.
+        """
+        item = ImageItem()
+        self.scene.add_item(item, layer=SceneLayer.Image)
+        height, width = ring.shape[:2]
+        self.scene.setSceneRect(0, 0, width, height)
+        consumer = FrameConsumer(ring, item, interval, parent=self.viewer)
+        consumer.start()
+        return consumer
+
+    def show_performance_overlay(self, visible: bool = True) -> None:
+        """
+        Show the frame rate and conversion latency over the image, enabling the profiler.
+        Hiding the overlay leaves the profiler enabled.
+        """
+        if visible:
+            profiler.enable()
+            if self._overlay is None:
+                self._overlay = PerformanceOverlay(self.viewer)
+                self.scene.add_item(self._overlay, layer=SceneLayer.OnTop)
+        elif self._overlay is not None:
+            self._overlay.stop()
+            self.scene.removeItem(self._overlay)
+            self._overlay = None
+
     def reset_view(self) -> None:
         """
         Rescales view to fit the widget.
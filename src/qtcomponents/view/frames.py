@@ -0,0 +1,304 @@
+import multiprocessing
+import os
+import sys
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
+
+from . import lib
+from .image import ImageItem
+
+DEFAULT_FRAME_SLOTS = 4  # Frame buffers, one is displayed while the producer writes the others.
+DEFAULT_POLL_INTERVAL_MS = 8  # Time between checks for a new frame, twice a 60 Hz display rate.
+ALIGNMENT = 64  # Bytes, slots start on cache line boundaries.
+MAGIC = b"QTCFRAME"
+
+# Slot states. The producer only writes FREE slots and marks them READY, the consumer marks them FREE again,
+# so each state change has a single writer and no lock is needed.
+FREE = 0
+READY = 1
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("slots", "<u4"),
+        ("ndim", "<u4"),
+        ("shape", "<u4", (3,)),
+        ("dtype", "S8"),
+        ("format", "<i4"),  # QImage.Format of the frames, 0 to pick one from the shape as `numpy_to_image` does.
+        ("latest", "<u8"),  # Sequence of the newest frame, 0 before the first.
+        ("overruns", "<u8"),  # Frames the producer discarded because no slot was free.
+    ]
+)
+SLOT_DTYPE = np.dtype([("sequence", "<u8"), ("state", "<u4"), ("padding", "<u4")])
+
+_created: Set[str] = set()  # Names of the rings this process created and hasn't closed.
+
+
+def _aligned(size: int) -> int:
+    return (size + ALIGNMENT - 1) // ALIGNMENT * ALIGNMENT
+
+
+class FrameRing:
+    """
+    Preallocated frame buffers in shared memory, for handing frames from an acquisition process
+    to the GUI without pickling or copying.
+
+    One process produces frames and one consumes them. The producer fills a free slot in place and marks it ready,
+    the consumer takes the newest ready frame and frees the slot once it is no longer displayed,
+    skipped frames are freed unseen. If the consumer falls behind and no slot is free, new frames are discarded
+    and counted in `overruns`.
+
+    The process that creates the ring owns the shared memory and unlinks it on `close`, processes that attach
+    only detach, so the creator should close it last.
+
+    Frames are displayed without a copy when their `image_format` is one Qt paints directly,
+    eg: BGRA frames as `QImage.Format.Format_ARGB32_Premultiplied`, other formats are converted once on display.
+
+    Example
+    ----------
+    ring = FrameRing.create((2160, 3840, 4), image_format=QImage.Format.Format_ARGB32_Premultiplied)
+    consumer = component.show_frames(ring)
+    Process(target=acquire, args=(ring.name,)).start()
+
+    def acquire(name):
+        ring = FrameRing.attach(name)
+        while True:
+            with ring.write_slot() as slot:
+                camera.read_into(slot)  # Or `ring.write(frame)`.
+    """
+
+    def __init__(self, memory: shared_memory.SharedMemory, owner: bool = False) -> None:
+        self._memory = memory
+        self.owner = owner
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+        if header["magic"].item() != MAGIC:
+            raise ValueError(f"Shared memory {memory.name} is not a frame ring.")
+        self.slots = int(header["slots"])
+        self.shape: Tuple[int, ...] = tuple(int(size) for size in header["shape"][: int(header["ndim"])])
+        self.dtype = np.dtype(header["dtype"].item().decode())
+        self.image_format = int(header["format"])
+
+        self._header = header
+        offset = _aligned(HEADER_DTYPE.itemsize)
+        self._slots = np.ndarray((self.slots,), dtype=SLOT_DTYPE, buffer=memory.buf, offset=offset)
+        offset += _aligned(self._slots.nbytes)
+        frame_bytes = _aligned(int(np.prod(self.shape)) * self.dtype.itemsize)
+        self._frames = [
+            np.ndarray(self.shape, dtype=self.dtype, buffer=memory.buf, offset=offset + slot * frame_bytes)
+            for slot in range(self.slots)
+        ]
+
+        # Producer side.
+        self._next_slot = 0
+        self._scratch: Optional[np.ndarray] = None
+        # Consumer side, slots taken and not yet released.
+        self._taken: List[int] = []
+
+    @staticmethod
+    def size(shape: Sequence[int], dtype=np.uint8, slots: int = DEFAULT_FRAME_SLOTS) -> int:
+        """
+        Bytes of shared memory needed for a ring.
+        """
+        frame_bytes = _aligned(int(np.prod(shape)) * np.dtype(dtype).itemsize)
+        return _aligned(HEADER_DTYPE.itemsize) + _aligned(SLOT_DTYPE.itemsize * slots) + slots * frame_bytes
+
+    @classmethod
+    def create(
+        cls,
+        shape: Sequence[int],
+        dtype=np.uint8,
+        slots: int = DEFAULT_FRAME_SLOTS,
+        image_format: Optional[QImage.Format] = None,
+        name: Optional[str] = None,
+    ) -> "FrameRing":
+        """
+        Allocate a ring for frames of `shape`, eg: (height, width) grayscale or (height, width, 4) colour.
+        The creator unlinks the shared memory on `close`.
+        """
+        if not 2 <= len(shape) <= 3:
+            raise ValueError(f"Frames must be (height, width) or (height, width, channels), not {tuple(shape)}.")
+        if slots < 3:
+            raise ValueError("A frame ring needs at least 3 slots, one displayed, one ready and one being written.")
+        memory = shared_memory.SharedMemory(name, create=True, size=cls.size(shape, dtype, slots))
+        header = np.ndarray((), dtype=HEADER_DTYPE, buffer=memory.buf)
+        header["slots"] = slots
+        header["ndim"] = len(shape)
+        header["shape"][: len(shape)] = shape
+        header["dtype"] = np.dtype(dtype).str.encode()
+        header["format"] = 0 if image_format is None else image_format.value
+        header["magic"] = MAGIC
+        del header
+        _created.add(memory.name)
+        return cls(memory, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameRing":
+        """
+        Attach to a ring created by another process, which keeps ownership, `close` only detaches.
+        """
+        if sys.version_info >= (3, 13):
+            memory = shared_memory.SharedMemory(name, track=False)
+        else:
+            memory = shared_memory.SharedMemory(name)
+            # Attaching registered the memory with this process's resource tracker, which would unlink it
+            # from under the creator when this process exits. Processes started by multiprocessing share
+            # their parent's tracker, as does the creator itself, there the creator's registration is kept.
+            shared_tracker = memory.name in _created or multiprocessing.parent_process() is not None
+            if os.name == "posix" and not shared_tracker:
+                resource_tracker.unregister(memory._name, "shared_memory")  # type: ignore[attr-defined]
+        return cls(memory)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def latest(self) -> int:
+        """
+        Sequence number of the newest frame written, frames are numbered from 1.
+        """
+        return int(self._header["latest"])
+
+    def overruns(self) -> int:
+        return int(self._header["overruns"])
+
+    @contextmanager
+    def write_slot(self) -> Iterator[np.ndarray]:
+        """
+        A free slot to write the next frame into, published when the block exits, so a producer can fill it in place.
+        If no slot is free the frame is written to a scratch buffer and discarded.
+        """
+        states = self._slots["state"]
+        order = np.roll(np.arange(self.slots), -self._next_slot)
+        free = order[states[order] == FREE]
+        if len(free) == 0:
+            if self._scratch is None:
+                self._scratch = np.empty(self.shape, dtype=self.dtype)
+            yield self._scratch
+            self._header["overruns"] += 1
+            return
+
+        slot = int(free[0])
+        yield self._frames[slot]
+        sequence = self.latest() + 1
+        self._slots["sequence"][slot] = sequence
+        # Published last, after the frame and its sequence are written.
+        states[slot] = READY
+        self._header["latest"] = sequence
+        self._next_slot = (slot + 1) % self.slots
+
+    def write(self, frame: np.ndarray) -> int:
+        """
+        Copy a frame into a free slot, returning its sequence number, or 0 if it was discarded.
+        """
+        overruns = self.overruns()
+        with self.write_slot() as slot:
+            np.copyto(slot, frame, casting="no")
+        return 0 if self.overruns() != overruns else self.latest()
+
+    def take(self) -> Optional[Tuple[int, np.ndarray]]:
+        """
+        The newest ready frame as (sequence, frame), without copying, or None if there is no new frame.
+        Older ready frames are released unseen. The frame stays valid until `release(sequence)`.
+        """
+        ready = [int(slot) for slot in np.flatnonzero(self._slots["state"] == READY) if slot not in self._taken]
+        if not ready:
+            return None
+        sequences = self._slots["sequence"]
+        newest = max(ready, key=lambda slot: sequences[slot])
+        for slot in ready:
+            if slot != newest:
+                self._slots["state"][slot] = FREE
+        self._taken.append(newest)
+        return int(sequences[newest]), self._frames[newest]
+
+    def release(self, sequence: int) -> None:
+        """
+        Return a taken frame's slot to the producer.
+        """
+        for slot in self._taken:
+            if int(self._slots["sequence"][slot]) == sequence:
+                self._taken.remove(slot)
+                self._slots["state"][slot] = FREE
+                return
+
+    def close(self) -> None:
+        """
+        Detach, and unlink the shared memory if this ring created it.
+        Frames returned by `take`, and images sharing them, must be released first.
+        """
+        if self._memory.buf is None:
+            return
+        del self._header, self._slots, self._frames
+        self._memory.close()
+        if self.owner:
+            self._memory.unlink()
+            _created.discard(self.name)
+
+
+class FrameConsumer(QObject):
+    """
+    Displays the newest frame of a FrameRing in an ImageItem.
+
+    The ring is polled on the GUI thread and only the newest frame is displayed, so frames the display
+    can't keep up with are skipped rather than queued, counted in `dropped`.
+    The item's pixmap is built straight from the shared memory, the frame's slot is held until the next frame
+    replaces it. Frames must be uint8, as for `numpy_to_pixmap`.
+
+    `stop` copies the displayed frame out of the ring, so the ring can then be closed.
+    """
+
+    signal_frame = Signal(int)
+
+    def __init__(self, ring: FrameRing, item: ImageItem, interval: int = DEFAULT_POLL_INTERVAL_MS, parent=None) -> None:
+        super().__init__(parent)
+        self.ring = ring
+        self.item = item
+        self.displayed = 0
+        self.dropped = 0
+        self._shown = 0
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.poll)
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        if self._shown:
+            self.item.update_image(self.item.pixmap().copy())
+            self.ring.release(self._shown)
+            self._shown = 0
+
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    def poll(self) -> bool:
+        """
+        Display the newest frame if there is one, returning whether there was.
+        """
+        taken = self.ring.take()
+        if taken is None:
+            return False
+        sequence, frame = taken
+        if self.ring.image_format:
+            height, width = frame.shape[:2]
+            image = QImage(frame.data, width, height, frame.strides[0], QImage.Format(self.ring.image_format))
+        else:
+            image = lib.numpy_to_image(frame)
+        self.item.update_image(QPixmap.fromImage(image, Qt.ImageConversionFlag.ColorOnly))
+
+        if self._shown:
+            self.ring.release(self._shown)
+            self.dropped += sequence - self._shown - 1
+        self._shown = sequence
+        self.displayed += 1
+        self.signal_frame.emit(sequence)
+        return True
@@ -7,6 +7,7 @@ from PySide6.QtCore import QRectF
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import QGraphicsPixmapItem
 
+from ..profiling import profiler
 from .lib import numpy_to_pixmap
 
 Image = ndarray
@@ -37,6 +38,7 @@ class ImageItem(QGraphicsPixmapItem):
 
         self.update_image(self._image)
 
+    @profiler.timed("ImageItem.update_image")
     def update_image(self, image: Image | QPixmap) -> QRectF:
         """
         Update the image used for display.
@@ -5,16 +5,16 @@ from PySide6.QtCore import QPoint, Qt
 from PySide6.QtGui import QImage, QPixmap, QTransform
 from PySide6.QtWidgets import QGraphicsItem, QGraphicsScene, QWidget
 
+from ..profiling import profiler
 
-def numpy_to_pixmap(array: np.ndarray) -> QPixmap:
+
+def numpy_to_image(array: np.ndarray) -> QImage:
     """
-    Converts a NumPy array to a QPixmap.
+    Converts a NumPy array to a QImage, sharing the array's memory, so the array must outlive the image
+    (or copy it). Unlike QPixmap, QImage can be used off the GUI thread.
     The array should be in the format (height, width, channels).
     For grayscale, it should be (height, width).
 
-    QImage unfortunately only accepts int types, values between 0-255 as RGB.
-    If you encounter a scrambled image on load, check it's values.
-
     Parameters
     ----------
     array: ndarray
@@ -22,8 +22,7 @@ def numpy_to_pixmap(array: np.ndarray) -> QPixmap:
 
     Returns
     ----------
-    image: QPixmap
-        Image as a QPixmap to display within a qt application.
+    image: QImage
     """
     if not np.issubdtype(array.dtype, np.integer):
         raise TypeError(f"Unsupported array dtype: {array.dtype}")
@@ -46,8 +45,53 @@ def numpy_to_pixmap(array: np.ndarray) -> QPixmap:
 
     else:
         raise TypeError(f"Unsupported array shape: {array.shape}")
+    return image
 
-    pixmap = QPixmap.fromImage(image, Qt.ImageConversionFlag.ColorOnly)
+
+def image_to_numpy(image: QImage) -> np.ndarray:
+    """
+    Converts a QImage to a NumPy array, the inverse of `numpy_to_image`.
+    Grayscale images are (height, width), others are converted to RGBA (height, width, 4).
+
+    Returns
+    ----------
+    array: ndarray
+        uint8 array, a copy of the image's pixels.
+    """
+    if image.isGrayscale():
+        image = image.convertToFormat(QImage.Format.Format_Grayscale8)
+        channels = 1
+    else:
+        image = image.convertToFormat(QImage.Format.Format_RGBA8888)
+        channels = 4
+    height, width = image.height(), image.width()
+    # Rows may be padded, so slice each row to its pixels.
+    rows = np.frombuffer(image.constBits(), dtype=np.uint8, count=image.sizeInBytes()).reshape(height, -1)
+    array = rows[:, : width * channels].reshape(height, width, channels) if channels > 1 else rows[:, :width]
+    return array.copy()
+
+
+@profiler.timed("numpy_to_pixmap")
+def numpy_to_pixmap(array: np.ndarray) -> QPixmap:
+    """
+    Converts a NumPy array to a QPixmap.
+    The array should be in the format (height, width, channels).
+    For grayscale, it should be (height, width).
+
+    QImage unfortunately only accepts int types, values between 0-255 as RGB.
+    If you encounter a scrambled image on load, check it's values.
+
+    Parameters
+    ----------
+    array: ndarray
+        Must be a uint array.
+
+    Returns
+    ----------
+    image: QPixmap
+        Image as a QPixmap to display within a qt application.
+    """
+    pixmap = QPixmap.fromImage(numpy_to_image(array), Qt.ImageConversionFlag.ColorOnly)
     return pixmap
 
 
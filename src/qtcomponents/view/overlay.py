@@ -0,0 +1,94 @@
+import time
+from typing import Dict, Optional, Sequence
+
+from PySide6.QtCore import QPoint, QRectF, Qt, QTimer
+from PySide6.QtGui import QBrush, QColor, QFont, QPainter
+from PySide6.QtWidgets import QGraphicsItem, QGraphicsSimpleTextItem, QGraphicsView
+
+from ..profiling import Profiler, profiler
+
+DEFAULT_OVERLAY_PATHS = ["ImageItem.update_image", "numpy_to_pixmap"]
+DEFAULT_OVERLAY_INTERVAL_MS = 500  # Time between overlay refreshes.
+OVERLAY_MARGIN = 8  # Pixels from the top left of the view.
+
+
+class PerformanceOverlay(QGraphicsSimpleTextItem):
+    """
+    Rate and latency of profiled hot paths, drawn in the top left corner of a view over everything else.
+    The rate of `ImageItem.update_image` is the displayed frame rate.
+    Readings are only taken while the profiler is enabled, see `qtcomponents.profiling`.
+
+    Example
+    ----------
+    profiler.enable()
+    overlay = PerformanceOverlay(component.viewer)
+    component.scene.add_item(overlay, SceneLayer.OnTop)
+
+    # Or
+    component.show_performance_overlay()
+    """
+
+    def __init__(
+        self,
+        view: QGraphicsView,
+        paths: Sequence[str] = DEFAULT_OVERLAY_PATHS,
+        interval: int = DEFAULT_OVERLAY_INTERVAL_MS,
+        source: Optional[Profiler] = None,
+    ) -> None:
+        super().__init__()
+        self.view = view
+        self.paths = list(paths)
+        self.profiler = source if source is not None else profiler
+        # Fixed size on screen whatever the zoom.
+        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIgnoresTransformations)
+        self.setAcceptedMouseButtons(Qt.MouseButton.NoButton)
+        self.setBrush(QBrush(QColor("white")))
+        self.setFont(QFont("monospace", 9))
+
+        self._counts: Dict[str, int] = {}
+        self._time = time.perf_counter()
+        self._timer = QTimer(view)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start(interval)
+        view.horizontalScrollBar().valueChanged.connect(self.place)
+        view.verticalScrollBar().valueChanged.connect(self.place)
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Update the text from the profiler.
+        """
+        now = time.perf_counter()
+        elapsed = max(now - self._time, 1e-9)
+        self._time = now
+        lines = [] if self.profiler.is_enabled() else ["profiling disabled"]
+        for name in self.paths:
+            histogram = self.profiler.histogram(name)
+            if histogram is None:
+                continue
+            rate = (histogram.count - self._counts.get(name, 0)) / elapsed
+            self._counts[name] = histogram.count
+            if histogram.count:
+                lines.append(
+                    f"{name}: {rate:5.1f}/s  p50 {histogram.percentile(50) / 1e6:.2f} ms"
+                    f"  p99 {histogram.percentile(99) / 1e6:.2f} ms"
+                )
+        self.setText("\n".join(lines))
+        self.place()
+
+    def place(self) -> None:
+        """
+        Move to the top left corner of the view, after it pans or zooms.
+        """
+        self.setPos(self.view.mapToScene(QPoint(OVERLAY_MARGIN, OVERLAY_MARGIN)))
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def paint(self, painter: QPainter, option, widget=None) -> None:
+        # Translucent background, so the text reads over any image.
+        painter.fillRect(self.boundingRect(), QColor(0, 0, 0, 160))
+        super().paint(painter, option, widget)
+
+    def boundingRect(self) -> QRectF:
+        return super().boundingRect().adjusted(-4, -2, 4, 2)
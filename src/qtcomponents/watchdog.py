@@ -0,0 +1,178 @@
+import json
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from pathlib import Path
+from types import FrameType
+from typing import Deque, Dict, List, Optional
+
+from PySide6.QtCore import QObject, QTimer, Signal
+
+from .profiling import Histogram
+
+DEFAULT_STALL_THRESHOLD_MS = 200  # Event loop latency reported as a stall.
+DEFAULT_HEARTBEAT_INTERVAL_MS = 50  # Time between heartbeats on the GUI thread.
+DEFAULT_STALL_HISTORY = 100  # Stalls kept for `history` and `export`, the oldest are dropped first.
+LOGGED_STACK_FRAMES = 8  # Innermost frames of a stall's stack included in its log message.
+
+PACKAGE = __name__.partition(".")[0]
+
+
+class Stall:
+    """
+    A period the GUI thread did not return to the event loop.
+    `stack` is the GUI thread's Python stack once the stall passed the threshold, innermost frame last,
+    `component` the innermost qtcomponents function on it, None if the stall was outside qtcomponents.
+    """
+
+    def __init__(
+        self, start: float, duration: float, stack: Optional[List[str]] = None, component: Optional[str] = None
+    ) -> None:
+        self.start = start
+        self.duration = duration
+        self.stack = stack if stack is not None else []
+        self.component = component
+
+    def __repr__(self) -> str:
+        return f"Stall({self.duration * 1000:.0f} ms, {self.component or 'outside qtcomponents'})"
+
+    def to_dict(self) -> Dict:
+        return {
+            "start": self.start,
+            "duration_ms": self.duration * 1000,
+            "component": self.component,
+            "stack": self.stack,
+        }
+
+
+def attribute_frame(frame: Optional[FrameType]) -> Optional[str]:
+    """
+    Qualified name of the innermost qtcomponents function on a stack, eg: `qtcomponents.view.lib.numpy_to_pixmap`.
+    """
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module.partition(".")[0] == PACKAGE and module != __name__:
+            code = frame.f_code
+            return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+    return None
+
+
+class StallWatchdog(QObject):
+    """
+    Detects GUI freezes and reports what was running.
+
+    A timer on the GUI thread beats every `interval` milliseconds, its lateness is the event loop latency.
+    A monitor thread watches the beats, once one is `threshold` milliseconds late it captures the GUI thread's
+    Python stack. When the event loop recovers the stall is logged, attributed to the qtcomponents call in progress,
+    kept in a bounded history and emitted with `signal_stall`.
+
+    Stalls are logged to the `qtcomponents.watchdog` logger, eg: to show them in a LoggingComponent
+    `logging.getLogger("qtcomponents.watchdog").addHandler(component.handler)`.
+
+    Must be created and started on the GUI thread.
+    """
+
+    signal_stall = Signal(object)
+
+    def __init__(
+        self,
+        threshold: int = DEFAULT_STALL_THRESHOLD_MS,
+        interval: int = DEFAULT_HEARTBEAT_INTERVAL_MS,
+        history: int = DEFAULT_STALL_HISTORY,
+        logger: Optional[logging.Logger] = None,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.threshold = threshold / 1000
+        self.interval = interval / 1000
+        self.logger = logger if logger is not None else logging.getLogger(__name__)
+        self.latency = Histogram()
+        self._stalls: Deque[Stall] = deque(maxlen=history)
+
+        self._lock = threading.Lock()
+        self._beat = time.monotonic()
+        self._captured: Optional[Stall] = None
+        self._gui_thread = threading.get_ident()
+        self._stop = threading.Event()
+        self._monitor: Optional[threading.Thread] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self._heartbeat)
+
+    def start(self) -> None:
+        if self.is_running():
+            return
+        self._gui_thread = threading.get_ident()
+        self._beat = time.monotonic()
+        self._stop.clear()
+        self._timer.start()
+        self._monitor = threading.Thread(target=self._watch, name="StallWatchdog", daemon=True)
+        self._monitor.start()
+
+    def stop(self) -> None:
+        self._timer.stop()
+        self._stop.set()
+        if self._monitor is not None:
+            self._monitor.join()
+            self._monitor = None
+
+    def is_running(self) -> bool:
+        return self._monitor is not None
+
+    def history(self) -> List[Stall]:
+        return list(self._stalls)
+
+    def clear(self) -> None:
+        self._stalls.clear()
+        self.latency.reset()
+
+    def export(self, path: Path | str) -> None:
+        """
+        Write the stall history and latency summary as JSON.
+        """
+        data = {"latency": self.latency.summary(), "stalls": [stall.to_dict() for stall in self._stalls]}
+        Path(path).write_text(json.dumps(data, indent=2))
+
+    def _heartbeat(self) -> None:
+        now = time.monotonic()
+        with self._lock:
+            late = max(0.0, now - self._beat - self.interval)
+            self._beat = now
+            captured, self._captured = self._captured, None
+        self.latency.record(int(late * 1e9))
+        if late < self.threshold and captured is None:
+            return
+
+        stall = captured if captured is not None else Stall(time.time() - late, late)
+        stall.duration = late
+        self._stalls.append(stall)
+        self._log(stall)
+        self.signal_stall.emit(stall)
+
+    def _watch(self) -> None:
+        # Runs on the monitor thread, polling often enough to catch a stall soon after it passes the threshold.
+        period = min(self.interval, self.threshold / 4)
+        while not self._stop.wait(period):
+            with self._lock:
+                late = time.monotonic() - self._beat - self.interval
+                if late < self.threshold or self._captured is not None:
+                    continue
+                frame = sys._current_frames().get(self._gui_thread)
+                self._captured = Stall(
+                    time.time() - late,
+                    late,
+                    traceback.format_list(traceback.extract_stack(frame)) if frame is not None else None,
+                    attribute_frame(frame),
+                )
+                del frame
+
+    def _log(self, stall: Stall) -> None:
+        message = f"GUI stalled for {stall.duration * 1000:.0f} ms in {stall.component or 'code outside qtcomponents'}"
+        if stall.stack:
+            message += "\n" + "".join(stall.stack[-LOGGED_STACK_FRAMES:]).rstrip()
+        self.logger.warning(message)
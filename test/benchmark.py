@@ -0,0 +1,434 @@
+"""
+Headless benchmarks of the components, run under the offscreen Qt platform.
+
+    python test/benchmark.py [--only pixmap,table] [--quick] [--json results.json]
+    python test/benchmark.py --save-baseline baseline.json
+    python test/benchmark.py --baseline baseline.json [--tolerance 0.25]
+
+Each benchmark reports metrics, `*_ms` are lower is better, `*_per_s` higher is better.
+With `--baseline` each metric is compared with the saved run, and the exit code is non-zero
+if any is worse by more than `--tolerance`. Baselines are only comparable on the same machine.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import numpy as np  # noqa: E402
+import PySide6  # noqa: E402
+from PySide6.QtCore import QEventLoop, QSocketNotifier  # noqa: E402
+from PySide6.QtWidgets import QApplication  # noqa: E402
+
+DEFAULT_TOLERANCE = 0.25  # Fractional change of a metric reported as a regression.
+TIMEOUT_S = 60.0  # Longest wait for an event loop benchmark to finish.
+MIN_RUN_S = 0.05  # Shortest run of repeated calls, see `time_calls`.
+DEFAULT_REPEAT = 3  # Runs of each benchmark, the best value of each metric is kept.
+
+Metrics = Dict[str, float]
+
+
+def time_calls(function: Callable[[], object], number: Optional[int] = None, repeat: int = 5) -> float:
+    """
+    Best milliseconds per call of `function`, over `repeat` runs of `number` calls.
+    By default `number` is doubled until a run takes at least `MIN_RUN_S`, so short calls are timed reliably.
+    """
+    function()  # Warm up caches.
+    if number is None:
+        number = 1
+        while True:
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            if time.perf_counter() - start >= MIN_RUN_S:
+                break
+            number *= 2
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        runs.append((time.perf_counter() - start) / number)
+    return min(runs) * 1000
+
+
+def run_until(done: Callable[[], bool], timeout: float = TIMEOUT_S) -> float:
+    """
+    Run the event loop until `done` returns True, returning the seconds taken.
+    """
+    start = time.perf_counter()
+    loop = QEventLoop()
+    while not done():
+        if time.perf_counter() - start > timeout:
+            raise TimeoutError("Benchmark did not finish.")
+        loop.processEvents(QEventLoop.ProcessEventsFlag.AllEvents, 10)
+    return time.perf_counter() - start
+
+
+def bench_pixmap(scale: float) -> Metrics:
+    from qtcomponents.view.lib import numpy_to_pixmap
+
+    rng = np.random.default_rng(0)
+    metrics = {}
+    for size in (256, 1024, 4096):
+        for name, channels in (("gray", None), ("rgb", 3), ("rgba", 4)):
+            shape = (size, size) if channels is None else (size, size, channels)
+            array = rng.integers(0, 255, shape, dtype=np.uint8)
+            metrics[f"u8_{name}_{size}_ms"] = time_calls(lambda: numpy_to_pixmap(array))
+        # Wider dtypes have to be scaled to uint8 by the caller, that is part of the cost.
+        wide = rng.integers(0, 2**16, (size, size), dtype=np.uint16)
+        metrics[f"u16_gray_{size}_ms"] = time_calls(lambda: numpy_to_pixmap((wide >> 8).astype(np.uint8)))
+        real = rng.random((size, size), dtype=np.float32)
+        metrics[f"f32_gray_{size}_ms"] = time_calls(lambda: numpy_to_pixmap((real * 255).astype(np.uint8)))
+    return metrics
+
+
+def _image_component(size: int):
+    from qtcomponents.view import ImageViewComponent
+
+    component = ImageViewComponent()
+    component.set_image(np.zeros((size, size), dtype=np.uint8))
+    component.viewer.resize(800, 600)
+    component.viewer.show()
+    component.reset_view()
+    QApplication.processEvents()
+    return component
+
+
+def bench_image_update(scale: float) -> Metrics:
+    size = 1024
+    component = _image_component(size)
+    item = component.scene.items()[0]
+    frames = [np.roll(np.arange(size, dtype=np.uint8)[None, :].repeat(size, 0), shift, 1) for shift in range(16)]
+    count = max(16, int(200 * scale))
+    viewport = component.viewer.viewport()
+
+    start = time.perf_counter()
+    for index in range(count):
+        item.update_image(frames[index % len(frames)])
+        viewport.repaint()
+    elapsed = time.perf_counter() - start
+    component.viewer.close()
+    return {"frame_ms": elapsed / count * 1000, "frames_per_s": count / elapsed}
+
+
+def bench_viewer(scale: float) -> Metrics:
+    component = _image_component(4096)
+    viewer = component.viewer
+    viewport = viewer.viewport()
+    number = max(5, int(50 * scale))
+
+    def zoom() -> None:
+        viewer.zoom(1)
+        viewport.repaint()
+        viewer.zoom(-1)
+        viewport.repaint()
+
+    for _ in range(10):
+        viewer.zoom(1)
+    scrollbar = viewer.horizontalScrollBar()
+    steps = iter(range(10**9))
+
+    def pan() -> None:
+        scrollbar.setValue(scrollbar.minimum() + next(steps) * 37 % max(1, scrollbar.maximum() - scrollbar.minimum()))
+        viewport.repaint()
+
+    metrics = {"zoom_repaint_ms": time_calls(zoom, number) / 2, "pan_repaint_ms": time_calls(pan, number)}
+    viewer.close()
+    return metrics
+
+
+def bench_frames(scale: float) -> Metrics:
+    """
+    Display of 4K frames from a shared memory FrameRing, converted or in Qt's native format.
+    """
+    from PySide6.QtGui import QImage
+
+    from qtcomponents.view.frames import FrameRing
+
+    component = _image_component(16)
+    frame = np.full((2160, 3840, 4), 128, dtype=np.uint8)
+    metrics = {}
+    for name, image_format in (("rgba", None), ("native", QImage.Format.Format_ARGB32_Premultiplied)):
+        ring = FrameRing.create(frame.shape, image_format=image_format)
+        consumer = component.show_frames(ring)
+        consumer.stop()
+
+        timings = []
+        for _ in range(max(10, int(100 * scale))):
+            ring.write(frame)  # Stands in for the producer process, not timed.
+            start = time.perf_counter()
+            consumer.poll()
+            timings.append(time.perf_counter() - start)
+        metrics[f"{name}_display_4k_ms"] = float(np.median(timings)) * 1000
+        consumer.stop()
+        ring.close()
+    component.viewer.close()
+    return metrics
+
+
+def bench_matplotlib(scale: float) -> Metrics:
+    from qtcomponents.plot import MatplotlibWidget
+
+    widget = MatplotlibWidget(toolbar=False)
+    axes = widget.add_figure().add_subplot(111)
+    x = np.linspace(0, 10, 10_000)
+    (line,) = axes.plot(x, np.sin(x))
+    widget.resize(800, 600)
+    widget.show()
+    QApplication.processEvents()
+    phases = iter(range(10**9))
+    sizes = iter(range(10**9))
+    number = max(2, int(20 * scale))
+
+    def redraw() -> None:
+        line.set_ydata(np.sin(x + next(phases) * 0.1))
+        widget.canvas.draw()
+
+    def resize() -> None:
+        widget.resize(800 - next(sizes) % 2 * 100, 600)
+        QApplication.sendPostedEvents()
+
+    metrics = {"redraw_ms": time_calls(redraw, number), "resize_redraw_ms": time_calls(resize, number)}
+    widget.close()
+    return metrics
+
+
+def bench_table(scale: float) -> Metrics:
+    from qtcomponents.table import DataTable
+
+    rows = 1_000_000
+    array = np.zeros(rows, dtype=[("INDEX", "i8"), ("TIME", "f8"), ("VALUE", "f4"), ("NAME", "S8")])
+    array["INDEX"] = np.arange(rows)
+    array["TIME"] = np.arange(rows) * 1e-3
+    array["VALUE"] = np.random.default_rng(0).random(rows)
+    array["NAME"] = b"sample"
+
+    table = DataTable()
+    table.resize(800, 600)
+    table.show()
+    start = time.perf_counter()
+    table.set_data(array)
+    QApplication.processEvents()  # Lays out the view.
+    table.viewport().repaint()
+    set_data_ms = (time.perf_counter() - start) * 1000
+
+    scrollbar = table.verticalScrollBar()
+    viewport = table.viewport()
+    rng = np.random.default_rng(1)
+    number = max(10, int(100 * scale))
+
+    def page() -> None:
+        value = scrollbar.value() + scrollbar.pageStep()
+        scrollbar.setValue(value if value < scrollbar.maximum() else 0)
+        viewport.repaint()
+
+    def jump() -> None:
+        scrollbar.setValue(int(rng.integers(0, scrollbar.maximum())))
+        viewport.repaint()
+
+    metrics = {
+        "set_data_ms": set_data_ms,
+        "page_scroll_ms": time_calls(page, number),
+        "jump_ms": time_calls(jump, number),
+    }
+    table.close()
+    return metrics
+
+
+def bench_logging(scale: float) -> Metrics:
+    import logging
+
+    from qtcomponents.log import LoggingComponent
+
+    metrics = {}
+    for name, virtual, count in (("virtual", True, int(100_000 * scale)), ("text", False, int(20_000 * scale))):
+        count = max(1000, count)
+        component = LoggingComponent(None, logging.INFO, virtual=virtual, capacity=count)
+        logger = logging.getLogger(f"benchmark.{name}")
+        logger.propagate = False
+        logger.setLevel(logging.INFO)
+        logger.addHandler(component.handler)
+        component.widget.resize(800, 600)
+        component.widget.show()
+
+        start = time.perf_counter()
+        for index in range(count):
+            logger.info("record %d value %f", index, index * 0.5)
+        emitted = time.perf_counter() - start
+        while component.handler.pending_count():
+            component.handler.drain()
+        QApplication.processEvents()
+        total = time.perf_counter() - start
+
+        logger.removeHandler(component.handler)
+        component.handler.close()
+        component.widget.close()
+        metrics[f"{name}_emit_per_s"] = count / emitted
+        metrics[f"{name}_end_to_end_per_s"] = count / total
+    return metrics
+
+
+def bench_serial(scale: float) -> Optional[Metrics]:
+    """
+    Lines written to a pseudo terminal on a thread, read on the GUI thread into a ConsoleWidget.
+    """
+    try:
+        import pty  # noqa: F401
+        import tty
+    except ImportError:
+        return None
+    from qtcomponents.serial import ConsoleWidget
+
+    line = b"2024-01-01T00:00:00.000 sensor=42 value=3.14159 status=OK\n"
+    count = max(1000, int(200_000 * scale))
+    master, slave = os.openpty()
+    tty.setraw(slave)  # No echo or newline translation.
+    os.set_blocking(slave, False)
+
+    console = ConsoleWidget()
+    console.resize(800, 600)
+    console.show()
+    received = [0]
+
+    def read() -> None:
+        try:
+            data = os.read(slave, 1 << 16)
+        except BlockingIOError:
+            return
+        received[0] += len(data)
+        console.write(data.decode(errors="replace"))
+
+    notifier = QSocketNotifier(slave, QSocketNotifier.Type.Read)
+    notifier.activated.connect(read)
+
+    def write() -> None:
+        block = line * 256
+        for _ in range(count // 256):
+            os.write(master, block)
+
+    total = count // 256 * 256 * len(line)
+    writer = threading.Thread(target=write, daemon=True)
+    start = time.perf_counter()
+    writer.start()
+    run_until(lambda: received[0] >= total)
+    console.flush()
+    elapsed = time.perf_counter() - start
+
+    writer.join()
+    notifier.setEnabled(False)
+    os.close(master)
+    os.close(slave)
+    console.close()
+    return {"bytes_per_s": total / elapsed, "lines_per_s": total / len(line) / elapsed}
+
+
+BENCHMARKS: Dict[str, Callable[[float], Optional[Metrics]]] = {
+    "pixmap": bench_pixmap,
+    "image_update": bench_image_update,
+    "viewer": bench_viewer,
+    "frames": bench_frames,
+    "matplotlib": bench_matplotlib,
+    "table": bench_table,
+    "logging": bench_logging,
+    "serial": bench_serial,
+}
+
+
+def best(runs: List[Metrics]) -> Metrics:
+    """
+    Best value of each metric over several runs, the least affected by other load on the machine.
+    """
+    return {metric: (min if metric.endswith("_ms") else max)(run[metric] for run in runs) for metric in runs[0]}
+
+
+def compare(results: Dict[str, Metrics], baseline: Dict[str, Metrics], tolerance: float) -> List[str]:
+    """
+    Metrics worse than the baseline by more than `tolerance`, as printable lines.
+    """
+    regressions = []
+    for benchmark, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(benchmark, {}).get(metric)
+            if not base:
+                continue
+            change = value / base - 1
+            worse = change > tolerance if metric.endswith("_ms") else change < -tolerance / (1 + tolerance)
+            if worse:
+                regressions.append(f"{benchmark}.{metric}: {base:.4g} -> {value:.4g} ({change:+.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--only", default=None, help=f"Comma separated benchmarks, of {', '.join(BENCHMARKS)}.")
+    parser.add_argument("--quick", action="store_true", help="Fewer iterations, for a smoke test.")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="Runs of each benchmark.")
+    parser.add_argument("--json", type=Path, default=None, help="Write the results to a file.")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare with results saved earlier.")
+    parser.add_argument("--save-baseline", type=Path, default=None, help="Save the results as a baseline.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="Allowed fractional change.")
+    parser.add_argument("--profile", action="store_true", help="Include the profiler's hot path statistics.")
+    args = parser.parse_args()
+
+    names = args.only.split(",") if args.only else list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"Unknown benchmarks: {', '.join(unknown)}")
+
+    app = QApplication.instance() or QApplication([])  # noqa: F841
+    from qtcomponents.profiling import profiler
+
+    if args.profile:
+        profiler.enable()
+    scale = 0.1 if args.quick else 1.0
+    results: Dict[str, Metrics] = {}
+    for name in names:
+        runs = [BENCHMARKS[name](scale) for _ in range(args.repeat)]
+        if runs[0] is None:
+            print(f"{name}: skipped")
+            continue
+        results[name] = metrics = best(runs)
+        for metric, value in metrics.items():
+            print(f"{name + '.' + metric:<40} {value:12.4g}")
+
+    output = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "pyside": PySide6.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "qpa": os.environ["QT_QPA_PLATFORM"],
+            "quick": args.quick,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    if args.profile:
+        output["profile"] = profiler.stats()
+    for path in (args.json, args.save_baseline):
+        if path is not None:
+            path.write_text(json.dumps(output, indent=2))
+
+    if args.baseline is not None:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for line in regressions:
+            print(f"regression {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.tolerance:.0%} of {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Import time benchmark, each import is timed in a fresh interpreter.
+
+    python test/benchmark_import.py [--repeat 5] [--budget-ms 100]
+
+Exits non-zero if `import qtcomponents` imports a heavy dependency eagerly, or takes longer than `--budget-ms`.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+SRC = Path(__file__).parent.parent / "src"
+
+TARGETS = [
+    "qtcomponents",
+    "qtcomponents.file",
+    "qtcomponents.view",
+    "qtcomponents.serial",
+    "qtcomponents.log",
+    "qtcomponents.table",
+    "qtcomponents.plot.matplotlib",
+]
+
+# Must not be imported by a bare `import qtcomponents`.
+HEAVY_MODULES = ["matplotlib", "numpy", "PySide6.QtWidgets"]
+
+TIMING_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {target}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "modules": [name for name in {heavy!r} if name in sys.modules]}}))
+"""
+
+
+def time_import(target: str) -> Dict:
+    """
+    Seconds to import `target` in a fresh interpreter, and which heavy modules it imported.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join([str(SRC), env.get("PYTHONPATH", "")])
+    script = TIMING_SCRIPT.format(target=target, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    return json.loads(output.stdout.strip().splitlines()[-1])
+
+
+def run(repeat: int) -> Dict[str, Dict]:
+    results = {}
+    for target in TARGETS:
+        runs: List[Dict] = [time_import(target) for _ in range(repeat)]
+        results[target] = {
+            "median_ms": statistics.median(run["seconds"] for run in runs) * 1000,
+            "min_ms": min(run["seconds"] for run in runs) * 1000,
+            "heavy_modules": runs[0]["modules"],
+        }
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per target.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail if `import qtcomponents` is slower.")
+    parser.add_argument("--json", action="store_true", help="Print the results as JSON.")
+    args = parser.parse_args()
+
+    results = run(args.repeat)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for target, result in results.items():
+            heavy = ", ".join(result["heavy_modules"]) or "-"
+            print(f"{target:<32} {result['median_ms']:8.1f} ms  (min {result['min_ms']:.1f})  {heavy}")
+
+    failed = False
+    package = results["qtcomponents"]
+    if package["heavy_modules"]:
+        print(f"import qtcomponents eagerly imports {', '.join(package['heavy_modules'])}", file=sys.stderr)
+        failed = True
+    if args.budget_ms is not None and package["median_ms"] > args.budget_ms:
+        print(f"import qtcomponents took {package['median_ms']:.1f} ms, over {args.budget_ms} ms", file=sys.stderr)
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""
+Profiler toggling on live widgets, run offscreen:
+
+    QT_QPA_PLATFORM=offscreen python -m pytest test/test_profiling.py
+"""
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from qtcomponents.plot.matplotlib import MatplotlibWidget
+from qtcomponents.profiling import profiler
+from qtcomponents.view import ImageViewComponent
+
+app = QApplication.instance() or QApplication([])
+
+
+def test_disable_after_construct() -> None:
+    profiler.reset()
+    profiler.enable()
+    component = ImageViewComponent()
+    plot = MatplotlibWidget()
+    plot.add_figure().add_subplot().plot([0, 1], [1, 0])
+    component.widget.resize(320, 240)
+    plot.resize(320, 240)
+    component.widget.show()
+    plot.show()
+    component.set_image(np.zeros((64, 64, 3), dtype=np.uint8))
+    app.processEvents()
+    assert profiler.histogram("numpy_to_pixmap").count == 1
+    assert profiler.histogram("MatplotlibWidget.resizeEvent").count > 0
+
+    profiler.disable()
+    counts = {name: profiler.histogram(name).count for name in profiler.paths()}
+    component.set_image(np.ones((64, 64, 3), dtype=np.uint8))
+    component.widget.resize(400, 300)
+    plot.resize(400, 300)
+    component.widget.repaint()
+    plot.repaint()
+    app.processEvents()
+    assert {name: profiler.histogram(name).count for name in profiler.paths()} == counts
+
+    component.widget.close()
+    plot.close()
+
+
+def test_enable_after_construct() -> None:
+    profiler.disable()
+    profiler.reset()
+    component = ImageViewComponent()
+    plot = MatplotlibWidget()
+    plot.add_figure()
+    plot.show()
+    app.processEvents()
+
+    profiler.enable()
+    try:
+        component.set_image(np.zeros((64, 64), dtype=np.uint8))
+        plot.resize(300, 200)
+        app.processEvents()
+        assert profiler.histogram("ImageItem.update_image").count == 1
+        assert profiler.histogram("MatplotlibWidget.resizeEvent").count > 0
+    finally:
+        profiler.disable()
+        plot.close()
+
+
+if __name__ == "__main__":
+    test_disable_after_construct()
+    test_enable_after_construct()
+    print("ok")
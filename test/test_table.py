@@ -0,0 +1,52 @@
+"""
+StructuredArrayModel appends, run offscreen:
+
+    QT_QPA_PLATFORM=offscreen python -m pytest test/test_table.py
+"""
+
+import numpy as np
+from PySide6.QtWidgets import QApplication
+
+from qtcomponents.table import StructuredArrayModel
+
+app = QApplication.instance() or QApplication([])
+
+DTYPE = [("index", "<i4"), ("value", "<f8")]
+
+
+def rows(start: int, count: int) -> np.ndarray:
+    array = np.zeros(count, dtype=DTYPE)
+    array["index"] = np.arange(start, start + count)
+    return array
+
+
+def test_ring_append_more_than_max_rows() -> None:
+    model = StructuredArrayModel(rows(0, 5), max_rows=5)
+    events = []
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("removed", first, last, model.rowCount())))
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("inserted", first, last, model.rowCount())))
+
+    model.append_rows(rows(5, 7))
+
+    assert events == [("removed", 0, 4, 0), ("inserted", 0, 4, 5)]
+    assert model.rowCount() == 5
+    assert model.data(model.index(0, 0)) == "7"
+    assert model.data(model.index(4, 0)) == "11"
+
+
+def test_ring_append_drops_oldest() -> None:
+    model = StructuredArrayModel(rows(0, 5), max_rows=5)
+    events = []
+    model.rowsRemoved.connect(lambda parent, first, last: events.append(("removed", first, last, model.rowCount())))
+    model.rowsInserted.connect(lambda parent, first, last: events.append(("inserted", first, last, model.rowCount())))
+
+    model.append_rows(rows(5, 2))
+
+    assert events == [("removed", 0, 1, 3), ("inserted", 3, 4, 5)]
+    assert model.data(model.index(0, 0)) == "2"
+
+
+if __name__ == "__main__":
+    test_ring_append_more_than_max_rows()
+    test_ring_append_drops_oldest()
+    print("ok")